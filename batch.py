@@ -0,0 +1,157 @@
+import bisect
+import collections
+import concurrent.futures
+import mmap
+import os
+import sys
+
+# Parses many metafiles at once with a pool of worker processes. Workers get whole chunks of filenames at a time and send
+# back small per-file summaries (and optionally numpy columns, see table.py) instead of pickled record objects, so the cost of
+# moving results between processes stays small next to the cost of parsing. parse_file does the same for the records of one
+# big file, which are split into chunks after a Type/Size scan.
+#
+# emf and table are only imported inside the workers: that way preload() gets to install the cached parser module (see
+# loader.py) before anything imports output.
+
+DEFAULT_CHUNKSIZE = 64 # Filenames per task.
+DEFAULT_CHUNK_BYTES = 16 * 1024 * 1024 # Bytes of records per task when decoding one file in parallel.
+
+mapped_files = {} # Filename -> mmap, so a worker maps a file once no matter how many of its chunks it decodes.
+
+
+def preload(use_cache=False, specialize=False):
+    # Worker initializer. Imports the parsers once per worker instead of once per file.
+    if use_cache:
+        import loader
+        loader.install(specialize=specialize)
+    import emf
+
+
+def summarize_file(filename, record_types=()):
+    # Returns {"filename", "bytes", "records", "types": {Type: count}, "error"} for one metafile, and with record_types also
+    # "columns": {record type name: structured array} with the fixed parts of all records of those types. Every record is
+    # parsed (lazily, so only Type is decoded), so records which are too short for their class or have data left over show up
+    # in "error" as well as a broken Type/Size chain.
+    import emf
+    summary = {"filename": filename, "bytes": 0, "records": 0, "types": {}, "error": None}
+    try:
+        with emf.EmfReader(filename, lazy=True) as reader:
+            summary["bytes"] = len(reader.map)
+            types = collections.Counter(record.Type for record in reader)
+            summary["records"] = sum(types.values())
+            summary["types"] = dict(types)
+            if record_types:
+                import table
+                records = table.RecordTable(reader.map)
+                # copy() because the columns are views into the map, which is closed when we return.
+                summary["columns"] = {str(name): records.records(name).copy() for name in record_types}
+                del records
+    except (OSError, ValueError) as e: # One broken file should not take the whole batch down.
+        summary["error"] = type(e).__name__+": "+str(e)
+    return summary
+
+
+def summarize_chunk(filenames, record_types=()):
+    return [summarize_file(filename, record_types) for filename in filenames]
+
+
+def parse_files(filenames, workers=None, chunksize=DEFAULT_CHUNKSIZE, record_types=(), use_cache=False, specialize=False):
+    # Yields the summary of every file in filenames (any iterable, it is consumed lazily) in order. At most two chunks per
+    # worker are in flight at a time, so a long queue of files does not all end up in the pool at once.
+    if workers is None:
+        workers = os.cpu_count() or 1
+    filenames = iter(filenames)
+    pending = collections.deque()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=preload, initargs=(use_cache, specialize)) as pool:
+        while True:
+            while len(pending) < 2 * workers:
+                chunk = [filename for _, filename in zip(range(chunksize), filenames)]
+                if not chunk:
+                    break
+                pending.append(pool.submit(summarize_chunk, chunk, tuple(record_types)))
+            if not pending:
+                break
+            yield from pending.popleft().result()
+
+
+def record_values(record):
+    # The default decode function for parse_file: (Type, all fixed field values, variable data as bytes).
+    return record.Type, tuple(record.field_values()), record.variable_data.tobytes() if record.has_variable else None
+
+
+def decode_chunk(filename, offsets, types, sizes, decode=record_values):
+    # Decodes the given records of filename with decode(record). The file is memory mapped, so every worker reads the same
+    # page cache pages instead of a private copy of the file.
+    import emf
+    buffer = mapped_files.get(filename)
+    if buffer is None:
+        with open(filename, "rb") as f:
+            buffer = mapped_files[filename] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(buffer)
+    return [decode(emf.record_class(record_type, view, offset, size)(view, offset, offset + size)) for offset, record_type, size in zip(offsets, types, sizes)]
+
+
+def parse_file(filename, workers=None, chunk_bytes=DEFAULT_CHUNK_BYTES, decode=record_values, use_cache=False, specialize=False, save_index=False):
+    # Decodes every record of one (big) metafile in parallel and yields decode(record) for them in file order. Phase one is the
+    # cheap Type/Size scan (through the index sidecar, see index.py, which is only written next to the file with
+    # save_index=True so read-only capture directories are left alone). Phase two splits the records into chunks of about
+    # chunk_bytes, so a chunk of big bitmap records costs about as much as a chunk of small ones, and decodes them in the
+    # pool. decode has to be a module level function (it is pickled) which returns picklable values.
+    import index
+    if workers is None:
+        workers = os.cpu_count() or 1
+    records = index.RecordIndex.for_file(filename, save=save_index)
+    offsets = records.offsets
+    bounds = [0]
+    while bounds[-1] < len(offsets):
+        start = bounds[-1]
+        end = bisect.bisect_left(offsets, offsets[start] + chunk_bytes, start + 1) # Always at least one record.
+        bounds.append(end)
+    pending = collections.deque()
+    chunks = iter(zip(bounds, bounds[1:]))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=preload, initargs=(use_cache, specialize)) as pool:
+        while True:
+            for start, end in chunks:
+                pending.append(pool.submit(decode_chunk, filename, offsets[start:end], records.types[start:end], records.sizes[start:end], decode))
+                if len(pending) >= 2 * workers:
+                    break
+            if not pending:
+                break
+            yield from pending.popleft().result()
+
+
+def main() -> int:
+    args = sys.argv[1:]
+    workers = None
+    chunksize = DEFAULT_CHUNKSIZE
+    use_cache = "--cache" in args # Load the parsers through loader.py instead of output.py.
+    if use_cache:
+        args.remove("--cache")
+    if "-j" in args:
+        i = args.index("-j")
+        workers = int(args[i+1])
+        del args[i:i+2]
+    if "--chunksize" in args:
+        i = args.index("--chunksize")
+        chunksize = int(args[i+1])
+        del args[i:i+2]
+    if not args:
+        print("Usage: "+str(sys.argv[0])+" [-j WORKERS] [--chunksize N] [--cache] EMF_FILE...")
+        return 1
+    files = 0
+    errors = 0
+    records = 0
+    for summary in parse_files(args, workers, chunksize, use_cache=use_cache):
+        files += 1
+        if summary["error"] is not None:
+            errors += 1
+            print(summary["filename"]+"\terror\t"+summary["error"])
+            continue
+        records += summary["records"]
+        print(summary["filename"]+"\t"+str(summary["bytes"])+"\t"+str(summary["records"]))
+    print("Parsed "+str(files)+" files, "+str(records)+" records, "+str(errors)+" errors.")
+    return 1 if errors else 0
+
+
+if __name__=="__main__":
+    exit(main())
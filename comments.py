@@ -0,0 +1,58 @@
+from emf import *
+
+# Helpers for the payloads of comment records. iter_records already parses every comment as the record class of its
+# CommentIdentifier / PublicCommentIdentifier (see comment_class in emf.py), these get at what the comments embed. Everything is
+# returned as memoryviews of the buffer the record was parsed from, so a multi-megabyte EPS or WMF image is only copied if
+# the caller calls .tobytes() on it (or writes the view out).
+
+EMR_FORMAT_SIZE = EmrFormat.layout.size
+
+
+def format_entries(record):
+    # Returns [(EmrFormat, data)] for the graphics formats of an EMR_COMMENT_MULTIFORMATS record, in order of preference.
+    # data is a view of the image; the format it is in is EmrFormat.Signature (FormatSignature enumeration, section 2.1.14).
+    formats = []
+    start = record.offset + record.layout.size # aFormats follows CountFormats.
+    identifier = record.offset + 12 # offData counts from the CommentIdentifier field.
+    if start + record.CountFormats * EMR_FORMAT_SIZE > record.end:
+        raise ValueError("aFormats of the EMR_COMMENT_MULTIFORMATS at offset "+str(record.offset)+" overruns the record")
+    for i in range(record.CountFormats):
+        entry = EmrFormat(record.buffer, start + i * EMR_FORMAT_SIZE)
+        data_start = identifier + entry.offData
+        if data_start + entry.SizeData > record.end:
+            raise ValueError("Format "+str(i)+" of the EMR_COMMENT_MULTIFORMATS at offset "+str(record.offset)+" overruns the record")
+        formats.append((entry, record.buffer[data_start:data_start + entry.SizeData]))
+    return formats
+
+
+def windows_metafile(record):
+    # Returns a view of the WMF metafile embedded in an EMR_COMMENT_WINDOWS_METAFILE record.
+    if record.WinMetafileSize > len(record.variable_data):
+        raise ValueError("WinMetafile of the EMR_COMMENT_WINDOWS_METAFILE at offset "+str(record.offset)+" overruns the record")
+    return record.variable_data[:record.WinMetafileSize]
+
+
+def group_description(record):
+    # Returns the description string of an EMR_COMMENT_BEGINGROUP record ("" if it has none).
+    description = record.variable_data[:2 * record.nDescription].tobytes().decode("utf-16-le", errors="replace")
+    return description.split("\0", 1)[0]
+
+
+def spool_records(record):
+    # Returns a view of the EMFSPOOL records ([MS-EMFSPOOL]) embedded in an EMR_COMMENT_EMFSPOOL record. DataSize counts the
+    # CommentIdentifier and EMFSpoolRecordIdentifier fields too.
+    return record.variable_data[:max(record.DataSize - 8, 0)]
+
+
+def iter_groups(records):
+    # Yields (depth, EMR_COMMENT_BEGINGROUP record, description) for every group in records. Groups can be nested, depth is
+    # 0 for the outermost ones.
+    depth = 0
+    for record in records:
+        if record.Type != RecordType.EMR_COMMENT:
+            continue
+        if isinstance(record, EMR_COMMENT_BEGINGROUP):
+            yield depth, record, group_description(record)
+            depth += 1
+        elif isinstance(record, EMR_COMMENT_ENDGROUP) and depth > 0:
+            depth -= 1
@@ -0,0 +1,122 @@
+import mmap
+import struct
+from output import *
+
+# This file walks whole EMF files using the parsers generated into output.py.
+
+RECORD_HEADER = struct.Struct("<II") # Every record starts with the Type and Size fields.
+COMMENT_IDENTIFIER = struct.Struct("<I") # CommentIdentifier and PublicCommentIdentifier of comment records, at offsets 12 and 16.
+
+
+def scan_records(buffer, offset=0):
+    # Walks the Type/Size chain of the metafile in buffer and yields (offset, Type, Size) for every record, without parsing the
+    # records themselves.
+    length = len(buffer)
+    while offset + RECORD_HEADER.size <= length:
+        record_type, size = RECORD_HEADER.unpack_from(buffer, offset)
+        if size < RECORD_HEADER.size or offset + size > length: # A bogus size would make us loop forever or read past the end.
+            raise ValueError("Invalid Size "+str(size)+" for record type "+hex(record_type)+" at offset "+str(offset))
+        yield offset, record_type, size
+        offset += size
+        if record_type == RecordType.EMR_EOF: # Anything after the EOF record is not part of the metafile.
+            break
+
+
+def comment_class(buffer, offset, size):
+    # Returns the class which parses the EMR_COMMENT record at offset, from its CommentIdentifier and for public comments its
+    # PublicCommentIdentifier (see COMMENT_CLASSES in output.py). Comments which are too short for the class are private.
+    cls = EMR_COMMENT
+    if size >= 16:
+        cls = COMMENT_CLASSES.get(COMMENT_IDENTIFIER.unpack_from(buffer, offset + 12)[0], EMR_COMMENT)
+        if cls is EMR_COMMENT_PUBLIC and size >= 20:
+            cls = PUBLIC_COMMENT_CLASSES.get(COMMENT_IDENTIFIER.unpack_from(buffer, offset + 16)[0], EMR_COMMENT_PUBLIC)
+    return cls if size >= cls.layout.size else EMR_COMMENT
+
+
+def record_class(record_type, buffer=None, offset=0, size=0):
+    # Returns the class which parses records with the given Type. Comments are only told apart when buffer, offset and size
+    # of the record are given, otherwise they are all EMR_COMMENT.
+    if record_type == RecordType.EMR_COMMENT and buffer is not None:
+        return comment_class(buffer, offset, size)
+    return RECORD_CLASSES[record_type] if record_type < RECORD_COUNT else UnknownRecord
+
+
+def iter_records(buffer, offset=0, lazy=False):
+    # Yields the records of the metafile in buffer one at a time, starting at offset. Records are parsed in place (see the
+    # offset and end arguments of the generated classes), so nothing is copied and records which are not consumed are not parsed.
+    # With lazy=True the fields of a record are only decoded when they are accessed.
+    if not isinstance(buffer, memoryview):
+        buffer = memoryview(buffer)
+    for offset, record_type, size in scan_records(buffer, offset):
+        cls = RECORD_CLASSES[record_type] if record_type < RECORD_COUNT else UnknownRecord
+        if cls is EMR_COMMENT:
+            cls = comment_class(buffer, offset, size)
+        yield cls(buffer, offset, offset + size, lazy)
+
+
+def serialize_records(records):
+    # Serializes a whole metafile into one bytearray. The total size is summed from the Size fields first, so the output is
+    # allocated once and every record is packed straight into it (see serialize_into) instead of concatenating bytes.
+    if not isinstance(records, (list, tuple)):
+        records = list(records)
+    out = bytearray(sum(record.Size for record in records))
+    offset = 0
+    for record in records:
+        offset = record.serialize_into(out, offset)
+    return out
+
+
+def write_emf(filename, records):
+    with open(filename, "wb") as f:
+        f.write(serialize_records(records))
+
+
+class EmfReader:
+    # Reads a metafile through a read-only memory map instead of reading it into memory, so multi-gigabyte spool files can be
+    # walked with roughly constant resident memory. Records are parsed in place, so their variable_data are views into the map.
+    # Pages which iteration has moved past are handed back to the kernel every window bytes (they are just read back from the
+    # file if a record which is still alive touches them again).
+    window = 64 * 1024 * 1024
+
+    def __init__(self, filename, lazy=False):
+        self.lazy = lazy
+        self.file = open(filename, "rb")
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError: # Empty files can not be mapped.
+            self.file.close()
+            raise
+        if hasattr(self.map, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"): # Not available on every platform.
+            self.map.madvise(mmap.MADV_SEQUENTIAL)
+        self.view = memoryview(self.map)
+
+    def __iter__(self):
+        released = 0 # Everything before this offset has been given back. Always a multiple of the page size.
+        can_release = hasattr(self.map, "madvise") and hasattr(mmap, "MADV_DONTNEED")
+        for record in iter_records(self.view, lazy=self.lazy):
+            if can_release and record.offset - released >= self.window:
+                end = record.offset - record.offset % mmap.PAGESIZE
+                self.map.madvise(mmap.MADV_DONTNEED, released, end - released)
+                released = end
+            yield record
+
+    def close(self):
+        # The view is only dropped, not released: the records share it as their buffer, so they keep working after close.
+        self.view = None
+        try:
+            self.map.close()
+        except BufferError: # Records which are still alive reference the map. It is closed when the last one goes away.
+            pass
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def parse_emf(filename, lazy=False):
+    # Yields the records of the EMF file called filename. The file is memory mapped, see EmfReader.
+    with EmfReader(filename, lazy) as reader:
+        yield from reader
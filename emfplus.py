@@ -0,0 +1,186 @@
+import enum
+import struct
+from emf import *
+
+# Parser for the EMF+ records ([MS-EMFPLUS]) which GDI+ and Office embed in EMR_COMMENT_EMFPLUS comment records. The EMF+
+# records are parsed in place like the EMF ones: they are Record subclasses over the same buffer, so walking them copies
+# nothing, and lazy=True works the same way. Objects which do not fit in one comment are split over several EMF+ Object
+# records with the continue bit set; iter_objects hands those out as a list of views of the pieces instead of joining them.
+
+COMMENT_HEADER = struct.Struct("<II") # DataSize and CommentIdentifier, right after the Type and Size of an EMR_COMMENT.
+EMFPLUS_IDENTIFIER = 0x2B464D45 # "EMF+" (stored as "+FME"), the CommentIdentifier of EMR_COMMENT_EMFPLUS.
+EMFPLUS_HEADER_SIZE = 12 # Type, Flags, Size and DataSize.
+
+OBJECT_CONTINUED = 0x8000 # Flags bit of an EmfPlusObject record whose object continues in the next EmfPlusObject record.
+
+
+class EmfPlusRecordType(enum.IntEnum): # The RecordType enumeration of [MS-EMFPLUS] section 2.1.1.1.
+    EmfPlusHeader = 0x4001
+    EmfPlusEndOfFile = 0x4002
+    EmfPlusComment = 0x4003
+    EmfPlusGetDC = 0x4004
+    EmfPlusMultiFormatStart = 0x4005
+    EmfPlusMultiFormatSection = 0x4006
+    EmfPlusMultiFormatEnd = 0x4007
+    EmfPlusObject = 0x4008
+    EmfPlusClear = 0x4009
+    EmfPlusFillRects = 0x400A
+    EmfPlusDrawRects = 0x400B
+    EmfPlusFillPolygon = 0x400C
+    EmfPlusDrawLines = 0x400D
+    EmfPlusFillEllipse = 0x400E
+    EmfPlusDrawEllipse = 0x400F
+    EmfPlusFillPie = 0x4010
+    EmfPlusDrawPie = 0x4011
+    EmfPlusDrawArc = 0x4012
+    EmfPlusFillRegion = 0x4013
+    EmfPlusFillPath = 0x4014
+    EmfPlusDrawPath = 0x4015
+    EmfPlusFillClosedCurve = 0x4016
+    EmfPlusDrawClosedCurve = 0x4017
+    EmfPlusDrawCurve = 0x4018
+    EmfPlusDrawBeziers = 0x4019
+    EmfPlusDrawImage = 0x401A
+    EmfPlusDrawImagePoints = 0x401B
+    EmfPlusDrawString = 0x401C
+    EmfPlusSetRenderingOrigin = 0x401D
+    EmfPlusSetAntiAliasMode = 0x401E
+    EmfPlusSetTextRenderingHint = 0x401F
+    EmfPlusSetTextContrast = 0x4020
+    EmfPlusSetInterpolationMode = 0x4021
+    EmfPlusSetPixelOffsetMode = 0x4022
+    EmfPlusSetCompositingMode = 0x4023
+    EmfPlusSetCompositingQuality = 0x4024
+    EmfPlusSave = 0x4025
+    EmfPlusRestore = 0x4026
+    EmfPlusBeginContainer = 0x4027
+    EmfPlusBeginContainerNoParams = 0x4028
+    EmfPlusEndContainer = 0x4029
+    EmfPlusSetWorldTransform = 0x402A
+    EmfPlusResetWorldTransform = 0x402B
+    EmfPlusMultiplyWorldTransform = 0x402C
+    EmfPlusTranslateWorldTransform = 0x402D
+    EmfPlusScaleWorldTransform = 0x402E
+    EmfPlusRotateWorldTransform = 0x402F
+    EmfPlusSetPageTransform = 0x4030
+    EmfPlusResetClip = 0x4031
+    EmfPlusSetClipRect = 0x4032
+    EmfPlusSetClipPath = 0x4033
+    EmfPlusSetClipRegion = 0x4034
+    EmfPlusOffsetClip = 0x4035
+    EmfPlusDrawDriverString = 0x4036
+    EmfPlusStrokeFillPath = 0x4037
+    EmfPlusSerializableObject = 0x4038
+    EmfPlusSetTSGraphics = 0x4039
+    EmfPlusSetTSClip = 0x403A
+
+
+# The record classes are declared like the ones in manual.py. Every EMF+ record starts with the same 12 byte header, the
+# records which are not declared here are just that header and their data in variable_data.
+
+class EmfPlusRecord(Record):
+    name = "EmfPlusRecord"
+    has_variable = True
+    fields = ['Type', 'Flags', 'Size', 'DataSize'] # These are the fields of this object.
+    __slots__ = tuple(fields)
+    widths = (2, 2, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<HHII') # Precompiled little-endian layout of the fixed length part of the record.
+    mutable_layout = (('Flags', 2, 2), ('DataSize', 8, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u2'), ('Flags', '<u2'), ('Size', '<u4'), ('DataSize', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+class EmfPlusHeader(Record):
+    name = "EmfPlusHeader"
+    has_variable = False
+    fields = ['Type', 'Flags', 'Size', 'DataSize', 'Version', 'EmfPlusFlags', 'LogicalDpiX', 'LogicalDpiY'] # These are the fields of this object.
+    __slots__ = tuple(fields)
+    widths = (2, 2, 4, 4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<HHIIIIII') # Precompiled little-endian layout of the fixed length part of the record.
+    mutable_layout = (('Flags', 2, 2), ('DataSize', 8, 4), ('Version', 12, 4), ('EmfPlusFlags', 16, 4), ('LogicalDpiX', 20, 4), ('LogicalDpiY', 24, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u2'), ('Flags', '<u2'), ('Size', '<u4'), ('DataSize', '<u4'), ('Version', '<u4'), ('EmfPlusFlags', '<u4'), ('LogicalDpiX', '<u4'), ('LogicalDpiY', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+# The object id and type are in the Flags field. variable_data is the object, or a piece of it if the continue bit is set,
+# in which case TotalObjectSize comes first.
+class EmfPlusObject(Record):
+    name = "EmfPlusObject"
+    has_variable = True
+    fields = ['Type', 'Flags', 'Size', 'DataSize'] # These are the fields of this object.
+    __slots__ = tuple(fields)
+    widths = (2, 2, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<HHII') # Precompiled little-endian layout of the fixed length part of the record.
+    mutable_layout = (('Flags', 2, 2), ('DataSize', 8, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u2'), ('Flags', '<u2'), ('Size', '<u4'), ('DataSize', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+    def object_id(self):
+        return self.Flags & 0xFF
+
+    def object_type(self): # A value of the ObjectType enumeration of [MS-EMFPLUS] (brush, pen, path, image, ...).
+        return (self.Flags >> 8) & 0x7F
+
+    def is_continued(self):
+        return bool(self.Flags & OBJECT_CONTINUED)
+
+    def object_data(self):
+        # The object bytes in this record, as a view. Skips TotalObjectSize in the pieces of a continued object.
+        data = self.variable_data[:self.DataSize]
+        return data[4:] if self.is_continued() else data
+
+
+# Indexed by Type - 0x4000, like RECORD_CLASSES for the EMF records.
+EMFPLUS_RECORD_CLASSES = tuple(
+    {EmfPlusRecordType.EmfPlusHeader: EmfPlusHeader, EmfPlusRecordType.EmfPlusObject: EmfPlusObject}.get(0x4000 + i, EmfPlusRecord)
+    for i in range(max(EmfPlusRecordType) - 0x4000 + 1)
+)
+
+
+def emfplus_class(record_type):
+    # Returns the class which parses EMF+ records with the given Type.
+    index = record_type - 0x4000
+    return EMFPLUS_RECORD_CLASSES[index] if 0 <= index < len(EMFPLUS_RECORD_CLASSES) else EmfPlusRecord
+
+
+def is_emfplus_comment(record):
+    # True if the EMF record is an EMR_COMMENT_EMFPLUS, that is an EMR_COMMENT whose CommentIdentifier is "EMF+".
+    if record.Type != RecordType.EMR_COMMENT or record.Size < 16:
+        return False
+    return COMMENT_HEADER.unpack_from(record.buffer, record.offset + 8)[1] == EMFPLUS_IDENTIFIER
+
+
+def scan_emfplus(buffer, offset, end):
+    # Walks the EMF+ records in buffer[offset:end] (the payload of one comment) and yields (offset, Type, Size) for each.
+    while offset + EMFPLUS_HEADER_SIZE <= end:
+        record_type, flags, size = struct.unpack_from("<HHI", buffer, offset)
+        if size < EMFPLUS_HEADER_SIZE or offset + size > end:
+            raise ValueError("Invalid Size "+str(size)+" for EMF+ record type "+hex(record_type)+" at offset "+str(offset))
+        yield offset, record_type, size
+        offset += size
+
+
+def iter_emfplus_records(records, lazy=False):
+    # Yields the EMF+ records embedded in the EMR_COMMENT_EMFPLUS records of the EMF records in records (for example
+    # iter_records(buffer) or an EmfReader). The EMF+ records are parsed in place in the buffer of the comment they are in.
+    for record in records:
+        if not is_emfplus_comment(record):
+            continue
+        data_size = COMMENT_HEADER.unpack_from(record.buffer, record.offset + 8)[0]
+        start = record.offset + 16 # After Type, Size, DataSize and CommentIdentifier.
+        end = min(record.offset + 12 + data_size, record.end) # DataSize counts the CommentIdentifier.
+        for offset, record_type, size in scan_emfplus(record.buffer, start, end):
+            yield emfplus_class(record_type)(record.buffer, offset, offset + size, lazy)
+
+
+def iter_objects(emfplus_records):
+    # Yields (object id, object type, pieces) for every object defined by the EmfPlusObject records in emfplus_records.
+    # pieces is a list of memoryviews of the object bytes, one per record the object is spread over, so nothing is copied
+    # even when the object spans several comments. b"".join(pieces) gives the object as one bytes object.
+    pending = {} # Object id -> pieces of an object which is still being continued.
+    for record in emfplus_records:
+        if record.Type != EmfPlusRecordType.EmfPlusObject:
+            continue
+        object_id = record.object_id()
+        pieces = pending.setdefault(object_id, [])
+        pieces.append(record.object_data())
+        if not record.is_continued(): # The last piece does not have the continue bit set.
+            del pending[object_id]
+            yield object_id, record.object_type(), pieces
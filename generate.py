@@ -1,10 +1,17 @@
 
 import re
+import io
 import os
+import tempfile
 
 # This code is based on an earlier implementation of a thing.
 
-has_start = False
+# The start of the generated module. The shared runtime of the record classes lives in record.py.
+MODULE_HEADER = '''import enum
+import struct
+
+from record import *
+'''
 
 def fixup_stuff(struct_format, fields): # This looks at the struct format and fields and sees if there is the Type or Size field and then puts them at the start.
     struct_format = eval(struct_format) # Obvious possible command injection, but idc
@@ -39,7 +46,148 @@ def fixup_stuff(struct_format, fields): # This looks at the struct format and fi
 
     return str(struct_format), str(fields)
 
-def gen_python_code(struct_format, fields, name, has_variable):
+NATIVE_CODES = {1: "B", 2: "H", 4: "I", 8: "Q"} # Widths which struct can unpack straight into an unsigned integer.
+
+def struct_layout(struct_format, fields="[]", codes={}): # Turns a format list like ['4b', '4b', '16b'] into one little-endian struct string like "<II16s". codes overrides the code of some fields, see field_codes.
+    struct_format = eval(struct_format)
+    fields = eval(fields)
+    layout = "<"
+    for i, f in enumerate(struct_format):
+        length = int(f[:-1])
+        if i < len(fields) and fields[i] in codes:
+            layout += codes[fields[i]]
+        elif length in NATIVE_CODES:
+            layout += NATIVE_CODES[length]
+        else:
+            layout += str(length)+"s" # Odd sized blobs (RectL, XForm etc) are read as bytes and turned into an integer afterwards.
+    return layout
+
+NUMPY_CODES = {1: "<u1", 2: "<u2", 4: "<u4", 8: "<u8"}
+NUMPY_TYPED_CODES = {"b": "i1", "h": "<i2", "i": "<i4", "q": "<i8", "f": "<f4"} # For the fields which field_codes gives a type.
+
+def numpy_dtype(struct_format, fields, codes={}): # Turns the format and field lists into a numpy dtype description like [('Type', '<u4'), ('Bounds', 'u1', (16,))]. This is plain data, so the generated code does not need numpy.
+    dtype = []
+    for f, field in zip(eval(struct_format), eval(fields)):
+        length = int(f[:-1])
+        if field in codes:
+            dtype.append((field, NUMPY_TYPED_CODES[codes[field]]))
+        elif length in NUMPY_CODES:
+            dtype.append((field, NUMPY_CODES[length]))
+        else:
+            dtype.append((field, "u1", (length,))) # Blob fields are kept as bytes.
+    return dtype
+
+class Template:
+    # The record template (template.py), loaded once and split up front into literal text, placeholder slots (WIDTHS,
+    # FIELDS, NAME, ...) and "# SPECIALIZE X" ... "# END SPECIALIZE" blocks. Rendering a record is then a single join.
+    # A specialize block renders as the generic code inside it, unless specialized code for that block is passed to render().
+    placeholder_regex = re.compile(r"\b(WIDTHS|STRUCT_LAYOUT|FIELDS|NAME|HAS_VARIABLE|DTYPE|MUTABLE|ARRAYS|OBJECTS)\b") # Whole words only, so NAME does not hit other identifiers.
+    block_regex = re.compile(r"^([ \t]*)# SPECIALIZE (\w+)\n(.*?)^[ \t]*# END SPECIALIZE\n", re.MULTILINE | re.DOTALL)
+
+    def __init__(self, text):
+        self.parts = [] # Strings are literal text, ("slot", name) a placeholder and ("block", name, indent, generic code) a specialize block.
+        position = 0
+        for match in self.block_regex.finditer(text):
+            self.add_text(text[position:match.start()])
+            self.parts.append(("block", match.group(2), match.group(1), match.group(3)))
+            position = match.end()
+        self.add_text(text[position:])
+
+    def add_text(self, text):
+        for i, part in enumerate(self.placeholder_regex.split(text)):
+            if i % 2: # The split alternates between literal text and the placeholder names.
+                self.parts.append(("slot", part))
+            elif part:
+                self.parts.append(part)
+
+    def render(self, values, specialized=None):
+        out = []
+        for part in self.parts:
+            if isinstance(part, str):
+                out.append(part)
+            elif part[0] == "slot":
+                out.append(values[part[1]])
+            elif specialized and part[1] in specialized:
+                out.extend((part[2] + line if line else line) + "\n" for line in specialized[part[1]]) # No trailing whitespace on empty lines.
+            else:
+                out.append(part[3])
+        return "".join(out)
+
+
+HERE = os.path.dirname(os.path.abspath(__file__)) # template.py and manual.py are found next to this file, whatever the current directory is.
+TEMPLATE_FILENAME = os.path.join(HERE, "template.py")
+MANUAL_FILENAME = os.path.join(HERE, "manual.py")
+
+template = None # The loaded Template, see load_template.
+
+def load_template(filename=TEMPLATE_FILENAME):
+    global template
+    if template is None:
+        fh = open(filename, "r")
+        template = Template(fh.read())
+        fh.close()
+    return template
+
+
+def mutable_layout(struct_format, fields): # The (name, byte offset, width) of every field except Type and Size, for Record.mutable_fields.
+    layout = []
+    offset = 0
+    for f, field in zip(struct_format, fields):
+        length = int(f[:-1])
+        if field not in ("Type", "Size"):
+            layout.append((field, offset, length))
+        offset += length
+    return tuple(layout)
+
+
+# Element types of the variable length arrays which are decoded (see array_layout), as (regex on the description, numpy type,
+# values per element). Points are (x, y) pairs.
+ARRAY_ELEMENTS = (
+    (re.compile(r"array of PointL objects"), "<i4", 2),
+    (re.compile(r"array of PointS objects"), "<i2", 2),
+    (re.compile(r"array of 32-bit unsigned integers"), "<u4", 1),
+    (re.compile(r"length array of bytes?\b"), "u1", 1), # Only with an explicit count, "An array of bytes" on its own is just a buffer.
+)
+count_regex = re.compile(r"\bA (\w+) length array\b")
+
+def array_layout(layout): # Works out the arrays at the start of the variable part of a record and the fields which count their elements, as (name, count field, numpy type, values per element) tuples.
+    arrays = []
+    claimed = set()
+    for name, description in layout.variables:
+        element = next(((dtype, per) for regex, dtype, per in ARRAY_ELEMENTS if regex.search(description)), None)
+        if element is None: # The arrays after a field we can not decode have an unknown offset.
+            break
+        match = count_regex.search(description) # "A Count length array of PointS objects"
+        count = match.group(1) if match else None
+        if count is None: # "Count (4 bytes): ... the number of points in the aPoints array"
+            count = next((field for field, text in zip(layout.fields, layout.descriptions) if name+" array" in text or name+" field" in text), None)
+        if count is None and element[0] != "u1": # Otherwise the first count of the record which is not used yet, like NumberOfPolygons for PolygonPointCount.
+            count = next((field for field, text in zip(layout.fields, layout.descriptions) if "number of" in text and field not in claimed), None)
+        if count not in layout.fields:
+            break
+        claimed.add(count)
+        arrays.append((name, count) + element)
+    return tuple(arrays)
+
+
+def gen_methods(struct_format, fields): # Specialized decode and field_values methods for a record, which replace the generic loops of Record with straight line code.
+    code = ["", "def decode(self, data, offset):"]
+    code.append("    self."+", self.".join(fields)+" = self.layout.unpack_from(data, offset)") # Unpacks straight into the attributes.
+    values = []
+    for f, field in zip(struct_format, fields):
+        length = int(f[:-1])
+        if length in NATIVE_CODES:
+            values.append("self."+field)
+        else: # Blob field, which was unpacked as bytes.
+            code.append("    self."+field+" = int.from_bytes(self."+field+", byteorder='little')")
+            values.append("self."+field+".to_bytes("+str(length)+", byteorder='little')")
+    code.append("")
+    code.append("def field_values(self):")
+    code.append("    return ("+", ".join(values)+")")
+    return code
+
+
+def gen_python_code(struct_format, fields, name, has_variable, specialize=False, arrays=(), references={}, codes={}):
     if not name:
         return ""
     # Hardcoded check for the EMR_ string. If it doesn't exist in the name, then something bad happened.
@@ -47,214 +195,421 @@ def gen_python_code(struct_format, fields, name, has_variable):
         print("Invalid class name: "+str(name))
         assert False
 
-    fh = open("template.py", "r")
-    data = fh.read()
-    fh.close()
     # 
     assert fields != "[]" or has_variable
     #assert fields != [] or has_variable
-    # STRUCT_FORMAT is struct_format and FIELDS is fields in the template.
+    # WIDTHS comes from struct_format and FIELDS is fields in the template.
 
     struct_format, fields = fixup_stuff(struct_format, fields)
-    data = data.replace("STRUCT_FORMAT", struct_format)
-    data = data.replace("FIELDS", fields)
-    data = data.replace("NAME", name)
-    data = data.replace("HAS_VARIABLE", has_variable)
+    values = {
+        "DTYPE": repr(numpy_dtype(struct_format, fields, codes)),
+        "STRUCT_LAYOUT": repr(struct_layout(struct_format, fields, codes)),
+        "MUTABLE": repr(mutable_layout(eval(struct_format), eval(fields))),
+        "WIDTHS": repr(tuple(int(f[:-1]) for f in eval(struct_format))),
+        "FIELDS": fields,
+        "ARRAYS": repr(tuple(arrays)),
+        "OBJECTS": "("+"".join("("+repr(field)+", "+str(offset)+", "+references[field]+"), " for field, offset, _ in mutable_layout(eval(struct_format), eval(fields)) if field in references)+")",
+        "NAME": name,
+        "HAS_VARIABLE": has_variable,
+    }
+    specialized = None
+    if specialize: # Emit straight line code for this record instead of using the generic loops over the fields in Record.
+        specialized = {"METHODS": gen_methods(eval(struct_format), eval(fields))}
+    data = load_template().render(values, specialized)
     if name == "EMR_COMMENT":
-        # print("poopfuck")
-        fh = open("poopfuck.txt", "w")
-        fh.write(data)
-        fh.close()
         assert has_variable
     
     return data
 
-def save_code(code_string):
-    fh = open("output.py", "a")
-    fh.write(code_string)
-    fh.write("\n\n\n") # Add a bit of this.
-    fh.close()
-
-def spec_to_python(contents):
-    global has_start
-    if not has_start:
-        fh = open("output.py", "a")
-        fh.write('''import struct
-
-def to_unsigned(byte_integer: int) -> int: # Converts a signed integer in a single byte to an unsigned integer.
-    # assert byte_integer >= 0 and byte_integer <= 255
-    assert byte_integer >= -128 and byte_integer <= 127
-    if byte_integer < 0:
-        byte_integer += 256
-    return byte_integer
-''')
-        fh.write("\n\n")
-        fh.close()
-        has_start = True
-    # field_regex = re.compile(r"(\w+)\s+(\w+);")
-    record_regex = re.compile(r"^\d+\.\d+\.\d+\.\d+ \S+ Record$")
-    bytes_field_regex = re.compile(r'\w+\s\(\d+\sbytes\):') # This is for fixed length fields...
-    variable_field_regex = re.compile(r'\w+\s\(variable') # This is for fixed length fields...
-
-    lines = contents.splitlines()
-    line_ind = 0
-    in_rec = False
-
-    has_variable = False # This signifies if the record type has variable field at the end of it...
-    name_of_rec = None
-    struct_format = [] # ""
-    fields = []
-
-    # This part doesn't work for "2.3.4.2 EMR_HEADER Record Types" because reasons...
-
-    output = "" # Final output code...
-
-
-    while True:
-
-
-        if line_ind == len(lines):
-            code = gen_python_code(str(struct_format), str(fields), name_of_rec, str(has_variable))
-            save_code(code)
-            output += code + "\n\n" # Add a couple of newlines just to be safe
-            break
-
-        line = lines[line_ind]
-        tok = line.split(" ")
-        
-        
-        name = None
-
+# The objects of [MS-WMF] which the EMF spec refers to without describing them, as (name, [(field, length, description)]).
+# The descriptions are only there for field_code.
+WMF_OBJECTS = (
+    ("PointS", [("x", 2, "A signed integer"), ("y", 2, "A signed integer")]),
+    ("PointL", [("x", 4, "A signed integer"), ("y", 4, "A signed integer")]),
+    ("SizeL", [("cx", 4, "An unsigned integer"), ("cy", 4, "An unsigned integer")]),
+    ("RectL", [("Left", 4, "A signed integer"), ("Top", 4, "A signed integer"), ("Right", 4, "A signed integer"), ("Bottom", 4, "A signed integer")]),
+    ("ColorRef", [("Red", 1, ""), ("Green", 1, ""), ("Blue", 1, ""), ("Reserved", 1, "")]),
+)
+
+object_reference_regex = re.compile(r"^An? (?:\d+-bit )?(\w+) (?:\([^)]*\) )?object") # "A RectL object ([MS-WMF] ...", "A LogFont (section 2.2.13) object ..."
+float_regex = re.compile(r"\bFLOAT\b|floating-point|\bfloat\b") # "A FLOAT value", "A 32-bit float"
+signed_regex = re.compile(r"^An? (?:\d+-bit )?signed integer") # "A signed integer", but not "An unsigned integer".
+SIGNED_CODES = {1: "b", 2: "h", 4: "i", 8: "q"}
+
+def field_code(length, description, objects): # The struct code of a field from its width and the start of its description, and the name of the object it holds (or None). objects maps object names to their size.
+    match = object_reference_regex.search(description)
+    if match and objects.get(match.group(1)) == length:
+        return str(length)+"s", match.group(1) # Unpacked as bytes here, the object class decodes them.
+    if length == 4 and float_regex.search(description):
+        return "f", None
+    if length in SIGNED_CODES and signed_regex.search(description):
+        return SIGNED_CODES[length], None
+    if length in NATIVE_CODES:
+        return NATIVE_CODES[length], None
+    return str(length)+"s", None
+
+
+def gen_object_code(name, fields, objects): # Generates the class of one object. fields are (name, length, description). objects maps object names to their size.
+    layout = "<"
+    nested = []
+    offset = 0
+    for field, length, description in fields:
+        code, reference = field_code(length, description, objects)
+        layout += code
+        if reference is not None:
+            nested.append((field, offset, reference))
+        offset += length
+    out = "class "+name+"(EmfObject):\n"
+    out += "    name = "+repr(name)+"\n"
+    out += "    fields = "+repr(tuple(field for field, _, _ in fields))+"\n"
+    out += "    __slots__ = fields\n"
+    out += "    layout = struct.Struct("+repr(layout)+")\n"
+    out += "    objects = ("+"".join("("+repr(field)+", "+str(field_offset)+", "+reference+"), " for field, field_offset, reference in nested)+") # (field, offset, class) of the fields which are objects themselves.\n"
+    return out
+
+
+def gen_object_classes(layouts, objects): # Generates the classes of all objects, (name, fields) pairs, in an order where nested objects come before the objects containing them. The object sizes are added to objects.
+    layouts = [(name, fields) for name, fields in layouts if fields] # Objects made of bit fields (BitFIX28_4) have nothing to decode.
+    for name, fields in layouts:
+        objects[name] = sum(length for _, length, _ in fields)
+    by_name = dict(layouts)
+    out = []
+    done = set()
+    def emit(name):
+        if name in done:
+            return
+        done.add(name)
+        for field, length, description in by_name[name]:
+            reference = field_code(length, description, objects)[1]
+            if reference is not None:
+                emit(reference)
+        out.append(gen_object_code(name, by_name[name], objects) + "\n\n")
+    for name, _ in layouts:
+        emit(name)
+    return "".join(out)
+
+
+def field_codes(layout): # {field: struct code} of the fields of a record which the spec describes as signed integers or floats. Everything else is unpacked as an unsigned integer (or bytes).
+    codes = {}
+    for f, field, description in zip(layout.struct_format, layout.fields, layout.descriptions):
+        code = field_code(int(f[:-1]), description, {})[0]
+        if code in NUMPY_TYPED_CODES:
+            codes[field] = code
+    return codes
+
+
+def object_references(layout, objects): # {field: object name} of the fields of a record which hold a whole object, like Bounds (a RectL) or XformSrc (an XForm).
+    references = {}
+    for f, field, description in zip(layout.struct_format, layout.fields, layout.descriptions):
+        match = object_reference_regex.search(description)
+        if match and objects.get(match.group(1)) == int(f[:-1]):
+            references[field] = match.group(1)
+    return references
+
+
+record_regex = re.compile(r"^(\d+\.\d+\.\d+\.\d+ \S+|\d+\.\d+\.\d+\.\d+\.\d+ EMR_\w+) Record$") # The public comment records are one level deeper (2.3.3.4.1 EMR_COMMENT_BEGINGROUP).
+bytes_field_regex = re.compile(r'\w+\s\(\d+\sbytes\):') # This is for fixed length fields...
+variable_field_regex = re.compile(r'\w+\s\(variable') # This is for variable length fields...
+variable_description_regex = re.compile(r"^(\w+) \(variable[^)]*\): (.*)") # The description of a variable length field, not its box in the diagram.
+record_type_regex = re.compile(r"^ (EMR_\w+) = (0x[0-9A-Fa-f]+),?$") # The entries of the RecordType enumeration.
+comment_identifier_regex = re.compile(r"^(EMR_COMMENT_\w+) (0x[0-9A-Fa-f]{8})$") # The table of CommentIdentifier values in section 2.3.3.
+inherit_regex = re.compile(r"^Fields not specified in this section are specified in section ([\d.]+)(?: or ([\d.]+))?\.$")
+object_regex = re.compile(r"^2\.2\.\d+ (\w+) Object$") # A section heading of 2.2 EMF Objects.
+object_field_regex = re.compile(r"^(\w+) \((\d+) bytes?(, optional)?\): (.*)") # Objects also have 1 byte and optional fields.
+
+
+# The spec is processed as a pipeline of generators: iter_lines -> tokenize_spec -> iter_record_layouts -> gen_python_code.
+# Each stage only looks at one line / token / record at a time, so the spec is never split into a list of lines and the
+# records are emitted as soon as they have been read.
+
+def iter_lines(contents): # contents is either the spec as a string or an open file. Yields the lines without line endings.
+    if isinstance(contents, str):
+        contents = io.StringIO(contents)
+    for line in contents:
+        yield line.rstrip("\n")
+
+
+def tokenize_spec(lines): # Turns the lines of the spec into tokens. Lines which do not mean anything to the generator are dropped.
+    # ("record", name)          A "2.3.1.1 EMR_ALPHABLEND Record" section heading.
+    # ("record_types",)         A "2.3.4.2 EMR_HEADER Record Types" heading, which is not a record itself (see fixes in iter_record_layouts).
+    # ("type_field",)           A line describing a Type (4 bytes) field. Followed by the field token of the same line.
+    # ("field", name, length, description)   A fixed length field like "Bounds (16 bytes): ..."
+    # ("variable", name, description)        A variable length field like "aPoints (variable): ...". name and description are None for the boxes of the diagram.
+    # ("record_type", name, value)   An entry of the RecordType enumeration (section 2.1.1).
+    # ("public_comment_type", name, value)   An entry of the EmrComment enumeration (section 2.1.10).
+    # ("comment_identifier", name, value)    A CommentIdentifier value from the table in section 2.3.3.
+    # ("inherit", sections)     "Fields not specified in this section are specified in section 2.3.3 or 2.3.3.4."
+    # ("object", name)          A "2.2.28 XForm Object" section heading.
+    # ("object_field", name, length, optional, description)   A field of an object. Only in section 2.2.
+    # ("end",)                  The start of section 3, after which there are no more records.
+    in_enum = None # The token kind of the entries of the enumeration we are in, if any.
+    in_objects = False # In section 2.2 EMF Objects.
+    for line in lines:
+        if in_enum:
+            if line.startswith("} "):
+                in_enum = None
+                continue
+            match = record_type_regex.search(line)
+            if match: # Page headers and footers in between are just skipped.
+                yield (in_enum, match.group(1), int(match.group(2), 16))
+            continue
+        if line == "2.1.1 RecordType Enumeration": # The table of contents line has the page number after it, so this only matches the real section.
+            in_enum = "record_type"
+            continue
+        if line == "2.1.10 EmrComment Enumeration":
+            in_enum = "public_comment_type"
+            continue
+        if line == "2.2 EMF Objects":
+            in_objects = True
+            continue
+        if line == "2.3 EMF Records":
+            in_objects = False
+            yield ("object", None) # Ends the last object.
+            continue
+        if in_objects:
+            match = object_regex.search(line)
+            if match:
+                yield ("object", match.group(1))
+                continue
+            match = object_field_regex.search(line)
+            if match:
+                yield ("object_field", match.group(1), int(match.group(2)), bool(match.group(3)), match.group(4))
+            elif variable_description_regex.search(line): # Not the boxes of the diagram, those come before all of the fields.
+                yield ("variable", None, None)
+            continue
         if line == "3 Structure Examples":
-            code = gen_python_code(str(struct_format), str(fields), name_of_rec, str(has_variable))
-            save_code(code)
-            output += code + "\n\n" # Add a couple of newlines just to be safe
-            break
-
-        
-        
-        # Process the header line by line
-        #for line in header.splitlines():
-
-        # match = field_regex.search(line)
-        if not in_rec: # Not in record yet. Check if we have encountered a record section:
-            if record_regex.search(line): # There exists a match
-                # print("This line has the thing:"+str(line))
-                in_rec = True
-                name_of_rec = tok[-2] # Second last.
-                # print("Name of rec: "+str(name_of_rec))
-
-        else: # In record..., therefore check if the thing has a field in it.
-            if record_regex.search(line): # There exists a match
-                # We have encountered a new record type. Save the old one as a parser and be done with it.
-                # print("oof")
-                # Save the shit here..
-                # print("Name of reeeeeeeeeeec: "+str(name_of_rec))
-                # assert False
-                code = gen_python_code(str(struct_format), str(fields), name_of_rec, str(has_variable))
-                output += code + "\n\n" # Add a couple of newlines just to be safe
-                # print("output shit: "+str(output))
-                save_code(code)
-                name_of_rec = tok[-2] # Second last.
-                struct_format = [] # ""
-                fields = []
-                has_variable = False
-                # print("Name of rec: "+str(name_of_rec))
-
-            elif len(line) >= len("2.3.4.2") and line[1] == "." and line[3] == "." and line[5] == "." and "Record Types" in line: # This is to fix the bug in the parser when it encounters "2.3.4.2 EMR_HEADER Record Types"
-                #print("Not in record.")
-                #print("Previous record name: "+str(name_of_rec))
-                in_rec = False
-
-
-                # Maybe this bullshit here?????
-                code = gen_python_code(str(struct_format), str(fields), name_of_rec, str(has_variable))
-                output += code + "\n\n" # Add a couple of newlines just to be safe
-                # print("output shit: "+str(output))
-                save_code(code)
-                name_of_rec = tok[-2] # Second last.
-                struct_format = [] # ""
-                fields = []
-                has_variable = False
-
-
-            else:
-                
-                # Checks for the type line.
-                # Now check for the thing. This is to fix the situation when there is a description about some other structure before the next record type recorded. Therefore this prevents invalid output...
-                if "Type (4 bytes)" in line and struct_format != []:
-                    code = gen_python_code(str(struct_format), str(fields), name_of_rec, str(has_variable))
-                    output += code + "\n\n" # Add a couple of newlines just to be safe
-                    # print("output shit: "+str(output))
-                    save_code(code)
-                    # name_of_rec = tok[-2] # Second last.
-                    name_of_rec = None
-                    struct_format = [] # ""
-                    fields = []
-                    has_variable = False
-                    in_rec = False
-                    continue
-
-                if bytes_field_regex.search(line):
-                    # A fixed length field.
-                    
-                    length = int(tok[1][1:])
-                    # print("Length: "+str(length))
-                    struct_format.append(str(length)+"b") # b for bytes.
-                    #print("Here is a field: "+str(tok[0]))
-                    #print("Line index: "+str(line_ind))
-                    fields.append(tok[0])
-                elif variable_field_regex.search(line):
-                    #print("Line: "+str(line)+" WAS a variable thing")
-                    has_variable = True # Add variable stuff.
-
-        '''
+            yield ("end",)
+            return
+        tok = line.split(" ")
+        match = comment_identifier_regex.search(line)
         if match:
-            c_type, field_name = match.groups()
-            if c_type in type_mapping:
-                # struct_format += type_mapping[c_type]
-                struct_format.append(type_mapping[c_type])
-                fields.append(field_name)
-            else:
-                raise ValueError(f"Unknown type: {c_type}")
-
-        # Generate python code.
-
-        python_code = gen_python_code(str(struct_format), str(fields))
-        return python_code
-        '''
-
-
-        # Increment line counter...
-        line_ind += 1
-    return output
-
-
-def save_manual_input(): # This function is here because some records aren't documented in the PDF in the format this autogenerator expects. This causes the parser to miss some record types. These types are manually programmed in manual.py
-    fh = open("manual.py")
+            yield ("comment_identifier", match.group(1), int(match.group(2), 16))
+            continue
+        match = inherit_regex.search(line)
+        if match:
+            yield ("inherit", tuple(section for section in match.groups() if section))
+            continue
+        if record_regex.search(line):
+            yield ("record", tok[-2]) # Second last.
+        elif len(line) >= len("2.3.4.2") and line[1] == "." and line[3] == "." and line[5] == "." and "Record Types" in line:
+            yield ("record_types",)
+        else:
+            if "Type (4 bytes)" in line:
+                yield ("type_field",)
+            if bytes_field_regex.search(line):
+                yield ("field", tok[0], int(tok[1][1:]), line.partition(": ")[2])
+            elif variable_field_regex.search(line):
+                match = variable_description_regex.search(line)
+                yield ("variable",) + (match.groups() if match else (None, None))
+
+
+class RecordLayout: # The layout of one record, as read from the spec.
+    def __init__(self, name):
+        self.name = name
+        self.struct_format = [] # Like ['4b', '16b']. b for bytes.
+        self.fields = []
+        self.has_variable = False # This signifies if the record type has variable field at the end of it...
+        self.descriptions = [] # First line of the description of each fixed field.
+        self.variables = [] # (name, first line of the description) of each variable field, in order.
+
+
+# The fields of the generic structure of a section which the records in it leave out, see the "inherit" token. The comment
+# records only describe their own fields, but all of them start with DataSize (section 2.3.3), and the public ones also with
+# CommentIdentifier (section 2.3.3.4).
+INHERITED_FIELDS = {
+    "2.3.3": [("DataSize", 4, "An unsigned integer")],
+    "2.3.3.4": [("CommentIdentifier", 4, "An unsigned integer")],
+}
+
+
+class ObjectLayout: # The layout of one object of section 2.2, as read from the spec.
+    def __init__(self, name):
+        self.name = name
+        self.fields = [] # (name, length, description) of the fixed fields.
+        self.complete = True # Set at the first optional or variable length field. The fields after it have no fixed offset, so they are left out.
+
+
+def iter_record_layouts(tokens, record_types=None, comment_types=None): # Yields a RecordLayout for each record and an ObjectLayout for each object in the token stream. If record_types is a list, the RecordType enumeration entries are appended to it as (name, value) pairs. If comment_types is a list, the CommentIdentifier and EmrComment values are appended to it as (kind, name, value).
+    layout = None # The record we are currently in, if any.
+    obj = None # The same for objects.
+    for token in tokens:
+        kind = token[0]
+        if obj is not None:
+            if kind == "object_field":
+                if obj.complete and not token[3]:
+                    obj.fields.append((token[1], token[2], token[4]))
+                else:
+                    obj.complete = False
+                continue
+            if kind == "variable":
+                obj.complete = False
+                continue
+            yield obj
+            obj = None
+        if kind == "object":
+            if token[1] is not None:
+                obj = ObjectLayout(token[1])
+        elif kind in ("comment_identifier", "public_comment_type"):
+            if comment_types is not None:
+                comment_types.append(token)
+        elif kind == "record_type":
+            if record_types is not None:
+                record_types.append(token[1:])
+        elif kind == "end":
+            break
+        elif kind == "record":
+            # We have encountered a new record type. Save the old one as a parser and be done with it.
+            if layout:
+                yield layout
+            layout = RecordLayout(token[1])
+        elif layout is None: # Not in a record, so only a record heading matters.
+            continue
+        elif kind == "record_types":
+            # This is to fix the bug in the parser when it encounters "2.3.4.2 EMR_HEADER Record Types"
+            yield layout
+            layout = None
+        elif kind == "type_field":
+            # This is to fix the situation when there is a description about some other structure before the next record type recorded. Therefore this prevents invalid output...
+            if layout.struct_format != []:
+                yield layout
+                layout = None
+        elif kind == "inherit":
+            if layout.struct_format == []: # Comes right after the heading, before the fields of the record itself.
+                for section in token[1]:
+                    for name, length, description in INHERITED_FIELDS.get(section, []):
+                        layout.struct_format.append(str(length)+"b")
+                        layout.fields.append(name)
+                        layout.descriptions.append(description)
+        elif kind == "field":
+            layout.struct_format.append(str(token[2])+"b")
+            layout.fields.append(token[1])
+            layout.descriptions.append(token[3])
+        elif kind == "variable":
+            layout.has_variable = True # Add variable stuff.
+            if token[1] is not None:
+                layout.variables.append(token[1:])
+    if layout:
+        yield layout
+
+
+def spec_to_python(contents, record_types=None, specialize=False, comment_types=None): # contents is the spec as a string or an open file. See iter_record_layouts for record_types and comment_types and gen_python_code for specialize. Returns the code of a module with a class for each record.
+    output = [MODULE_HEADER, "\n\n"] # Final output code...
+    objects = {} # Object name -> size.
+    object_layouts = list(WMF_OBJECTS) # The objects (section 2.2) all come before the records, they are generated when the first record shows up.
+    for layout in iter_record_layouts(tokenize_spec(iter_lines(contents)), record_types, comment_types):
+        if isinstance(layout, ObjectLayout):
+            object_layouts.append((layout.name, layout.fields))
+            continue
+        if object_layouts:
+            output.append(gen_object_classes(object_layouts, objects))
+            object_layouts = []
+        code = gen_python_code(str(layout.struct_format), str(layout.fields), layout.name, str(layout.has_variable), specialize, array_layout(layout), object_references(layout, objects), field_codes(layout))
+        output.append(code + "\n\n\n") # Add a couple of newlines just to be safe
+    if object_layouts: # A spec without records. The manual classes still need the objects.
+        output.append(gen_object_classes(object_layouts, objects))
+    return "".join(output)
+
+
+def gen_record_type_enum(record_types): # Generates the RecordType enumeration (section 2.1.1) as an IntEnum.
+    out = "class RecordType(enum.IntEnum): # The RecordType enumeration (section 2.1.1). These are the values of the Type field of the records.\n"
+    for name, value in record_types:
+        out += "    "+name+" = "+"0x%08X" % value+"\n"
+    return out
+
+
+def gen_dispatch_table(record_types, code): # Generates the RECORD_CLASSES tuple (indexed by the Type field of a record) and the RECORD_TYPES dictionary, which map a record type to the class parsing it.
+    class_names = set(re.findall(r"^class (\w+)", code, re.MULTILINE))
+    classes = {}
+    for name, value in record_types:
+        if name in class_names: # Some record types (for example EMR_BEGINPATH) do not have a parser yet.
+            classes[value] = name
+    out = "# Indexed by the Type field of a record, so dispatching a record is a single tuple index. Types without a parser map to UnknownRecord.\n"
+    out += "RECORD_CLASSES = (\n"
+    for value in range(max(value for _, value in record_types) + 1):
+        out += "    "+classes.get(value, "UnknownRecord")+", # "+hex(value)+"\n"
+    out += ")\n"
+    out += "RECORD_COUNT = len(RECORD_CLASSES)\n\n"
+    out += "# Same mapping as a dictionary, only containing the record types which have a parser.\n"
+    out += "RECORD_TYPES = {\n"
+    for value, name in classes.items():
+        out += "    RecordType."+name+": "+name+",\n"
+    out += "}\n"
+    return out
+
+
+def gen_comment_enum(comment_types): # Generates the EmrComment enumeration (section 2.1.10), the values of the PublicCommentIdentifier field of public comments.
+    out = "class EmrComment(enum.IntEnum): # The EmrComment enumeration (section 2.1.10). These are the values of the PublicCommentIdentifier field of public comment records.\n"
+    for kind, name, value in comment_types:
+        if kind == "public_comment_type":
+            out += "    "+name+" = "+"0x%08X" % value+"\n"
+    return out
+
+
+def gen_comment_dispatch(comment_types, code): # Generates COMMENT_CLASSES and PUBLIC_COMMENT_CLASSES, which map the CommentIdentifier and the PublicCommentIdentifier of an EMR_COMMENT record to the class parsing it.
+    class_names = set(re.findall(r"^class (\w+)", code, re.MULTILINE))
+    out = "# EMR_COMMENT records all have the same Type. These tell them apart by their CommentIdentifier, and the public ones by their\n"
+    out += "# PublicCommentIdentifier. Comments with any other identifier are private EMR_COMMENT records.\n"
+    for kind, table in (("comment_identifier", "COMMENT_CLASSES"), ("public_comment_type", "PUBLIC_COMMENT_CLASSES")):
+        out += table+" = {\n"
+        for token_kind, name, value in comment_types:
+            if token_kind == kind and name in class_names: # EMR_COMMENT_UNICODE_STRING and EMR_COMMENT_UNICODE_END are reserved and have no record.
+                out += "    "+"0x%08X" % value+": "+name+",\n"
+        out += "}\n"
+    return out
+
+
+def load_manual_input(): # This function is here because some records aren't documented in the PDF in the format this autogenerator expects. This causes the parser to miss some record types. These types are manually programmed in manual.py
+    fh = open(MANUAL_FILENAME)
     data = fh.read()
     fh.close()
-    save_code(data)
-    return
+    return data
 
 
-def gen_parsers(filename: str) -> None:
-    fh = open(filename, "r")
-    data = fh.read()
-    fh.close()
-    spec_to_python(data)
+def gen_module(filename: str, specialize: bool = False) -> str: # Generates the whole parser module (output.py) from the spec file in memory.
+    record_types = [] # Filled in while the spec is read.
+    comment_types = [] # Same.
+    with open(filename, "r") as fh:
+        code = spec_to_python(fh, record_types, specialize, comment_types)
     # Save the manual shit....
-    save_manual_input()
+    code += load_manual_input() + "\n\n\n"
+    # The dispatch table has to come last, because it references all of the classes.
+    code += gen_record_type_enum(record_types) + "\n\n\n"
+    code += gen_dispatch_table(record_types, code) + "\n\n\n"
+    code += gen_comment_enum(comment_types) + "\n\n\n"
+    code += gen_comment_dispatch(comment_types, code) + "\n\n\n"
+    return code
+
+
+def write_module(code: str, filename: str = "output.py") -> None: # Writes the module with one write to a temporary file next to it, which is then renamed over the old one. Whoever imports filename sees either the old or the new module, never a half written one.
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=".py")
+    try:
+        with os.fdopen(fd, "w") as fh:
+            fh.write(code)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.chmod(tmp_name, os.stat(filename).st_mode if os.path.exists(filename) else 0o644) # mkstemp creates the file as 0600.
+        os.replace(tmp_name, filename)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    return
+
+
+def gen_parsers(filename: str, specialize: bool = False) -> None:
+    write_module(gen_module(filename, specialize))
     return
 
 
 def main() -> int:
-    if len(sys.argv) != 2:
-        print("Usage: "+str(sys.argv[0])+" INPUT_CONTENTS_FILE")
+    args = sys.argv[1:]
+    specialize = "--specialize" in args # Emit straight line decode/encode code per record instead of the generic loops.
+    if specialize:
+        args.remove("--specialize")
+    if len(args) != 1:
+        print("Usage: "+str(sys.argv[0])+" [--specialize] INPUT_CONTENTS_FILE")
         exit(0)
-    # Delete the old stuff.
-    os.system("rm output.py")
-    gen_parsers(sys.argv[1])
+    gen_parsers(args[0], specialize)
     return 0
 
 
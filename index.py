@@ -0,0 +1,144 @@
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from emf import *
+
+# Offset index of a metafile: the (offset, Type, Size) of every record in three flat arrays, plus a posting list of record
+# numbers for every record type. Building it is one Type/Size scan of the file. After that record N is one array lookup and
+# the records of one type are their posting list, so nothing has to walk the file from the start again. The index can be saved
+# as a sidecar file next to the metafile (see for_file) so the scan only happens once per file.
+
+INDEX_SUFFIX = ".idx"
+INDEX_MAGIC = b"EMFIDX01"
+INDEX_HEADER = struct.Struct("<8sQQQ") # Magic, size of the metafile, number of records, number of posting lists.
+POSTING_HEADER = struct.Struct("<II") # Record type, number of records of that type.
+
+
+def to_little_endian(values): # The sidecar is always little endian, like the metafile itself.
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+class RecordIndex:
+    def __init__(self, offsets, types, sizes, postings, file_size):
+        self.offsets = offsets # array('Q'), one entry per record in file order.
+        self.types = types # array('I')
+        self.sizes = sizes # array('I')
+        self.postings = postings # Record type -> array('Q') of record numbers, in file order.
+        self.file_size = file_size # Size of the indexed metafile, used to notice a stale sidecar.
+
+    @classmethod
+    def build(cls, buffer):
+        offsets = array('Q')
+        types = array('I')
+        sizes = array('I')
+        postings = {}
+        for offset, record_type, size in scan_records(buffer):
+            posting = postings.get(record_type)
+            if posting is None:
+                posting = postings[record_type] = array('Q')
+            posting.append(len(offsets))
+            offsets.append(offset)
+            types.append(record_type)
+            sizes.append(size)
+        return cls(offsets, types, sizes, postings, len(buffer))
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, n):
+        # Returns (offset, Type, Size) of record number n.
+        return self.offsets[n], self.types[n], self.sizes[n]
+
+    def record(self, buffer, n, lazy=False):
+        # Parses record number n of buffer (the metafile this index was built from).
+        offset = self.offsets[n]
+        return record_class(self.types[n], buffer, offset, self.sizes[n])(buffer, offset, offset + self.sizes[n], lazy)
+
+    def of_type(self, record_type):
+        # Record numbers of all records of the given type (a RecordType value or a record class name like "EMR_BITBLT").
+        if isinstance(record_type, str):
+            record_type = RecordType[record_type]
+        return self.postings.get(record_type, array('Q'))
+
+    def nth_of_type(self, record_type, k):
+        # Record number of the k-th record of the given type.
+        return self.of_type(record_type)[k]
+
+    def save(self, filename):
+        # Writes to a temporary file next to filename which is then renamed over it (like generate.write_module), so processes
+        # racing to write the same sidecar never leave a half written one behind for the others to load.
+        fd, tmp_name = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(filename)), prefix=".tmp_", suffix=INDEX_SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(INDEX_HEADER.pack(INDEX_MAGIC, self.file_size, len(self.offsets), len(self.postings)))
+                for values in (self.offsets, self.types, self.sizes):
+                    f.write(to_little_endian(values))
+                for record_type, posting in sorted(self.postings.items()):
+                    f.write(POSTING_HEADER.pack(record_type, len(posting)))
+                    f.write(to_little_endian(posting))
+            os.chmod(tmp_name, 0o644) # mkstemp creates the file as 0600.
+            os.replace(tmp_name, filename)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    @classmethod
+    def load(cls, filename):
+        with open(filename, "rb") as f:
+            data = f.read()
+        magic, file_size, count, posting_count = INDEX_HEADER.unpack_from(data, 0)
+        if magic != INDEX_MAGIC:
+            raise ValueError("Not a record index: "+str(filename))
+        offset = INDEX_HEADER.size
+        def take(typecode, n):
+            nonlocal offset
+            values = array(typecode)
+            values.frombytes(data[offset:offset + n * values.itemsize])
+            if sys.byteorder == "big":
+                values.byteswap()
+            offset += n * values.itemsize
+            return values
+        offsets = take('Q', count)
+        types = take('I', count)
+        sizes = take('I', count)
+        postings = {}
+        for _ in range(posting_count):
+            record_type, n = POSTING_HEADER.unpack_from(data, offset)
+            offset += POSTING_HEADER.size
+            postings[record_type] = take('Q', n)
+        if offset != len(data):
+            raise ValueError("Truncated or corrupt record index: "+str(filename))
+        return cls(offsets, types, sizes, postings, file_size)
+
+    @classmethod
+    def for_file(cls, filename, save=True):
+        # Returns the index of the metafile called filename. The sidecar file (filename + INDEX_SUFFIX) is used if it is newer
+        # than the metafile and was built from a file of the same size, otherwise the file is scanned (through a memory map) and
+        # with save=True the sidecar is written for next time.
+        index_filename = filename + INDEX_SUFFIX
+        stat = os.stat(filename)
+        if stat.st_size == 0: # Empty files can not be mapped. They have no records either.
+            return cls.build(b"")
+        try:
+            index_stat = os.stat(index_filename)
+            if index_stat.st_mtime >= stat.st_mtime:
+                index = cls.load(index_filename)
+                if index.file_size == stat.st_size:
+                    return index
+        except (OSError, ValueError, struct.error): # No sidecar, or one we can not use. Just rebuild it.
+            pass
+        with open(filename, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                index = cls.build(buffer)
+        if save:
+            try:
+                index.save(index_filename)
+            except OSError: # A read-only or shared directory. The index is still good, it just is not kept for next time.
+                pass
+        return index
@@ -0,0 +1,61 @@
+import hashlib
+import importlib.util
+import os
+import py_compile
+import sys
+
+import generate
+
+# Loads the generated parser module from a cache directory instead of output.py. The cached module is keyed by a hash of
+# everything that goes into generating it (the spec, template.py, manual.py and generate.py itself), so it is regenerated
+# and byte-compiled only when one of those changes. Workers can then just call install() on startup.
+
+CACHE_DIR = os.environ.get("EMF_PARSER_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "emf_parsers"))
+SPEC_FILENAME = os.path.join(generate.HERE, "contents.txt")
+
+
+def spec_hash(spec_filename=SPEC_FILENAME, specialize=False):
+    digest = hashlib.sha256()
+    for filename in (spec_filename, generate.TEMPLATE_FILENAME, generate.MANUAL_FILENAME, generate.__file__):
+        with open(filename, "rb") as fh:
+            digest.update(hashlib.sha256(fh.read()).digest()) # Hash of hashes, so the boundaries between the files count.
+    digest.update(b"specialize" if specialize else b"generic")
+    return digest.hexdigest()
+
+
+def cached_module_path(spec_filename=SPEC_FILENAME, specialize=False, cache_dir=None):
+    # Returns the path of the cached parser module, generating and byte-compiling it first if it is not there yet.
+    if cache_dir is None:
+        cache_dir = CACHE_DIR
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, "output_"+spec_hash(spec_filename, specialize)[:32]+".py")
+    if not os.path.exists(path):
+        # write_module renames the finished file into place, so concurrent workers either see no module or a complete one.
+        generate.write_module(generate.gen_module(spec_filename, specialize), path)
+        # The name already changes whenever the source does, so the bytecode does not need to be checked against it on import.
+        py_compile.compile(path, cfile=importlib.util.cache_from_source(path), doraise=True,
+                           invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+    return path
+
+
+def load_parsers(spec_filename=SPEC_FILENAME, specialize=False, cache_dir=None, install=False):
+    # Imports the cached parser module and returns it. With install=True it also replaces the "output" module, so emf.py,
+    # table.py and everything else importing output after this call use the cached one.
+    path = cached_module_path(spec_filename, specialize, cache_dir)
+    name = os.path.splitext(os.path.basename(path))[0]
+    if name in sys.modules:
+        module = sys.modules[name]
+    else:
+        if generate.HERE not in sys.path: # The generated module imports record.py.
+            sys.path.append(generate.HERE)
+        module_spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(module_spec)
+        sys.modules[name] = module
+        module_spec.loader.exec_module(module)
+    if install:
+        sys.modules["output"] = module
+    return module
+
+
+def install(spec_filename=SPEC_FILENAME, specialize=False, cache_dir=None):
+    return load_parsers(spec_filename, specialize, cache_dir, install=True)
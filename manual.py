@@ -1,55 +1,51 @@
 # This wasn't in the specific format which this script expects. Just add it here....
 
 
-class EMR_SAVEDC:
-    format = ["4b", "4b"]
+class EMR_SAVEDC(Record):
     name = "EMR_SAVEDC"
     has_variable = False
-    fields = ["Type", "Size"] # These are the fields of this object.
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        for field, value in zip(self.fields, unpacked):
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255
-                setattr(self, field, (1, value)) # Size of one byte
-        # self.remaining_data = data[struct.calcsize("".join(self.format)):]
-        self.remaining_data = data
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SAVEDC {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        return out # Return the output bytes
+    fields = ['Type', 'Size'] # These are the fields of this object.
+    __slots__ = tuple(fields)
+    widths = (4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II') # Precompiled little-endian layout of the fixed length part of the record.
+    mutable_layout = () # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+# EMR_HEADER is described as "EMR_HEADER Record Types" in the spec, which the generator skips. This is the fixed part of the
+# header (the Header object of section 2.2.9). The header extensions and the description string are left in variable_data.
+class EMR_HEADER(Record):
+    name = "EMR_HEADER"
+    has_variable = True
+    fields = ['Type', 'Size', 'Bounds', 'Frame', 'RecordSignature', 'Version', 'Bytes', 'Records', 'Handles', 'Reserved', 'nDescription', 'offDescription', 'nPalEntries', 'Device', 'Millimeters'] # These are the fields of this object.
+    __slots__ = tuple(fields)
+    widths = (4, 4, 16, 16, 4, 4, 4, 4, 2, 2, 4, 4, 4, 8, 8) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16s16sIIIIHHIIIQQ') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ('Frame', 24, RectL), ('Device', 72, SizeL), ('Millimeters', 80, SizeL)) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('Frame', 24, 16), ('RecordSignature', 40, 4), ('Version', 44, 4), ('Bytes', 48, 4), ('Records', 52, 4), ('Handles', 56, 2), ('Reserved', 58, 2), ('nDescription', 60, 4), ('offDescription', 64, 4), ('nPalEntries', 68, 4), ('Device', 72, 8), ('Millimeters', 80, 8)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('Frame', 'u1', (16,)), ('RecordSignature', '<u4'), ('Version', '<u4'), ('Bytes', '<u4'), ('Records', '<u4'), ('Handles', '<u2'), ('Reserved', '<u2'), ('nDescription', '<u4'), ('offDescription', '<u4'), ('nPalEntries', '<u4'), ('Device', '<u8'), ('Millimeters', '<u8')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+# Fallback for record types which do not have a parser (yet). Only the Type and Size fields are decoded, the rest is variable_data.
+class UnknownRecord(Record):
+    name = "UnknownRecord"
+    has_variable = True
+    fields = ['Type', 'Size'] # These are the fields of this object.
+    __slots__ = tuple(fields)
+    widths = (4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II') # Precompiled little-endian layout of the fixed length part of the record.
+    mutable_layout = () # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+# "2.3.3.4 EMR_COMMENT_PUBLIC Record Types" is not a record heading either. This is the generic public comment, used for the
+# public comments whose PublicCommentIdentifier does not have a record of its own (see PUBLIC_COMMENT_CLASSES).
+class EMR_COMMENT_PUBLIC(Record):
+    name = "EMR_COMMENT_PUBLIC"
+    has_variable = True
+    fields = ['Type', 'Size', 'DataSize', 'CommentIdentifier', 'PublicCommentIdentifier'] # These are the fields of this object.
+    __slots__ = tuple(fields)
+    widths = (4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIIII') # Precompiled little-endian layout of the fixed length part of the record.
+    mutable_layout = (('DataSize', 8, 4), ('CommentIdentifier', 12, 4), ('PublicCommentIdentifier', 16, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('DataSize', '<u4'), ('CommentIdentifier', '<u4'), ('PublicCommentIdentifier', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
@@ -0,0 +1,176 @@
+import os
+import random
+import sys
+from emf import *
+
+# Mutation engine for fuzzing EMF parsers. The seed file is scanned once, and every field of every record is turned into a
+# flat list of (offset in file, width, record index) targets up front. Variants are then produced by mutating the seed in place and
+# restoring it afterwards, so producing a variant costs a handful of slice assignments and no parsing.
+
+DEFAULT_WEIGHTS = {
+    "bitflip": 3, # Flip a random bit anywhere in a record, after its Type and Size.
+    "interesting": 3, # Set a field to an interesting integer (0, -1, INT_MAX, ...).
+    "boundary": 2, # Set a count, size or offset field to a value around the size of its record or of the file.
+    "duplicate": 1, # Duplicate a whole record.
+    "delete": 1, # Delete a whole record.
+}
+STRUCTURAL = ("duplicate", "delete") # These change the length of the file, so they produce a new buffer and fix up the header.
+
+INTERESTING_8 = (-128, -1, 0, 1, 16, 32, 64, 100, 127)
+INTERESTING_16 = INTERESTING_8 + (-32768, -129, 128, 255, 256, 512, 1000, 1024, 4096, 32767)
+INTERESTING_32 = INTERESTING_16 + (-2147483648, -100663046, -32769, 32768, 65535, 65536, 100663045, 2147483647)
+INTERESTING = {1: INTERESTING_8, 2: INTERESTING_16, 4: INTERESTING_32, 8: INTERESTING_32 + (-(1 << 63), (1 << 63) - 1)}
+
+BOUNDARY_PREFIXES = ("n", "c", "off", "cb", "i") # nPalEntries, cpts, offBmiSrc, cbBits, iUsage, ... Counts, sizes and offsets.
+
+
+def field_offset(cls, name): # The byte offset of a field inside the fixed part of a record (not Type or Size).
+    for field, offset, width in cls.mutable_layout:
+        if field == name:
+            return offset
+    raise KeyError(name)
+
+
+def is_boundary_field(name):
+    return any(name.startswith(prefix) and name[len(prefix):len(prefix)+1].isalpha() for prefix in BOUNDARY_PREFIXES)
+
+
+class Mutator:
+    def __init__(self, seed, weights=None, max_stack=4, rng=None):
+        self.seed = bytes(seed)
+        self.buffer = bytearray(self.seed) # Mutated in place, see variants().
+        self.records = list(scan_records(memoryview(self.seed))) # (offset, Type, Size)
+        self.max_stack = max_stack # At most this many field mutations are stacked on one variant.
+        self.random = rng if rng is not None else random.Random()
+        weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+        self.strategies = [name for name, weight in weights.items() if weight > 0]
+        self.cum_weights = []
+        total = 0
+        for name in self.strategies:
+            total += weights[name]
+            self.cum_weights.append(total)
+        self.targets = [] # (offset, width, record index) of every mutable field in the file.
+        self.boundary_targets = [] # The same for the count, size and offset fields.
+        self.header_fields = None # Offsets of the Bytes and Records fields of the EMR_HEADER, if the file starts with one.
+        for index, (offset, record_type, size) in enumerate(self.records):
+            cls = record_class(record_type, self.seed, offset, size) # Comments by their identifier, so their own fields are targets too.
+            if record_type == RecordType.EMR_HEADER:
+                if index == 0:
+                    self.header_fields = (offset + field_offset(cls, "Bytes"), offset + field_offset(cls, "Records"))
+            for field, field_start, width in cls.mutable_layout: # Type and Size are never in there.
+                if field_start + width > size: # The record is shorter than its fixed part.
+                    break
+                # The header counts are kept consistent by fix_header.
+                if not (record_type == RecordType.EMR_HEADER and field in ("Bytes", "Records")):
+                    self.targets.append((offset + field_start, width, index))
+                    if is_boundary_field(field):
+                        self.boundary_targets.append((offset + field_start, width, index))
+        # Records which can be duplicated or deleted without breaking the file outright (everything but the header and EOF).
+        self.body_records = [i for i, (_, record_type, _) in enumerate(self.records) if record_type not in (RecordType.EMR_HEADER, RecordType.EMR_EOF)]
+
+    def write_int(self, buf, offset, width, value):
+        buf[offset:offset+width] = (value & ((1 << (8*width)) - 1)).to_bytes(width, byteorder='little')
+
+    def mutate_field(self, buf, strategy):
+        # Applies one in place mutation and returns (offset, old bytes) to undo it, or None if there was nothing to mutate.
+        rand = self.random
+        if strategy == "bitflip":
+            offset, record_type, size = self.records[rand.randrange(len(self.records))]
+            if size <= 8:
+                return None
+            position = offset + 8 + rand.randrange(size - 8)
+            if self.header_fields is not None and any(0 <= position - field < 4 for field in self.header_fields):
+                return None # The header counts are kept consistent by fix_header.
+            old = buf[position:position+1]
+            buf[position] ^= 1 << rand.randrange(8)
+            return position, old
+        if strategy == "interesting":
+            if not self.targets:
+                return None
+            offset, width, index = self.targets[rand.randrange(len(self.targets))]
+            value = rand.choice(INTERESTING.get(width, INTERESTING_32))
+        else: # boundary
+            if not self.boundary_targets:
+                return None
+            offset, width, index = self.boundary_targets[rand.randrange(len(self.boundary_targets))]
+            size = self.records[index][2]
+            value = rand.choice((0, size, size - 1, size + 1, size - 4, size + 4, len(buf), len(buf) + 1, 0x7FFFFFFF, 0x80000000, 0xFFFFFFFF))
+        old = buf[offset:offset+width]
+        self.write_int(buf, offset, min(width, 8), value) # Blob fields get the value in their first 8 bytes.
+        return offset, old
+
+    def fix_header(self, buf, record_count):
+        # Makes the Bytes and Records fields of the EMR_HEADER match the file.
+        if self.header_fields is not None:
+            self.write_int(buf, self.header_fields[0], 4, len(buf))
+            self.write_int(buf, self.header_fields[1], 4, record_count)
+
+    def mutate_structure(self, strategy):
+        # Returns a new buffer with a record duplicated or deleted, or None if there is no record to do that with.
+        if not self.body_records:
+            return None
+        offset, record_type, size = self.records[self.body_records[self.random.randrange(len(self.body_records))]]
+        seed = self.seed
+        if strategy == "duplicate":
+            out = bytearray(len(seed) + size)
+            out[:offset+size] = seed[:offset+size]
+            out[offset+size:offset+2*size] = seed[offset:offset+size]
+            out[offset+2*size:] = seed[offset+size:]
+            self.fix_header(out, len(self.records) + 1)
+        else: # delete
+            out = bytearray(len(seed) - size)
+            out[:offset] = seed[:offset]
+            out[offset:] = seed[offset+size:]
+            self.fix_header(out, len(self.records) - 1)
+        return out
+
+    def variants(self, count=None):
+        # Yields count mutated variants of the seed (forever if count is None). Field mutations are done in place on one
+        # bytearray which is restored afterwards, so a variant is only valid until the next one is requested: write it out or
+        # feed it to the target before that, or copy it.
+        buf = self.buffer
+        produced = 0
+        misses = 0 # Strategies which had nothing to mutate in a row.
+        while count is None or produced < count:
+            strategy = self.random.choices(self.strategies, cum_weights=self.cum_weights)[0]
+            if strategy in STRUCTURAL:
+                out = self.mutate_structure(strategy)
+                if out is None:
+                    misses += 1
+                    if misses > 1000: # The seed has nothing the enabled strategies can mutate.
+                        return
+                    continue
+                yield out
+            else:
+                undo = []
+                for _ in range(self.random.randint(1, self.max_stack)):
+                    change = self.mutate_field(buf, strategy)
+                    if change is not None:
+                        undo.append(change)
+                if not undo:
+                    misses += 1
+                    if misses > 1000:
+                        return
+                    continue
+                yield buf
+                for offset, old in reversed(undo):
+                    buf[offset:offset+len(old)] = old
+            misses = 0
+            produced += 1
+
+
+def main() -> int:
+    if len(sys.argv) != 4:
+        print("Usage: "+str(sys.argv[0])+" SEED_FILE OUTPUT_DIRECTORY COUNT")
+        return 1
+    with open(sys.argv[1], "rb") as f:
+        mutator = Mutator(f.read())
+    os.makedirs(sys.argv[2], exist_ok=True)
+    for i, variant in enumerate(mutator.variants(int(sys.argv[3]))):
+        with open(os.path.join(sys.argv[2], "variant_"+str(i)+".emf"), "wb") as f:
+            f.write(variant)
+    return 0
+
+
+if __name__=="__main__":
+    exit(main())
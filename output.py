@@ -1,10058 +1,2320 @@
+import enum
 import struct
 
-def to_unsigned(byte_integer: int) -> int: # Converts a signed integer in a single byte to an unsigned integer.
-    # assert byte_integer >= 0 and byte_integer <= 255
-    assert byte_integer >= -128 and byte_integer <= 127
-    if byte_integer < 0:
-        byte_integer += 256
-    return byte_integer
+from record import *
 
 
-class EMR_ALPHABLEND:
-    format = ['4b', '4b', '16b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '24b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b']
+class PointS(EmfObject):
+    name = 'PointS'
+    fields = ('x', 'y')
+    __slots__ = fields
+    layout = struct.Struct('<hh')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class PointL(EmfObject):
+    name = 'PointL'
+    fields = ('x', 'y')
+    __slots__ = fields
+    layout = struct.Struct('<ii')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class SizeL(EmfObject):
+    name = 'SizeL'
+    fields = ('cx', 'cy')
+    __slots__ = fields
+    layout = struct.Struct('<II')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class RectL(EmfObject):
+    name = 'RectL'
+    fields = ('Left', 'Top', 'Right', 'Bottom')
+    __slots__ = fields
+    layout = struct.Struct('<iiii')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class ColorRef(EmfObject):
+    name = 'ColorRef'
+    fields = ('Red', 'Green', 'Blue', 'Reserved')
+    __slots__ = fields
+    layout = struct.Struct('<BBBB')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class ColorAdjustment(EmfObject):
+    name = 'ColorAdjustment'
+    fields = ('Size', 'Values', 'IlluminantIndex', 'RedGamma', 'GreenGamma', 'BlueGamma', 'ReferenceBlack', 'ReferenceWhite', 'Contrast', 'Brightness', 'Colorfulness', 'RedGreenTint')
+    __slots__ = fields
+    layout = struct.Struct('<HHHHHHHHhhhh')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class DesignVector(EmfObject):
+    name = 'DesignVector'
+    fields = ('Signature', 'NumAxes')
+    __slots__ = fields
+    layout = struct.Struct('<II')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class EmrFormat(EmfObject):
+    name = 'EmrFormat'
+    fields = ('Signature', 'Version', 'SizeData', 'offData')
+    __slots__ = fields
+    layout = struct.Struct('<IIII')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class EmrText(EmfObject):
+    name = 'EmrText'
+    fields = ('Reference', 'Chars', 'offString', 'Options')
+    __slots__ = fields
+    layout = struct.Struct('<8sIII')
+    objects = (('Reference', 0, PointL), ) # (field, offset, class) of the fields which are objects themselves.
+
+
+class EpsData(EmfObject):
+    name = 'EpsData'
+    fields = ('SizeData', 'Version', 'Points')
+    __slots__ = fields
+    layout = struct.Struct('<II24s')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class GradientRectangle(EmfObject):
+    name = 'GradientRectangle'
+    fields = ('UpperLeft', 'LowerRight')
+    __slots__ = fields
+    layout = struct.Struct('<II')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class GradientTriangle(EmfObject):
+    name = 'GradientTriangle'
+    fields = ('Vertex1', 'Vertex2', 'Vertex3')
+    __slots__ = fields
+    layout = struct.Struct('<III')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class Header(EmfObject):
+    name = 'Header'
+    fields = ('Bounds', 'Frame', 'RecordSignature', 'Version', 'Bytes', 'Records', 'Handles', 'Reserved', 'nDescription', 'offDescription', 'nPalEntries', 'Device', 'Millimeters')
+    __slots__ = fields
+    layout = struct.Struct('<16s16sIIIIHHIII8s8s')
+    objects = (('Bounds', 0, RectL), ('Frame', 16, RectL), ('Device', 64, SizeL), ('Millimeters', 72, SizeL), ) # (field, offset, class) of the fields which are objects themselves.
+
+
+class HeaderExtension1(EmfObject):
+    name = 'HeaderExtension1'
+    fields = ('cbPixelFormat', 'offPixelFormat', 'bOpenGL')
+    __slots__ = fields
+    layout = struct.Struct('<III')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class HeaderExtension2(EmfObject):
+    name = 'HeaderExtension2'
+    fields = ('MicrometersX', 'MicrometersY')
+    __slots__ = fields
+    layout = struct.Struct('<II')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class LogBrushEx(EmfObject):
+    name = 'LogBrushEx'
+    fields = ('BrushStyle', 'Color', 'BrushHatch')
+    __slots__ = fields
+    layout = struct.Struct('<I4sI')
+    objects = (('Color', 4, ColorRef), ) # (field, offset, class) of the fields which are objects themselves.
+
+
+class LogFont(EmfObject):
+    name = 'LogFont'
+    fields = ('Height', 'Width', 'Escapement', 'Orientation', 'Weight', 'Italic', 'Underline', 'StrikeOut', 'CharSet', 'OutPrecision', 'ClipPrecision', 'Quality', 'PitchAndFamily', 'Facename')
+    __slots__ = fields
+    layout = struct.Struct('<iiiiiBBBBBBBB64s')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class LogFontEx(EmfObject):
+    name = 'LogFontEx'
+    fields = ('LogFont', 'FullName', 'Style', 'Script')
+    __slots__ = fields
+    layout = struct.Struct('<92s128s64s64s')
+    objects = (('LogFont', 0, LogFont), ) # (field, offset, class) of the fields which are objects themselves.
+
+
+class LogFontExDv(EmfObject):
+    name = 'LogFontExDv'
+    fields = ('LogFontEx',)
+    __slots__ = fields
+    layout = struct.Struct('<348s')
+    objects = (('LogFontEx', 0, LogFontEx), ) # (field, offset, class) of the fields which are objects themselves.
+
+
+class Panose(EmfObject):
+    name = 'Panose'
+    fields = ('FamilyType', 'SerifStyle', 'Weight', 'Proportion', 'Contrast', 'StrokeVariation', 'ArmStyle', 'Letterform', 'Midline', 'XHeight')
+    __slots__ = fields
+    layout = struct.Struct('<BBBBBBBBBB')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class LogFontPanose(EmfObject):
+    name = 'LogFontPanose'
+    fields = ('LogFont', 'FullName', 'Style', 'Version', 'StyleSize', 'Match', 'Reserved', 'VendorId', 'Culture', 'Panose', 'Padding')
+    __slots__ = fields
+    layout = struct.Struct('<92s128s64sIIIIII10sH')
+    objects = (('LogFont', 0, LogFont), ('Panose', 308, Panose), ) # (field, offset, class) of the fields which are objects themselves.
+
+
+class LogPalette(EmfObject):
+    name = 'LogPalette'
+    fields = ('Version', 'NumberOfEntries')
+    __slots__ = fields
+    layout = struct.Struct('<HH')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class LogPaletteEntry(EmfObject):
+    name = 'LogPaletteEntry'
+    fields = ('Reserved', 'Blue', 'Green', 'Red')
+    __slots__ = fields
+    layout = struct.Struct('<BBBB')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class LogPen(EmfObject):
+    name = 'LogPen'
+    fields = ('PenStyle', 'Width', 'ColorRef')
+    __slots__ = fields
+    layout = struct.Struct('<I8s4s')
+    objects = (('Width', 4, PointL), ('ColorRef', 12, ColorRef), ) # (field, offset, class) of the fields which are objects themselves.
+
+
+class LogPenEx(EmfObject):
+    name = 'LogPenEx'
+    fields = ('PenStyle', 'Width', 'BrushStyle', 'ColorRef', 'BrushHatch', 'NumStyleEntries')
+    __slots__ = fields
+    layout = struct.Struct('<III4sII')
+    objects = (('ColorRef', 12, ColorRef), ) # (field, offset, class) of the fields which are objects themselves.
+
+
+class PixelFormatDescriptor(EmfObject):
+    name = 'PixelFormatDescriptor'
+    fields = ('nSize', 'nVersion', 'dwFlags', 'iPixelType', 'cColorBits', 'cRedBits', 'cRedShift', 'cGreenBits', 'cGreenShift', 'cBlueBits', 'cBlueShift', 'cAlphaBits', 'cAlphaShift', 'cAccumBits', 'cAccumRedBits', 'cAccumGreenBits', 'cAccumBlueBits', 'cAccumAlphaBits', 'cDepthBits', 'cStencilBits', 'cAuxBuffers', 'iLayerType', 'bReserved', 'dwLayerMask', 'dwVisibleMask', 'dwDamageMask')
+    __slots__ = fields
+    layout = struct.Struct('<HHIBBBBBBBBBBBBBBBBBBBBIII')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class Point28_4(EmfObject):
+    name = 'Point28_4'
+    fields = ('x', 'y')
+    __slots__ = fields
+    layout = struct.Struct('<II')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class RegionDataHeader(EmfObject):
+    name = 'RegionDataHeader'
+    fields = ('Size', 'Type', 'CountRects', 'RgnSize', 'Bounds')
+    __slots__ = fields
+    layout = struct.Struct('<IIII16s')
+    objects = (('Bounds', 16, RectL), ) # (field, offset, class) of the fields which are objects themselves.
+
+
+class RegionData(EmfObject):
+    name = 'RegionData'
+    fields = ('RegionDataHeader',)
+    __slots__ = fields
+    layout = struct.Struct('<32s')
+    objects = (('RegionDataHeader', 0, RegionDataHeader), ) # (field, offset, class) of the fields which are objects themselves.
+
+
+class TriVertex(EmfObject):
+    name = 'TriVertex'
+    fields = ('x', 'y', 'Red', 'Green', 'Blue', 'Alpha')
+    __slots__ = fields
+    layout = struct.Struct('<iiHHHH')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class UniversalFontId(EmfObject):
+    name = 'UniversalFontId'
+    fields = ('Checksum', 'Index')
+    __slots__ = fields
+    layout = struct.Struct('<II')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class XForm(EmfObject):
+    name = 'XForm'
+    fields = ('M11', 'M12', 'M21', 'M22', 'Dx', 'Dy')
+    __slots__ = fields
+    layout = struct.Struct('<ffffff')
+    objects = () # (field, offset, class) of the fields which are objects themselves.
+
+
+class EMR_ALPHABLEND(Record):
     name = "EMR_ALPHABLEND"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'xDest', 'yDest', 'cxDest', 'cyDest', 'BLENDFUNCTION', 'xSrc', 'ySrc', 'XformSrc', 'BkColorSrc', 'UsageSrc', 'offBmiSrc', 'cbBmiSrc', 'offBitsSrc', 'cbBitsSrc', 'cxSrc', 'cySrc'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_ALPHABLEND {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_BITBLT:
-    format = ['4b', '4b', '16b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '24b', '4b', '4b', '4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4, 4, 4, 4, 4, 4, 4, 24, 4, 4, 4, 4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16siiiiIii24sIIIIIIii') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ('XformSrc', 52, XForm), ('BkColorSrc', 76, ColorRef), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('xDest', 24, 4), ('yDest', 28, 4), ('cxDest', 32, 4), ('cyDest', 36, 4), ('BLENDFUNCTION', 40, 4), ('xSrc', 44, 4), ('ySrc', 48, 4), ('XformSrc', 52, 24), ('BkColorSrc', 76, 4), ('UsageSrc', 80, 4), ('offBmiSrc', 84, 4), ('cbBmiSrc', 88, 4), ('offBitsSrc', 92, 4), ('cbBitsSrc', 96, 4), ('cxSrc', 100, 4), ('cySrc', 104, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('xDest', '<i4'), ('yDest', '<i4'), ('cxDest', '<i4'), ('cyDest', '<i4'), ('BLENDFUNCTION', '<u4'), ('xSrc', '<i4'), ('ySrc', '<i4'), ('XformSrc', 'u1', (24,)), ('BkColorSrc', '<u4'), ('UsageSrc', '<u4'), ('offBmiSrc', '<u4'), ('cbBmiSrc', '<u4'), ('offBitsSrc', '<u4'), ('cbBitsSrc', '<u4'), ('cxSrc', '<i4'), ('cySrc', '<i4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_BITBLT(Record):
     name = "EMR_BITBLT"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'xDest', 'yDest', 'cxDest', 'cyDest', 'BitBltRasterOperation', 'xSrc', 'ySrc', 'XformSrc', 'BkColorSrc', 'UsageSrc', 'offBmiSrc', 'cbBmiSrc', 'offBitsSrc', 'cbBitsSrc'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_BITBLT {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_MASKBLT:
-    format = ['4b', '4b', '16b', '4b', '4b', '4b', '4b', '4b', '2b', '4b', '4b', '24b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4, 4, 4, 4, 4, 4, 4, 24, 4, 4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16siiiiIii24sIIIIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ('XformSrc', 52, XForm), ('BkColorSrc', 76, ColorRef), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('xDest', 24, 4), ('yDest', 28, 4), ('cxDest', 32, 4), ('cyDest', 36, 4), ('BitBltRasterOperation', 40, 4), ('xSrc', 44, 4), ('ySrc', 48, 4), ('XformSrc', 52, 24), ('BkColorSrc', 76, 4), ('UsageSrc', 80, 4), ('offBmiSrc', 84, 4), ('cbBmiSrc', 88, 4), ('offBitsSrc', 92, 4), ('cbBitsSrc', 96, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('xDest', '<i4'), ('yDest', '<i4'), ('cxDest', '<i4'), ('cyDest', '<i4'), ('BitBltRasterOperation', '<u4'), ('xSrc', '<i4'), ('ySrc', '<i4'), ('XformSrc', 'u1', (24,)), ('BkColorSrc', '<u4'), ('UsageSrc', '<u4'), ('offBmiSrc', '<u4'), ('cbBmiSrc', '<u4'), ('offBitsSrc', '<u4'), ('cbBitsSrc', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_MASKBLT(Record):
     name = "EMR_MASKBLT"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'xDest', 'yDest', 'cxDest', 'cyDest', 'ROP4', 'Reserved', 'xSrc', 'ySrc', 'XformSrc', 'BkColorSrc', 'UsageSrc', 'offBmiSrc', 'cbBmiSrc', 'offBitsSrc', 'cbBitsSrc', 'xMask', 'yMask', 'UsageMask', 'offBmiMask', 'cbBmiMask', 'offBitsMask', 'cbBitsMask'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_MASKBLT {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_PLGBLT:
-    format = ['4b', '4b', '16b', '24b', '4b', '4b', '4b', '4b', '24b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4, 4, 4, 4, 4, 2, 4, 4, 24, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16siiiiIHii24sIIIIIIiiIIIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ('XformSrc', 54, XForm), ('BkColorSrc', 78, ColorRef), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('xDest', 24, 4), ('yDest', 28, 4), ('cxDest', 32, 4), ('cyDest', 36, 4), ('ROP4', 40, 4), ('Reserved', 44, 2), ('xSrc', 46, 4), ('ySrc', 50, 4), ('XformSrc', 54, 24), ('BkColorSrc', 78, 4), ('UsageSrc', 82, 4), ('offBmiSrc', 86, 4), ('cbBmiSrc', 90, 4), ('offBitsSrc', 94, 4), ('cbBitsSrc', 98, 4), ('xMask', 102, 4), ('yMask', 106, 4), ('UsageMask', 110, 4), ('offBmiMask', 114, 4), ('cbBmiMask', 118, 4), ('offBitsMask', 122, 4), ('cbBitsMask', 126, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('xDest', '<i4'), ('yDest', '<i4'), ('cxDest', '<i4'), ('cyDest', '<i4'), ('ROP4', '<u4'), ('Reserved', '<u2'), ('xSrc', '<i4'), ('ySrc', '<i4'), ('XformSrc', 'u1', (24,)), ('BkColorSrc', '<u4'), ('UsageSrc', '<u4'), ('offBmiSrc', '<u4'), ('cbBmiSrc', '<u4'), ('offBitsSrc', '<u4'), ('cbBitsSrc', '<u4'), ('xMask', '<i4'), ('yMask', '<i4'), ('UsageMask', '<u4'), ('offBmiMask', '<u4'), ('cbBmiMask', '<u4'), ('offBitsMask', '<u4'), ('cbBitsMask', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_PLGBLT(Record):
     name = "EMR_PLGBLT"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'aptlDest', 'xSrc', 'ySrc', 'cxSrc', 'cySrc', 'XformSrc', 'BkColorSrc', 'UsageSrc', 'offBmiSrc', 'cbBmiSrc', 'offBitsSrc', 'cbBitsSrc', 'xMask', 'yMask', 'UsageMask', 'offBmiMask', 'cbBmiMask', 'offBitsMask', 'cbBitsMask'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_PLGBLT {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETDIBITSTODEVICE:
-    format = ['4b', '4b', '16b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 24, 4, 4, 4, 4, 24, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16s24siiii24sIIIIIIiiIIIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ('XformSrc', 64, XForm), ('BkColorSrc', 88, ColorRef), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('aptlDest', 24, 24), ('xSrc', 48, 4), ('ySrc', 52, 4), ('cxSrc', 56, 4), ('cySrc', 60, 4), ('XformSrc', 64, 24), ('BkColorSrc', 88, 4), ('UsageSrc', 92, 4), ('offBmiSrc', 96, 4), ('cbBmiSrc', 100, 4), ('offBitsSrc', 104, 4), ('cbBitsSrc', 108, 4), ('xMask', 112, 4), ('yMask', 116, 4), ('UsageMask', 120, 4), ('offBmiMask', 124, 4), ('cbBmiMask', 128, 4), ('offBitsMask', 132, 4), ('cbBitsMask', 136, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('aptlDest', 'u1', (24,)), ('xSrc', '<i4'), ('ySrc', '<i4'), ('cxSrc', '<i4'), ('cySrc', '<i4'), ('XformSrc', 'u1', (24,)), ('BkColorSrc', '<u4'), ('UsageSrc', '<u4'), ('offBmiSrc', '<u4'), ('cbBmiSrc', '<u4'), ('offBitsSrc', '<u4'), ('cbBitsSrc', '<u4'), ('xMask', '<i4'), ('yMask', '<i4'), ('UsageMask', '<u4'), ('offBmiMask', '<u4'), ('cbBmiMask', '<u4'), ('offBitsMask', '<u4'), ('cbBitsMask', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETDIBITSTODEVICE(Record):
     name = "EMR_SETDIBITSTODEVICE"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'xDest', 'yDest', 'xSrc', 'ySrc', 'cxSrc', 'cySrc', 'offBmiSrc', 'cbBmiSrc', 'offBitsSrc', 'cbBitsSrc', 'UsageSrc', 'iStartScan', 'cScans'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETDIBITSTODEVICE {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_STRETCHBLT:
-    format = ['4b', '4b', '16b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '24b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16siiiiiiIIIIIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('xDest', 24, 4), ('yDest', 28, 4), ('xSrc', 32, 4), ('ySrc', 36, 4), ('cxSrc', 40, 4), ('cySrc', 44, 4), ('offBmiSrc', 48, 4), ('cbBmiSrc', 52, 4), ('offBitsSrc', 56, 4), ('cbBitsSrc', 60, 4), ('UsageSrc', 64, 4), ('iStartScan', 68, 4), ('cScans', 72, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('xDest', '<i4'), ('yDest', '<i4'), ('xSrc', '<i4'), ('ySrc', '<i4'), ('cxSrc', '<i4'), ('cySrc', '<i4'), ('offBmiSrc', '<u4'), ('cbBmiSrc', '<u4'), ('offBitsSrc', '<u4'), ('cbBitsSrc', '<u4'), ('UsageSrc', '<u4'), ('iStartScan', '<u4'), ('cScans', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_STRETCHBLT(Record):
     name = "EMR_STRETCHBLT"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'xDest', 'yDest', 'cxDest', 'cyDest', 'BitBltRasterOperation', 'xSrc', 'ySrc', 'XformSrc', 'BkColorSrc', 'UsageSrc', 'offBmiSrc', 'cbBmiSrc', 'offBitsSrc', 'cbBitsSrc', 'cxSrc', 'cySrc'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_STRETCHBLT {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_STRETCHDIBITS:
-    format = ['4b', '4b', '16b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4, 4, 4, 4, 4, 4, 4, 24, 4, 4, 4, 4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16siiiiIii24sIIIIIIii') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ('XformSrc', 52, XForm), ('BkColorSrc', 76, ColorRef), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('xDest', 24, 4), ('yDest', 28, 4), ('cxDest', 32, 4), ('cyDest', 36, 4), ('BitBltRasterOperation', 40, 4), ('xSrc', 44, 4), ('ySrc', 48, 4), ('XformSrc', 52, 24), ('BkColorSrc', 76, 4), ('UsageSrc', 80, 4), ('offBmiSrc', 84, 4), ('cbBmiSrc', 88, 4), ('offBitsSrc', 92, 4), ('cbBitsSrc', 96, 4), ('cxSrc', 100, 4), ('cySrc', 104, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('xDest', '<i4'), ('yDest', '<i4'), ('cxDest', '<i4'), ('cyDest', '<i4'), ('BitBltRasterOperation', '<u4'), ('xSrc', '<i4'), ('ySrc', '<i4'), ('XformSrc', 'u1', (24,)), ('BkColorSrc', '<u4'), ('UsageSrc', '<u4'), ('offBmiSrc', '<u4'), ('cbBmiSrc', '<u4'), ('offBitsSrc', '<u4'), ('cbBitsSrc', '<u4'), ('cxSrc', '<i4'), ('cySrc', '<i4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_STRETCHDIBITS(Record):
     name = "EMR_STRETCHDIBITS"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'xDest', 'yDest', 'xSrc', 'ySrc', 'cxSrc', 'cySrc', 'offBmiSrc', 'cbBmiSrc', 'offBitsSrc', 'cbBitsSrc', 'UsageSrc', 'BitBltRasterOperation', 'cxDest', 'cyDest'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_STRETCHDIBITS {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_TRANSPARENTBLT:
-    format = ['4b', '4b', '16b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '24b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16siiiiiiIIIIIIii') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('xDest', 24, 4), ('yDest', 28, 4), ('xSrc', 32, 4), ('ySrc', 36, 4), ('cxSrc', 40, 4), ('cySrc', 44, 4), ('offBmiSrc', 48, 4), ('cbBmiSrc', 52, 4), ('offBitsSrc', 56, 4), ('cbBitsSrc', 60, 4), ('UsageSrc', 64, 4), ('BitBltRasterOperation', 68, 4), ('cxDest', 72, 4), ('cyDest', 76, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('xDest', '<i4'), ('yDest', '<i4'), ('xSrc', '<i4'), ('ySrc', '<i4'), ('cxSrc', '<i4'), ('cySrc', '<i4'), ('offBmiSrc', '<u4'), ('cbBmiSrc', '<u4'), ('offBitsSrc', '<u4'), ('cbBitsSrc', '<u4'), ('UsageSrc', '<u4'), ('BitBltRasterOperation', '<u4'), ('cxDest', '<i4'), ('cyDest', '<i4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_TRANSPARENTBLT(Record):
     name = "EMR_TRANSPARENTBLT"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'xDest', 'yDest', 'cxDest', 'cyDest', 'TransparentColor', 'xSrc', 'ySrc', 'XformSrc', 'BkColorSrc', 'UsageSrc', 'offBmiSrc', 'cbBmiSrc', 'offBitsSrc', 'cbBitsSrc', 'cxSrc', 'cySrc'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_TRANSPARENTBLT {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_EXCLUDECLIPRECT:
-    format = ['4b', '4b', '16b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4, 4, 4, 4, 4, 4, 4, 24, 4, 4, 4, 4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16siiiiIii24sIIIIIIii') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ('TransparentColor', 40, ColorRef), ('XformSrc', 52, XForm), ('BkColorSrc', 76, ColorRef), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('xDest', 24, 4), ('yDest', 28, 4), ('cxDest', 32, 4), ('cyDest', 36, 4), ('TransparentColor', 40, 4), ('xSrc', 44, 4), ('ySrc', 48, 4), ('XformSrc', 52, 24), ('BkColorSrc', 76, 4), ('UsageSrc', 80, 4), ('offBmiSrc', 84, 4), ('cbBmiSrc', 88, 4), ('offBitsSrc', 92, 4), ('cbBitsSrc', 96, 4), ('cxSrc', 100, 4), ('cySrc', 104, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('xDest', '<i4'), ('yDest', '<i4'), ('cxDest', '<i4'), ('cyDest', '<i4'), ('TransparentColor', '<u4'), ('xSrc', '<i4'), ('ySrc', '<i4'), ('XformSrc', 'u1', (24,)), ('BkColorSrc', '<u4'), ('UsageSrc', '<u4'), ('offBmiSrc', '<u4'), ('cbBmiSrc', '<u4'), ('offBitsSrc', '<u4'), ('cbBitsSrc', '<u4'), ('cxSrc', '<i4'), ('cySrc', '<i4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_EXCLUDECLIPRECT(Record):
     name = "EMR_EXCLUDECLIPRECT"
     has_variable = False
     fields = ['Type', 'Size', 'Clip'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_EXCLUDECLIPRECT {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_EXTSELECTCLIPRGN:
-    format = ['4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16s') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Clip', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Clip', 8, 16),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Clip', 'u1', (16,))] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_EXTSELECTCLIPRGN(Record):
     name = "EMR_EXTSELECTCLIPRGN"
     has_variable = True
     fields = ['Type', 'Size', 'RgnDataSize', 'RegionMode'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_EXTSELECTCLIPRGN {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_INTERSECTCLIPRECT:
-    format = ['4b', '4b', '16b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('RgnDataSize', 8, 4), ('RegionMode', 12, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('RgnDataSize', '<u4'), ('RegionMode', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_INTERSECTCLIPRECT(Record):
     name = "EMR_INTERSECTCLIPRECT"
     has_variable = False
     fields = ['Type', 'Size', 'Clip'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_INTERSECTCLIPRECT {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_OFFSETCLIPRGN:
-    format = ['4b', '4b', '8b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16s') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Clip', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Clip', 8, 16),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Clip', 'u1', (16,))] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_OFFSETCLIPRGN(Record):
     name = "EMR_OFFSETCLIPRGN"
     has_variable = False
     fields = ['Type', 'Size', 'Offset'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_OFFSETCLIPRGN {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SELECTCLIPPATH:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 8) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIQ') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Offset', 8, PointL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Offset', 8, 8),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Offset', '<u8')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SELECTCLIPPATH(Record):
     name = "EMR_SELECTCLIPPATH"
     has_variable = True
     fields = ['Type', 'Size', 'RegionMode'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SELECTCLIPPATH {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_COMMENT:
-    format = ['4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('RegionMode', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('RegionMode', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_COMMENT(Record):
     name = "EMR_COMMENT"
     has_variable = True
-    fields = ['Type', 'Size'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_COMMENT {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_COMMENT_EMFPLUS:
-    format = ['4b', '4b', '4b']
+    fields = ['Type', 'Size', 'DataSize'] # These are the fields of this object.
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('DataSize', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('DataSize', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_COMMENT_EMFPLUS(Record):
     name = "EMR_COMMENT_EMFPLUS"
     has_variable = True
-    fields = ['Type', 'Size', 'CommentIdentifier'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_COMMENT_EMFPLUS {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_COMMENT_EMFSPOOL:
-    format = ['4b', '4b', '4b', '4b']
+    fields = ['Type', 'Size', 'DataSize', 'CommentIdentifier'] # These are the fields of this object.
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('DataSize', 8, 4), ('CommentIdentifier', 12, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('DataSize', '<u4'), ('CommentIdentifier', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_COMMENT_EMFSPOOL(Record):
     name = "EMR_COMMENT_EMFSPOOL"
     has_variable = True
-    fields = ['Type', 'Size', 'CommentIdentifier', 'EMFSpoolRecordIdentifier'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_COMMENT_EMFSPOOL {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_EOF:
-    format = ['4b', '4b', '4b', '4b', '4b']
+    fields = ['Type', 'Size', 'DataSize', 'CommentIdentifier', 'EMFSpoolRecordIdentifier'] # These are the fields of this object.
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('DataSize', 8, 4), ('CommentIdentifier', 12, 4), ('EMFSpoolRecordIdentifier', 16, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('DataSize', '<u4'), ('CommentIdentifier', '<u4'), ('EMFSpoolRecordIdentifier', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_COMMENT_BEGINGROUP(Record):
+    name = "EMR_COMMENT_BEGINGROUP"
+    has_variable = True
+    fields = ['Type', 'Size', 'DataSize', 'CommentIdentifier', 'PublicCommentIdentifier', 'Rectangle', 'nDescription'] # These are the fields of this object.
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4, 4, 16, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIIII16sI') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Rectangle', 20, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('DataSize', 8, 4), ('CommentIdentifier', 12, 4), ('PublicCommentIdentifier', 16, 4), ('Rectangle', 20, 16), ('nDescription', 36, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('DataSize', '<u4'), ('CommentIdentifier', '<u4'), ('PublicCommentIdentifier', '<u4'), ('Rectangle', 'u1', (16,)), ('nDescription', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_COMMENT_ENDGROUP(Record):
+    name = "EMR_COMMENT_ENDGROUP"
+    has_variable = False
+    fields = ['Type', 'Size', 'DataSize', 'CommentIdentifier', 'PublicCommentIdentifier'] # These are the fields of this object.
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('DataSize', 8, 4), ('CommentIdentifier', 12, 4), ('PublicCommentIdentifier', 16, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('DataSize', '<u4'), ('CommentIdentifier', '<u4'), ('PublicCommentIdentifier', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_COMMENT_MULTIFORMATS(Record):
+    name = "EMR_COMMENT_MULTIFORMATS"
+    has_variable = True
+    fields = ['Type', 'Size', 'DataSize', 'CommentIdentifier', 'PublicCommentIdentifier', 'OutputRect', 'CountFormats'] # These are the fields of this object.
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4, 4, 16, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIIII16sI') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('OutputRect', 20, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('DataSize', 8, 4), ('CommentIdentifier', 12, 4), ('PublicCommentIdentifier', 16, 4), ('OutputRect', 20, 16), ('CountFormats', 36, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('DataSize', '<u4'), ('CommentIdentifier', '<u4'), ('PublicCommentIdentifier', '<u4'), ('OutputRect', 'u1', (16,)), ('CountFormats', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_COMMENT_WINDOWS_METAFILE(Record):
+    name = "EMR_COMMENT_WINDOWS_METAFILE"
+    has_variable = True
+    fields = ['Type', 'Size', 'DataSize', 'CommentIdentifier', 'PublicCommentIdentifier', 'Version', 'Reserved', 'Checksum', 'Flags', 'WinMetafileSize'] # These are the fields of this object.
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4, 4, 2, 2, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIIIIHHIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('DataSize', 8, 4), ('CommentIdentifier', 12, 4), ('PublicCommentIdentifier', 16, 4), ('Version', 20, 2), ('Reserved', 22, 2), ('Checksum', 24, 4), ('Flags', 28, 4), ('WinMetafileSize', 32, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('DataSize', '<u4'), ('CommentIdentifier', '<u4'), ('PublicCommentIdentifier', '<u4'), ('Version', '<u2'), ('Reserved', '<u2'), ('Checksum', '<u4'), ('Flags', '<u4'), ('WinMetafileSize', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_EOF(Record):
     name = "EMR_EOF"
     has_variable = True
     fields = ['Type', 'Size', 'nPalEntries', 'offPalEntries', 'SizeLast'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_EOF {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_ANGLEARC:
-    format = ['4b', '4b', '8b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('nPalEntries', 8, 4), ('offPalEntries', 12, 4), ('SizeLast', 16, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('nPalEntries', '<u4'), ('offPalEntries', '<u4'), ('SizeLast', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_ANGLEARC(Record):
     name = "EMR_ANGLEARC"
     has_variable = False
     fields = ['Type', 'Size', 'Center', 'Radius', 'StartAngle', 'SweepAngle'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_ANGLEARC {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_ARC:
-    format = ['4b', '4b', '16b', '8b', '8b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 8, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIQIff') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Center', 8, PointL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Center', 8, 8), ('Radius', 16, 4), ('StartAngle', 20, 4), ('SweepAngle', 24, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Center', '<u8'), ('Radius', '<u4'), ('StartAngle', '<f4'), ('SweepAngle', '<f4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_ARC(Record):
     name = "EMR_ARC"
     has_variable = False
     fields = ['Type', 'Size', 'Box', 'Start', 'End'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_ARC {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_ARCTO:
-    format = ['4b', '4b', '16b', '8b', '8b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 8, 8) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sQQ') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Box', 8, RectL), ('Start', 24, PointL), ('End', 32, PointL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Box', 8, 16), ('Start', 24, 8), ('End', 32, 8)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Box', 'u1', (16,)), ('Start', '<u8'), ('End', '<u8')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_ARCTO(Record):
     name = "EMR_ARCTO"
     has_variable = False
     fields = ['Type', 'Size', 'Box', 'Start', 'End'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_ARCTO {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_CHORD:
-    format = ['4b', '4b', '16b', '8b', '8b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 8, 8) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sQQ') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Box', 8, RectL), ('Start', 24, PointL), ('End', 32, PointL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Box', 8, 16), ('Start', 24, 8), ('End', 32, 8)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Box', 'u1', (16,)), ('Start', '<u8'), ('End', '<u8')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_CHORD(Record):
     name = "EMR_CHORD"
     has_variable = False
     fields = ['Type', 'Size', 'Box', 'Start', 'End'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_CHORD {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_ELLIPSE:
-    format = ['4b', '4b', '16b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 8, 8) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sQQ') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Box', 8, RectL), ('Start', 24, PointL), ('End', 32, PointL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Box', 8, 16), ('Start', 24, 8), ('End', 32, 8)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Box', 'u1', (16,)), ('Start', '<u8'), ('End', '<u8')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_ELLIPSE(Record):
     name = "EMR_ELLIPSE"
     has_variable = False
     fields = ['Type', 'Size', 'Box'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_ELLIPSE {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_EXTFLOODFILL:
-    format = ['4b', '4b', '8b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16s') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Box', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Box', 8, 16),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Box', 'u1', (16,))] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_EXTFLOODFILL(Record):
     name = "EMR_EXTFLOODFILL"
     has_variable = False
     fields = ['Type', 'Size', 'Start', 'Color', 'FloodFillMode'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_EXTFLOODFILL {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_EXTTEXTOUTA:
-    format = ['4b', '4b', '16b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 8, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIQII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Start', 8, PointL), ('Color', 16, ColorRef), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Start', 8, 8), ('Color', 16, 4), ('FloodFillMode', 20, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Start', '<u8'), ('Color', '<u4'), ('FloodFillMode', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_EXTTEXTOUTA(Record):
     name = "EMR_EXTTEXTOUTA"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'iGraphicsMode', 'exScale', 'eyScale'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_EXTTEXTOUTA {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_EXTTEXTOUTW:
-    format = ['4b', '4b', '16b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sIff') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('iGraphicsMode', 24, 4), ('exScale', 28, 4), ('eyScale', 32, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('iGraphicsMode', '<u4'), ('exScale', '<f4'), ('eyScale', '<f4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_EXTTEXTOUTW(Record):
     name = "EMR_EXTTEXTOUTW"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'iGraphicsMode', 'exScale', 'eyScale'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_EXTTEXTOUTW {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_FILLPATH:
-    format = ['4b', '4b', '16b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sIff') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('iGraphicsMode', 24, 4), ('exScale', 28, 4), ('eyScale', 32, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('iGraphicsMode', '<u4'), ('exScale', '<f4'), ('eyScale', '<f4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_FILLPATH(Record):
     name = "EMR_FILLPATH"
     has_variable = False
     fields = ['Type', 'Size', 'Bounds'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_FILLPATH {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_FILLRGN:
-    format = ['4b', '4b', '16b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16s') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,))] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_FILLRGN(Record):
     name = "EMR_FILLRGN"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'RgnDataSize', 'ihBrush'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_FILLRGN {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_FRAMERGN:
-    format = ['4b', '4b', '16b', '4b', '4b', '4b', '4b']
+    arrays = (('RgnData', 'RgnDataSize', 'u1', 1),) # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('RgnDataSize', 24, 4), ('ihBrush', 28, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('RgnDataSize', '<u4'), ('ihBrush', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_FRAMERGN(Record):
     name = "EMR_FRAMERGN"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'RgnDataSize', 'ihBrush', 'Width', 'Height'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_FRAMERGN {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_GRADIENTFILL:
-    format = ['4b', '4b', '16b', '4b', '4b', '4b']
+    arrays = (('RgnData', 'RgnDataSize', 'u1', 1),) # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sIIii') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('RgnDataSize', 24, 4), ('ihBrush', 28, 4), ('Width', 32, 4), ('Height', 36, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('RgnDataSize', '<u4'), ('ihBrush', '<u4'), ('Width', '<i4'), ('Height', '<i4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_GRADIENTFILL(Record):
     name = "EMR_GRADIENTFILL"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'nVer', 'nTri', 'ulMode'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_GRADIENTFILL {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_LINETO:
-    format = ['4b', '4b', '8b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('nVer', 24, 4), ('nTri', 28, 4), ('ulMode', 32, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('nVer', '<u4'), ('nTri', '<u4'), ('ulMode', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_LINETO(Record):
     name = "EMR_LINETO"
     has_variable = False
     fields = ['Type', 'Size', 'Point'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_LINETO {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_PAINTRGN:
-    format = ['4b', '4b', '16b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 8) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIQ') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Point', 8, PointL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Point', 8, 8),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Point', '<u8')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_PAINTRGN(Record):
     name = "EMR_PAINTRGN"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'RgnDataSize'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_PAINTRGN {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_PIE:
-    format = ['4b', '4b', '16b', '8b', '8b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sI') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('RgnDataSize', 24, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('RgnDataSize', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_PIE(Record):
     name = "EMR_PIE"
     has_variable = False
     fields = ['Type', 'Size', 'Box', 'Start', 'End'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_PIE {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_POLYBEZIER:
-    format = ['4b', '4b', '16b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 8, 8) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sQQ') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Box', 8, RectL), ('Start', 24, PointL), ('End', 32, PointL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Box', 8, 16), ('Start', 24, 8), ('End', 32, 8)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Box', 'u1', (16,)), ('Start', '<u8'), ('End', '<u8')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_POLYBEZIER(Record):
     name = "EMR_POLYBEZIER"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'Count'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_POLYBEZIER {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_POLYBEZIER16:
-    format = ['4b', '4b', '16b', '4b']
+    arrays = (('aPoints', 'Count', '<i4', 2),) # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sI') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('Count', 24, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('Count', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_POLYBEZIER16(Record):
     name = "EMR_POLYBEZIER16"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'Count'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_POLYBEZIER16 {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_POLYBEZIERTO:
-    format = ['4b', '4b', '16b', '4b']
+    arrays = (('aPoints', 'Count', '<i2', 2),) # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sI') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('Count', 24, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('Count', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_POLYBEZIERTO(Record):
     name = "EMR_POLYBEZIERTO"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'Count'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_POLYBEZIERTO {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_POLYBEZIERTO16:
-    format = ['4b', '4b', '16b', '4b']
+    arrays = (('aPoints', 'Count', '<i4', 2),) # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sI') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('Count', 24, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('Count', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_POLYBEZIERTO16(Record):
     name = "EMR_POLYBEZIERTO16"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'Count'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_POLYBEZIERTO16 {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_POLYDRAW:
-    format = ['4b', '4b', '16b', '4b']
+    arrays = (('aPoints', 'Count', '<i2', 2),) # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sI') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('Count', 24, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('Count', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_POLYDRAW(Record):
     name = "EMR_POLYDRAW"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'Count'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_POLYDRAW {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_POLYDRAW16:
-    format = ['4b', '4b', '16b', '4b']
+    arrays = (('aPoints', 'Count', '<i4', 2), ('abTypes', 'Count', 'u1', 1)) # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sI') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('Count', 24, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('Count', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_POLYDRAW16(Record):
     name = "EMR_POLYDRAW16"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'Count'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_POLYDRAW16 {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_POLYGON:
-    format = ['4b', '4b', '16b', '4b']
+    arrays = (('aPoints', 'Count', '<i2', 2), ('abTypes', 'Count', 'u1', 1)) # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sI') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('Count', 24, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('Count', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_POLYGON(Record):
     name = "EMR_POLYGON"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'Count'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_POLYGON {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_POLYGON16:
-    format = ['4b', '4b', '16b', '4b']
+    arrays = (('aPoints', 'Count', '<i4', 2),) # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sI') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('Count', 24, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('Count', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_POLYGON16(Record):
     name = "EMR_POLYGON16"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'Count'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_POLYGON16 {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_POLYLINE:
-    format = ['4b', '4b', '16b', '4b']
+    arrays = (('aPoints', 'Count', '<i2', 2),) # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sI') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('Count', 24, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('Count', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_POLYLINE(Record):
     name = "EMR_POLYLINE"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'Count'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_POLYLINE {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_POLYLINE16:
-    format = ['4b', '4b', '16b', '4b']
+    arrays = (('aPoints', 'Count', '<i4', 2),) # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sI') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('Count', 24, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('Count', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_POLYLINE16(Record):
     name = "EMR_POLYLINE16"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'Count'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_POLYLINE16 {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_POLYLINETO:
-    format = ['4b', '4b', '16b', '4b']
+    arrays = (('aPoints', 'Count', '<i2', 2),) # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sI') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('Count', 24, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('Count', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_POLYLINETO(Record):
     name = "EMR_POLYLINETO"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'Count'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_POLYLINETO {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_POLYLINETO16:
-    format = ['4b', '4b', '16b', '4b']
+    arrays = (('aPoints', 'Count', '<i4', 2),) # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sI') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('Count', 24, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('Count', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_POLYLINETO16(Record):
     name = "EMR_POLYLINETO16"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'Count'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_POLYLINETO16 {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_POLYPOLYGON:
-    format = ['4b', '4b', '16b', '4b', '4b']
+    arrays = (('aPoints', 'Count', '<i2', 2),) # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sI') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('Count', 24, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('Count', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_POLYPOLYGON(Record):
     name = "EMR_POLYPOLYGON"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'NumberOfPolygons', 'Count'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_POLYPOLYGON {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_POLYPOLYGON16:
-    format = ['4b', '4b', '16b', '4b', '4b']
+    arrays = (('PolygonPointCount', 'NumberOfPolygons', '<u4', 1), ('aPoints', 'Count', '<i4', 2)) # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('NumberOfPolygons', 24, 4), ('Count', 28, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('NumberOfPolygons', '<u4'), ('Count', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_POLYPOLYGON16(Record):
     name = "EMR_POLYPOLYGON16"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'NumberOfPolygons', 'Count'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_POLYPOLYGON16 {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_POLYPOLYLINE:
-    format = ['4b', '4b', '16b', '4b', '4b']
+    arrays = (('PolygonPointCount', 'NumberOfPolygons', '<u4', 1), ('aPoints', 'Count', '<i2', 2)) # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('NumberOfPolygons', 24, 4), ('Count', 28, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('NumberOfPolygons', '<u4'), ('Count', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_POLYPOLYLINE(Record):
     name = "EMR_POLYPOLYLINE"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'NumberOfPolylines', 'Count'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_POLYPOLYLINE {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_POLYPOLYLINE16:
-    format = ['4b', '4b', '16b', '4b', '4b']
+    arrays = (('aPolylinePointCount', 'NumberOfPolylines', '<u4', 1), ('aPoints', 'Count', '<i4', 2)) # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('NumberOfPolylines', 24, 4), ('Count', 28, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('NumberOfPolylines', '<u4'), ('Count', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_POLYPOLYLINE16(Record):
     name = "EMR_POLYPOLYLINE16"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'NumberOfPolylines', 'Count'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_POLYPOLYLINE16 {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_POLYTEXTOUTA:
-    format = ['4b', '4b', '16b', '4b', '4b', '4b', '4b']
+    arrays = (('PolylinePointCount', 'NumberOfPolylines', '<u4', 1), ('aPoints', 'Count', '<i2', 2)) # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('NumberOfPolylines', 24, 4), ('Count', 28, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('NumberOfPolylines', '<u4'), ('Count', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_POLYTEXTOUTA(Record):
     name = "EMR_POLYTEXTOUTA"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'iGraphicsMode', 'exScale', 'eyScale', 'cStrings'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_POLYTEXTOUTA {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_POLYTEXTOUTW:
-    format = ['4b', '4b', '16b', '4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sIffI') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('iGraphicsMode', 24, 4), ('exScale', 28, 4), ('eyScale', 32, 4), ('cStrings', 36, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('iGraphicsMode', '<u4'), ('exScale', '<f4'), ('eyScale', '<f4'), ('cStrings', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_POLYTEXTOUTW(Record):
     name = "EMR_POLYTEXTOUTW"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'iGraphicsMode', 'exScale', 'eyScale', 'cStrings'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_POLYTEXTOUTW {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_RECTANGLE:
-    format = ['4b', '4b', '16b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sIffI') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('iGraphicsMode', 24, 4), ('exScale', 28, 4), ('eyScale', 32, 4), ('cStrings', 36, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('iGraphicsMode', '<u4'), ('exScale', '<f4'), ('eyScale', '<f4'), ('cStrings', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_RECTANGLE(Record):
     name = "EMR_RECTANGLE"
     has_variable = False
     fields = ['Type', 'Size', 'Box'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_RECTANGLE {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_ROUNDRECT:
-    format = ['4b', '4b', '16b', '8b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16s') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Box', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Box', 8, 16),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Box', 'u1', (16,))] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_ROUNDRECT(Record):
     name = "EMR_ROUNDRECT"
     has_variable = False
     fields = ['Type', 'Size', 'Box', 'Corner'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_ROUNDRECT {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETPIXELV:
-    format = ['4b', '4b', '8b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 8) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sQ') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Box', 8, RectL), ('Corner', 24, SizeL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Box', 8, 16), ('Corner', 24, 8)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Box', 'u1', (16,)), ('Corner', '<u8')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETPIXELV(Record):
     name = "EMR_SETPIXELV"
     has_variable = False
     fields = ['Type', 'Size', 'Pixel', 'Color'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETPIXELV {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SMALLTEXTOUT:
-    format = ['4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 8, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIQI') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Pixel', 8, PointL), ('Color', 16, ColorRef), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Pixel', 8, 8), ('Color', 16, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Pixel', '<u8'), ('Color', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SMALLTEXTOUT(Record):
     name = "EMR_SMALLTEXTOUT"
     has_variable = True
     fields = ['Type', 'Size', 'x', 'y', 'cChars', 'fuOptions', 'iGraphicsMode', 'exScale', 'eyScale'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SMALLTEXTOUT {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_STROKEANDFILLPATH:
-    format = ['4b', '4b', '16b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4, 4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIiiIIIff') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('x', 8, 4), ('y', 12, 4), ('cChars', 16, 4), ('fuOptions', 20, 4), ('iGraphicsMode', 24, 4), ('exScale', 28, 4), ('eyScale', 32, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('x', '<i4'), ('y', '<i4'), ('cChars', '<u4'), ('fuOptions', '<u4'), ('iGraphicsMode', '<u4'), ('exScale', '<f4'), ('eyScale', '<f4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_STROKEANDFILLPATH(Record):
     name = "EMR_STROKEANDFILLPATH"
     has_variable = False
     fields = ['Type', 'Size', 'Bounds'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_STROKEANDFILLPATH {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_STROKEPATH:
-    format = ['4b', '4b', '16b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16s') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,))] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_STROKEPATH(Record):
     name = "EMR_STROKEPATH"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_STROKEPATH {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_DRAWESCAPE:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16s') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,))] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_DRAWESCAPE(Record):
     name = "EMR_DRAWESCAPE"
     has_variable = True
     fields = ['Type', 'Size', 'cjIn'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_DRAWESCAPE {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_EXTESCAPE:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('cjIn', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('cjIn', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_EXTESCAPE(Record):
     name = "EMR_EXTESCAPE"
     has_variable = True
     fields = ['Type', 'Size', 'cjIn'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_EXTESCAPE {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_NAMEDESCAPE:
-    format = ['4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('cjIn', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('cjIn', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_NAMEDESCAPE(Record):
     name = "EMR_NAMEDESCAPE"
     has_variable = True
     fields = ['Type', 'Size', 'cjDriver', 'cjIn'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_NAMEDESCAPE {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_CREATEBRUSHINDIRECT:
-    format = ['4b', '4b', '4b', '12b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('cjDriver', 8, 4), ('cjIn', 12, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('cjDriver', '<u4'), ('cjIn', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_CREATEBRUSHINDIRECT(Record):
     name = "EMR_CREATEBRUSHINDIRECT"
     has_variable = False
     fields = ['Type', 'Size', 'ihBrush', 'LogBrush'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_CREATEBRUSHINDIRECT {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_CREATECOLORSPACE:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 12) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III12s') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('LogBrush', 12, LogBrushEx), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ihBrush', 8, 4), ('LogBrush', 12, 12)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ihBrush', '<u4'), ('LogBrush', 'u1', (12,))] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_CREATECOLORSPACE(Record):
     name = "EMR_CREATECOLORSPACE"
     has_variable = True
     fields = ['Type', 'Size', 'ihCS'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_CREATECOLORSPACE {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_CREATECOLORSPACEW:
-    format = ['4b', '4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ihCS', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ihCS', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_CREATECOLORSPACEW(Record):
     name = "EMR_CREATECOLORSPACEW"
     has_variable = True
     fields = ['Type', 'Size', 'ihCS', 'dwFlags', 'cbData'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_CREATECOLORSPACEW {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_CREATEDIBPATTERNBRUSHPT:
-    format = ['4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ihCS', 8, 4), ('dwFlags', 12, 4), ('cbData', 16, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ihCS', '<u4'), ('dwFlags', '<u4'), ('cbData', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_CREATEDIBPATTERNBRUSHPT(Record):
     name = "EMR_CREATEDIBPATTERNBRUSHPT"
     has_variable = True
     fields = ['Type', 'Size', 'ihBrush', 'Usage', 'offBmi', 'cbBmi', 'offBits', 'cbBits'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_CREATEDIBPATTERNBRUSHPT {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_CREATEMONOBRUSH:
-    format = ['4b', '4b', '4b', '4b', '4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIIIIIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ihBrush', 8, 4), ('Usage', 12, 4), ('offBmi', 16, 4), ('cbBmi', 20, 4), ('offBits', 24, 4), ('cbBits', 28, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ihBrush', '<u4'), ('Usage', '<u4'), ('offBmi', '<u4'), ('cbBmi', '<u4'), ('offBits', '<u4'), ('cbBits', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_CREATEMONOBRUSH(Record):
     name = "EMR_CREATEMONOBRUSH"
     has_variable = True
     fields = ['Type', 'Size', 'ihBrush', 'Usage', 'offBmi', 'cbBmi', 'offBits', 'cbBits'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_CREATEMONOBRUSH {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_CREATEPALETTE:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIIIIIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ihBrush', 8, 4), ('Usage', 12, 4), ('offBmi', 16, 4), ('cbBmi', 20, 4), ('offBits', 24, 4), ('cbBits', 28, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ihBrush', '<u4'), ('Usage', '<u4'), ('offBmi', '<u4'), ('cbBmi', '<u4'), ('offBits', '<u4'), ('cbBits', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_CREATEPALETTE(Record):
     name = "EMR_CREATEPALETTE"
     has_variable = True
     fields = ['Type', 'Size', 'ihPal'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_CREATEPALETTE {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_CREATEPEN:
-    format = ['4b', '4b', '4b', '16b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ihPal', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ihPal', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_CREATEPEN(Record):
     name = "EMR_CREATEPEN"
     has_variable = False
     fields = ['Type', 'Size', 'ihPen', 'LogPen'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_CREATEPEN {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_EXTCREATEFONTINDIRECTW:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 16) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III16s') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('LogPen', 12, LogPen), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ihPen', 8, 4), ('LogPen', 12, 16)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ihPen', '<u4'), ('LogPen', 'u1', (16,))] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_EXTCREATEFONTINDIRECTW(Record):
     name = "EMR_EXTCREATEFONTINDIRECTW"
     has_variable = True
     fields = ['Type', 'Size', 'ihFonts'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_EXTCREATEFONTINDIRECTW {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_EXTCREATEPEN:
-    format = ['4b', '4b', '4b', '4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ihFonts', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ihFonts', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_EXTCREATEPEN(Record):
     name = "EMR_EXTCREATEPEN"
     has_variable = True
     fields = ['Type', 'Size', 'ihPen', 'offBmi', 'cbBmi', 'offBits', 'cbBits'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_EXTCREATEPEN {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_COLORCORRECTPALETTE:
-    format = ['4b', '4b', '4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIIIIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ihPen', 8, 4), ('offBmi', 12, 4), ('cbBmi', 16, 4), ('offBits', 20, 4), ('cbBits', 24, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ihPen', '<u4'), ('offBmi', '<u4'), ('cbBmi', '<u4'), ('offBits', '<u4'), ('cbBits', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_COLORCORRECTPALETTE(Record):
     name = "EMR_COLORCORRECTPALETTE"
     has_variable = False
     fields = ['Type', 'Size', 'ihPalette', 'nFirstEntry', 'nPalEntries', 'nReserved'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_COLORCORRECTPALETTE {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_DELETECOLORSPACE:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIIIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ihPalette', 8, 4), ('nFirstEntry', 12, 4), ('nPalEntries', 16, 4), ('nReserved', 20, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ihPalette', '<u4'), ('nFirstEntry', '<u4'), ('nPalEntries', '<u4'), ('nReserved', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_DELETECOLORSPACE(Record):
     name = "EMR_DELETECOLORSPACE"
     has_variable = False
     fields = ['Type', 'Size', 'ihCS'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_DELETECOLORSPACE {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_DELETEOBJECT:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ihCS', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ihCS', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_DELETEOBJECT(Record):
     name = "EMR_DELETEOBJECT"
     has_variable = False
     fields = ['Type', 'Size', 'ihObject'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_DELETEOBJECT {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_RESIZEPALETTE:
-    format = ['4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ihObject', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ihObject', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_RESIZEPALETTE(Record):
     name = "EMR_RESIZEPALETTE"
     has_variable = False
     fields = ['Type', 'Size', 'ihPal', 'NumberOfEntries'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_RESIZEPALETTE {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SELECTOBJECT:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ihPal', 8, 4), ('NumberOfEntries', 12, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ihPal', '<u4'), ('NumberOfEntries', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SELECTOBJECT(Record):
     name = "EMR_SELECTOBJECT"
     has_variable = False
     fields = ['Type', 'Size', 'ihObject'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SELECTOBJECT {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SELECTPALETTE:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ihObject', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ihObject', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SELECTPALETTE(Record):
     name = "EMR_SELECTPALETTE"
     has_variable = False
     fields = ['Type', 'Size', 'ihPal'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SELECTPALETTE {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETCOLORSPACE:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ihPal', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ihPal', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETCOLORSPACE(Record):
     name = "EMR_SETCOLORSPACE"
     has_variable = False
     fields = ['Type', 'Size', 'ihCS'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETCOLORSPACE {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETPALETTEENTRIES:
-    format = ['4b', '4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ihCS', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ihCS', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETPALETTEENTRIES(Record):
     name = "EMR_SETPALETTEENTRIES"
     has_variable = True
     fields = ['Type', 'Size', 'ihPal', 'Start', 'NumberofEntries'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETPALETTEENTRIES {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_GLSBOUNDEDRECORD:
-    format = ['4b', '4b', '16b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ihPal', 8, 4), ('Start', 12, 4), ('NumberofEntries', 16, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ihPal', '<u4'), ('Start', '<u4'), ('NumberofEntries', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_GLSBOUNDEDRECORD(Record):
     name = "EMR_GLSBOUNDEDRECORD"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'cbData'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_GLSBOUNDEDRECORD {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_GLSRECORD:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sI') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('cbData', 24, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('cbData', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_GLSRECORD(Record):
     name = "EMR_GLSRECORD"
     has_variable = True
     fields = ['Type', 'Size', 'cbData'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_GLSRECORD {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_COLORMATCHTOTARGETW:
-    format = ['4b', '4b', '4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('cbData', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('cbData', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_COLORMATCHTOTARGETW(Record):
     name = "EMR_COLORMATCHTOTARGETW"
     has_variable = True
     fields = ['Type', 'Size', 'dwAction', 'dwFlags', 'cbName', 'cbData'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_COLORMATCHTOTARGETW {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_FORCEUFIMAPPING:
-    format = ['4b', '4b', '8b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIIIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('dwAction', 8, 4), ('dwFlags', 12, 4), ('cbName', 16, 4), ('cbData', 20, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('dwAction', '<u4'), ('dwFlags', '<u4'), ('cbName', '<u4'), ('cbData', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_FORCEUFIMAPPING(Record):
     name = "EMR_FORCEUFIMAPPING"
     has_variable = False
     fields = ['Type', 'Size', 'ufi'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_FORCEUFIMAPPING {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_INVERTRGN:
-    format = ['4b', '4b', '16b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 8) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIQ') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ufi', 8, 8),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ufi', '<u8')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_INVERTRGN(Record):
     name = "EMR_INVERTRGN"
     has_variable = True
     fields = ['Type', 'Size', 'Bounds', 'RgnDataSize'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_INVERTRGN {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_MOVETOEX:
-    format = ['4b', '4b', '8b']
+    arrays = (('RgnData', 'RgnDataSize', 'u1', 1),) # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 16, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16sI') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('RgnDataSize', 24, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('RgnDataSize', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_MOVETOEX(Record):
     name = "EMR_MOVETOEX"
     has_variable = False
     fields = ['Type', 'Size', 'Offset'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_MOVETOEX {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_PIXELFORMAT:
-    format = ['4b', '4b', '40b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 8) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIQ') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Offset', 8, PointL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Offset', 8, 8),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Offset', '<u8')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_PIXELFORMAT(Record):
     name = "EMR_PIXELFORMAT"
     has_variable = False
     fields = ['Type', 'Size', 'pfd'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_PIXELFORMAT {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_RESTOREDC:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 40) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II40s') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('pfd', 8, PixelFormatDescriptor), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('pfd', 8, 40),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('pfd', 'u1', (40,))] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_RESTOREDC(Record):
     name = "EMR_RESTOREDC"
     has_variable = False
     fields = ['Type', 'Size', 'SavedDC'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_RESTOREDC {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SCALEVIEWPORTEXTEX:
-    format = ['4b', '4b', '4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIi') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('SavedDC', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('SavedDC', '<i4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SCALEVIEWPORTEXTEX(Record):
     name = "EMR_SCALEVIEWPORTEXTEX"
     has_variable = False
     fields = ['Type', 'Size', 'xNum', 'xDenom', 'yNum', 'yDenom'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SCALEVIEWPORTEXTEX {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SCALEWINDOWEXTEX:
-    format = ['4b', '4b', '4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIiiii') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('xNum', 8, 4), ('xDenom', 12, 4), ('yNum', 16, 4), ('yDenom', 20, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('xNum', '<i4'), ('xDenom', '<i4'), ('yNum', '<i4'), ('yDenom', '<i4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SCALEWINDOWEXTEX(Record):
     name = "EMR_SCALEWINDOWEXTEX"
     has_variable = False
     fields = ['Type', 'Size', 'xNum', 'xDenom', 'yNum', 'yDenom'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SCALEWINDOWEXTEX {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETARCDIRECTION:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIiiii') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('xNum', 8, 4), ('xDenom', 12, 4), ('yNum', 16, 4), ('yDenom', 20, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('xNum', '<i4'), ('xDenom', '<i4'), ('yNum', '<i4'), ('yDenom', '<i4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETARCDIRECTION(Record):
     name = "EMR_SETARCDIRECTION"
     has_variable = False
     fields = ['Type', 'Size', 'ArcDirection'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETARCDIRECTION {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETBKCOLOR:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ArcDirection', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ArcDirection', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETBKCOLOR(Record):
     name = "EMR_SETBKCOLOR"
     has_variable = False
     fields = ['Type', 'Size', 'Color'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETBKCOLOR {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETBKMODE:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Color', 8, ColorRef), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Color', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Color', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETBKMODE(Record):
     name = "EMR_SETBKMODE"
     has_variable = False
     fields = ['Type', 'Size', 'BackgroundMode'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETBKMODE {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETBRUSHORGEX:
-    format = ['4b', '4b', '8b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('BackgroundMode', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('BackgroundMode', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETBRUSHORGEX(Record):
     name = "EMR_SETBRUSHORGEX"
     has_variable = False
     fields = ['Type', 'Size', 'Origin'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETBRUSHORGEX {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETCOLORADJUSTMENT:
-    format = ['4b', '4b', '24b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 8) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIQ') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Origin', 8, PointL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Origin', 8, 8),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Origin', '<u8')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETCOLORADJUSTMENT(Record):
     name = "EMR_SETCOLORADJUSTMENT"
     has_variable = False
     fields = ['Type', 'Size', 'ColorAdjustment'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETCOLORADJUSTMENT {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETICMMODE:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 24) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II24s') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('ColorAdjustment', 8, ColorAdjustment), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ColorAdjustment', 8, 24),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ColorAdjustment', 'u1', (24,))] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETICMMODE(Record):
     name = "EMR_SETICMMODE"
     has_variable = False
     fields = ['Type', 'Size', 'ICMMode'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETICMMODE {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETICMPROFILEA:
-    format = ['4b', '4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ICMMode', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ICMMode', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETICMPROFILEA(Record):
     name = "EMR_SETICMPROFILEA"
     has_variable = True
     fields = ['Type', 'Size', 'dwFlags', 'cbName', 'cbData'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETICMPROFILEA {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETICMPROFILEW:
-    format = ['4b', '4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('dwFlags', 8, 4), ('cbName', 12, 4), ('cbData', 16, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('dwFlags', '<u4'), ('cbName', '<u4'), ('cbData', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETICMPROFILEW(Record):
     name = "EMR_SETICMPROFILEW"
     has_variable = True
     fields = ['Type', 'Size', 'dwFlags', 'cbName', 'cbData'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETICMPROFILEW {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETLAYOUT:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIIII') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('dwFlags', 8, 4), ('cbName', 12, 4), ('cbData', 16, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('dwFlags', '<u4'), ('cbName', '<u4'), ('cbData', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETLAYOUT(Record):
     name = "EMR_SETLAYOUT"
     has_variable = False
     fields = ['Type', 'Size', 'LayoutMode'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETLAYOUT {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETLINKEDUFIS:
-    format = ['4b', '4b', '4b', '8b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('LayoutMode', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('LayoutMode', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETLINKEDUFIS(Record):
     name = "EMR_SETLINKEDUFIS"
     has_variable = True
     fields = ['Type', 'Size', 'uNumLinkedUFI', 'Reserved'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETLINKEDUFIS {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETMAPMODE:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 8) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIIQ') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('uNumLinkedUFI', 8, 4), ('Reserved', 12, 8)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('uNumLinkedUFI', '<u4'), ('Reserved', '<u8')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETMAPMODE(Record):
     name = "EMR_SETMAPMODE"
     has_variable = False
     fields = ['Type', 'Size', 'MapMode'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETMAPMODE {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETMAPPERFLAGS:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('MapMode', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('MapMode', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETMAPPERFLAGS(Record):
     name = "EMR_SETMAPPERFLAGS"
     has_variable = False
     fields = ['Type', 'Size', 'Flags'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETMAPPERFLAGS {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETMITERLIMIT:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Flags', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Flags', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETMITERLIMIT(Record):
     name = "EMR_SETMITERLIMIT"
     has_variable = False
     fields = ['Type', 'Size', 'MiterLimit'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETMITERLIMIT {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETPOLYFILLMODE:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('MiterLimit', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('MiterLimit', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETPOLYFILLMODE(Record):
     name = "EMR_SETPOLYFILLMODE"
     has_variable = False
     fields = ['Type', 'Size', 'PolygonFillMode'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETPOLYFILLMODE {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETROP2:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('PolygonFillMode', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('PolygonFillMode', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETROP2(Record):
     name = "EMR_SETROP2"
     has_variable = False
     fields = ['Type', 'Size', 'ROP2Mode'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETROP2 {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETSTRETCHBLTMODE:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('ROP2Mode', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('ROP2Mode', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETSTRETCHBLTMODE(Record):
     name = "EMR_SETSTRETCHBLTMODE"
     has_variable = False
     fields = ['Type', 'Size', 'StretchMode'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETSTRETCHBLTMODE {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETTEXTALIGN:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('StretchMode', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('StretchMode', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETTEXTALIGN(Record):
     name = "EMR_SETTEXTALIGN"
     has_variable = False
     fields = ['Type', 'Size', 'TextAlignmentMode'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETTEXTALIGN {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETTEXTCOLOR:
-    format = ['4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('TextAlignmentMode', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('TextAlignmentMode', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETTEXTCOLOR(Record):
     name = "EMR_SETTEXTCOLOR"
     has_variable = False
     fields = ['Type', 'Size', 'Color'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETTEXTCOLOR {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETTEXTJUSTIFICATION:
-    format = ['4b', '4b', '4b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<III') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Color', 8, ColorRef), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Color', 8, 4),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Color', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETTEXTJUSTIFICATION(Record):
     name = "EMR_SETTEXTJUSTIFICATION"
     has_variable = False
     fields = ['Type', 'Size', 'nBreakExtra', 'nBreakCount'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETTEXTJUSTIFICATION {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETVIEWPORTEXTEX:
-    format = ['4b', '4b', '8b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIii') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = () # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('nBreakExtra', 8, 4), ('nBreakCount', 12, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('nBreakExtra', '<i4'), ('nBreakCount', '<i4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETVIEWPORTEXTEX(Record):
     name = "EMR_SETVIEWPORTEXTEX"
     has_variable = False
     fields = ['Type', 'Size', 'Extent'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETVIEWPORTEXTEX {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETVIEWPORTORGEX:
-    format = ['4b', '4b', '8b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 8) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIQ') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Extent', 8, SizeL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Extent', 8, 8),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Extent', '<u8')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETVIEWPORTORGEX(Record):
     name = "EMR_SETVIEWPORTORGEX"
     has_variable = False
     fields = ['Type', 'Size', 'Origin'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETVIEWPORTORGEX {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETWINDOWEXTEX:
-    format = ['4b', '4b', '8b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 8) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIQ') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Origin', 8, PointL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Origin', 8, 8),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Origin', '<u8')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETWINDOWEXTEX(Record):
     name = "EMR_SETWINDOWEXTEX"
     has_variable = False
     fields = ['Type', 'Size', 'Extent'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETWINDOWEXTEX {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETWINDOWORGEX:
-    format = ['4b', '4b', '8b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 8) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIQ') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Extent', 8, SizeL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Extent', 8, 8),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Extent', '<u8')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETWINDOWORGEX(Record):
     name = "EMR_SETWINDOWORGEX"
     has_variable = False
     fields = ['Type', 'Size', 'Origin'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETWINDOWORGEX {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_MODIFYWORLDTRANSFORM:
-    format = ['4b', '4b', '24b', '4b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 8) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIQ') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Origin', 8, PointL), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Origin', 8, 8),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Origin', '<u8')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_MODIFYWORLDTRANSFORM(Record):
     name = "EMR_MODIFYWORLDTRANSFORM"
     has_variable = False
     fields = ['Type', 'Size', 'Xform', 'ModifyWorldTransformMode'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_MODIFYWORLDTRANSFORM {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
-
-
-
-class EMR_SETWORLDTRANSFORM:
-    format = ['4b', '4b', '24b']
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 24, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II24sI') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Xform', 8, XForm), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Xform', 8, 24), ('ModifyWorldTransformMode', 32, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Xform', 'u1', (24,)), ('ModifyWorldTransformMode', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class EMR_SETWORLDTRANSFORM(Record):
     name = "EMR_SETWORLDTRANSFORM"
     has_variable = False
     fields = ['Type', 'Size', 'Xform'] # These are the fields of this object.
-    variable_data = None
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        #print("unpacked: ")
-        #print(unpacked)
-        for field, value in zip(self.fields, unpacked):
-            #print("value == "+str(value))
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255 
-                setattr(self, field, (1, value)) # Size of one byte
-        self.remaining_data = data # data[struct.calcsize("".join(self.format)):] # We do not need to do this here because we did this earlier.
-        #print("Here is the size thing: "+str(struct.calcsize("".join(self.format))))
-        # return self.remaining_data # Return the remaining data after reading the header.
-        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
-        #print("Here is self.name: "+str(self.name))
-        #print("Here is self.has_variable: "+str(self.has_variable))
-        #print("Here is self.remaining_data: "+str(self.remaining_data))
-        if not self.has_variable and self.remaining_data: # There is left over data even though record should not be variable.
-            assert False
-        if self.has_variable:
-            # Set the variable data.
-            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
-
-    def mutable_fields(self) -> list:
-        # This method returns the fields which do NOT contain the type or size fields.
-        assert "Type" in self.fields
-        assert "Size" in self.fields
-        o = self.fields # Now try to do the thing.
-        o.remove("Type")
-        o.remove("Size")
-        assert "Type" not in self.fields
-        assert "Size" not in self.fields
-        return 0
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SETWORLDTRANSFORM {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        #if self.variable_data:
-        #    print("Length of variable data: "+str(len(self.variable_data)))
-        #    print("Variable data: "+str(self.variable_data))
-        if self.has_variable:
-            # Add variable data to the end.
-            out += self.variable_data
-        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
-        assert self.Size[1] == len(out)
-        return out # Return the output bytes
-
-
+    arrays = () # (name, count field, numpy type, values per element) of the arrays at the start of the variable part.
+    __slots__ = tuple(fields) + tuple(array[0] for array in arrays)
+    widths = (4, 4, 24) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II24s') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Xform', 8, XForm), ) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Xform', 8, 24),) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Xform', 'u1', (24,))] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
 
 
 
 # This wasn't in the specific format which this script expects. Just add it here....
 
 
-class EMR_SAVEDC:
-    format = ["4b", "4b"]
+class EMR_SAVEDC(Record):
     name = "EMR_SAVEDC"
     has_variable = False
-    fields = ["Type", "Size"] # These are the fields of this object.
-    def __init__(self, data):
-        unpacked = []
-        for f in self.format:
-            unpacked.append(struct.unpack(f, data[:struct.calcsize(f)]))
-            data = data[struct.calcsize(f):]
-        for field, value in zip(self.fields, unpacked):
-            if isinstance(value, tuple): # This is a multibyte value.
-                # Should be integers all
-                # Convert to unsigned bytes...
-                value = [to_unsigned(x) for x in value]
-                assert all([x >= 0 and x <= 255 for x in value]) # Should be integers representing single bytes.
-                # Make a list and then just use bytes
-                b = bytes(value)
-                # Now make the integer...
-                # int.from_bytes(byte_data, byteorder='little')
-                integer = int.from_bytes(b, byteorder='little')
-                setattr(self, field, (len(b), integer))
-            else:
-                value = to_unsigned(value)
-                assert value >= 0 and value <= 255
-                setattr(self, field, (1, value)) # Size of one byte
-        # self.remaining_data = data[struct.calcsize("".join(self.format)):]
-        self.remaining_data = data
-
-    @classmethod
-    def from_file(cls, filename):
-        with open(filename, 'rb') as f:
-            data = f.read()
-            return cls(data)
-
-    def __repr__(self):
-        parsed_fields = {field: getattr(self, field) for field in self.fields}
-        return f"<EMR_SAVEDC {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
-
-    def serialize(self):
-        out = b"" # Initialize empty bytes output
-        for i, format_string in enumerate(self.format):
-            # The corresponding field is fields[i]
-            field_name = self.fields[i]
-            field_val = getattr(self, field_name) # Get the actual value of the field from this object.
-            field_length = field_val[0]
-            field_integer = field_val[1]
-            # Now try to unpack the integer into the format.
-            # field_bytes = struct.pack(format_string, field_val)
-            field_bytes = field_integer.to_bytes(field_length, byteorder='little') # num.to_bytes(4, byteorder='little')
-            out += field_bytes # Add the actual value to the output
-        return out # Return the output bytes
+    fields = ['Type', 'Size'] # These are the fields of this object.
+    __slots__ = tuple(fields)
+    widths = (4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II') # Precompiled little-endian layout of the fixed length part of the record.
+    mutable_layout = () # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+# EMR_HEADER is described as "EMR_HEADER Record Types" in the spec, which the generator skips. This is the fixed part of the
+# header (the Header object of section 2.2.9). The header extensions and the description string are left in variable_data.
+class EMR_HEADER(Record):
+    name = "EMR_HEADER"
+    has_variable = True
+    fields = ['Type', 'Size', 'Bounds', 'Frame', 'RecordSignature', 'Version', 'Bytes', 'Records', 'Handles', 'Reserved', 'nDescription', 'offDescription', 'nPalEntries', 'Device', 'Millimeters'] # These are the fields of this object.
+    __slots__ = tuple(fields)
+    widths = (4, 4, 16, 16, 4, 4, 4, 4, 2, 2, 4, 4, 4, 8, 8) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II16s16sIIIIHHIIIQQ') # Precompiled little-endian layout of the fixed length part of the record.
+    objects = (('Bounds', 8, RectL), ('Frame', 24, RectL), ('Device', 72, SizeL), ('Millimeters', 80, SizeL)) # (field, byte offset, class) of the fields which hold an EMF object, see decode_object.
+    mutable_layout = (('Bounds', 8, 16), ('Frame', 24, 16), ('RecordSignature', 40, 4), ('Version', 44, 4), ('Bytes', 48, 4), ('Records', 52, 4), ('Handles', 56, 2), ('Reserved', 58, 2), ('nDescription', 60, 4), ('offDescription', 64, 4), ('nPalEntries', 68, 4), ('Device', 72, 8), ('Millimeters', 80, 8)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('Bounds', 'u1', (16,)), ('Frame', 'u1', (16,)), ('RecordSignature', '<u4'), ('Version', '<u4'), ('Bytes', '<u4'), ('Records', '<u4'), ('Handles', '<u2'), ('Reserved', '<u2'), ('nDescription', '<u4'), ('offDescription', '<u4'), ('nPalEntries', '<u4'), ('Device', '<u8'), ('Millimeters', '<u8')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+# Fallback for record types which do not have a parser (yet). Only the Type and Size fields are decoded, the rest is variable_data.
+class UnknownRecord(Record):
+    name = "UnknownRecord"
+    has_variable = True
+    fields = ['Type', 'Size'] # These are the fields of this object.
+    __slots__ = tuple(fields)
+    widths = (4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<II') # Precompiled little-endian layout of the fixed length part of the record.
+    mutable_layout = () # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+# "2.3.3.4 EMR_COMMENT_PUBLIC Record Types" is not a record heading either. This is the generic public comment, used for the
+# public comments whose PublicCommentIdentifier does not have a record of its own (see PUBLIC_COMMENT_CLASSES).
+class EMR_COMMENT_PUBLIC(Record):
+    name = "EMR_COMMENT_PUBLIC"
+    has_variable = True
+    fields = ['Type', 'Size', 'DataSize', 'CommentIdentifier', 'PublicCommentIdentifier'] # These are the fields of this object.
+    __slots__ = tuple(fields)
+    widths = (4, 4, 4, 4, 4) # Byte width of each field. Field values themselves are plain integers.
+    layout = struct.Struct('<IIIII') # Precompiled little-endian layout of the fixed length part of the record.
+    mutable_layout = (('DataSize', 8, 4), ('CommentIdentifier', 12, 4), ('PublicCommentIdentifier', 16, 4)) # (name, byte offset, width) of the fields a mutator may touch, that is everything but Type and Size.
+    dtype = [('Type', '<u4'), ('Size', '<u4'), ('DataSize', '<u4'), ('CommentIdentifier', '<u4'), ('PublicCommentIdentifier', '<u4')] # numpy dtype description of the fixed length part, used by table.py to decode many records at once.
+
+
+
+class RecordType(enum.IntEnum): # The RecordType enumeration (section 2.1.1). These are the values of the Type field of the records.
+    EMR_HEADER = 0x00000001
+    EMR_POLYBEZIER = 0x00000002
+    EMR_POLYGON = 0x00000003
+    EMR_POLYLINE = 0x00000004
+    EMR_POLYBEZIERTO = 0x00000005
+    EMR_POLYLINETO = 0x00000006
+    EMR_POLYPOLYLINE = 0x00000007
+    EMR_POLYPOLYGON = 0x00000008
+    EMR_SETWINDOWEXTEX = 0x00000009
+    EMR_SETWINDOWORGEX = 0x0000000A
+    EMR_SETVIEWPORTEXTEX = 0x0000000B
+    EMR_SETVIEWPORTORGEX = 0x0000000C
+    EMR_SETBRUSHORGEX = 0x0000000D
+    EMR_EOF = 0x0000000E
+    EMR_SETPIXELV = 0x0000000F
+    EMR_SETMAPPERFLAGS = 0x00000010
+    EMR_SETMAPMODE = 0x00000011
+    EMR_SETBKMODE = 0x00000012
+    EMR_SETPOLYFILLMODE = 0x00000013
+    EMR_SETROP2 = 0x00000014
+    EMR_SETSTRETCHBLTMODE = 0x00000015
+    EMR_SETTEXTALIGN = 0x00000016
+    EMR_SETCOLORADJUSTMENT = 0x00000017
+    EMR_SETTEXTCOLOR = 0x00000018
+    EMR_SETBKCOLOR = 0x00000019
+    EMR_OFFSETCLIPRGN = 0x0000001A
+    EMR_MOVETOEX = 0x0000001B
+    EMR_SETMETARGN = 0x0000001C
+    EMR_EXCLUDECLIPRECT = 0x0000001D
+    EMR_INTERSECTCLIPRECT = 0x0000001E
+    EMR_SCALEVIEWPORTEXTEX = 0x0000001F
+    EMR_SCALEWINDOWEXTEX = 0x00000020
+    EMR_SAVEDC = 0x00000021
+    EMR_RESTOREDC = 0x00000022
+    EMR_SETWORLDTRANSFORM = 0x00000023
+    EMR_MODIFYWORLDTRANSFORM = 0x00000024
+    EMR_SELECTOBJECT = 0x00000025
+    EMR_CREATEPEN = 0x00000026
+    EMR_CREATEBRUSHINDIRECT = 0x00000027
+    EMR_DELETEOBJECT = 0x00000028
+    EMR_ANGLEARC = 0x00000029
+    EMR_ELLIPSE = 0x0000002A
+    EMR_RECTANGLE = 0x0000002B
+    EMR_ROUNDRECT = 0x0000002C
+    EMR_ARC = 0x0000002D
+    EMR_CHORD = 0x0000002E
+    EMR_PIE = 0x0000002F
+    EMR_SELECTPALETTE = 0x00000030
+    EMR_CREATEPALETTE = 0x00000031
+    EMR_SETPALETTEENTRIES = 0x00000032
+    EMR_RESIZEPALETTE = 0x00000033
+    EMR_REALIZEPALETTE = 0x00000034
+    EMR_EXTFLOODFILL = 0x00000035
+    EMR_LINETO = 0x00000036
+    EMR_ARCTO = 0x00000037
+    EMR_POLYDRAW = 0x00000038
+    EMR_SETARCDIRECTION = 0x00000039
+    EMR_SETMITERLIMIT = 0x0000003A
+    EMR_BEGINPATH = 0x0000003B
+    EMR_ENDPATH = 0x0000003C
+    EMR_CLOSEFIGURE = 0x0000003D
+    EMR_FILLPATH = 0x0000003E
+    EMR_STROKEANDFILLPATH = 0x0000003F
+    EMR_STROKEPATH = 0x00000040
+    EMR_FLATTENPATH = 0x00000041
+    EMR_WIDENPATH = 0x00000042
+    EMR_SELECTCLIPPATH = 0x00000043
+    EMR_ABORTPATH = 0x00000044
+    EMR_COMMENT = 0x00000046
+    EMR_FILLRGN = 0x00000047
+    EMR_FRAMERGN = 0x00000048
+    EMR_INVERTRGN = 0x00000049
+    EMR_PAINTRGN = 0x0000004A
+    EMR_EXTSELECTCLIPRGN = 0x0000004B
+    EMR_BITBLT = 0x0000004C
+    EMR_STRETCHBLT = 0x0000004D
+    EMR_MASKBLT = 0x0000004E
+    EMR_PLGBLT = 0x0000004F
+    EMR_SETDIBITSTODEVICE = 0x00000050
+    EMR_STRETCHDIBITS = 0x00000051
+    EMR_EXTCREATEFONTINDIRECTW = 0x00000052
+    EMR_EXTTEXTOUTA = 0x00000053
+    EMR_EXTTEXTOUTW = 0x00000054
+    EMR_POLYBEZIER16 = 0x00000055
+    EMR_POLYGON16 = 0x00000056
+    EMR_POLYLINE16 = 0x00000057
+    EMR_POLYBEZIERTO16 = 0x00000058
+    EMR_POLYLINETO16 = 0x00000059
+    EMR_POLYPOLYLINE16 = 0x0000005A
+    EMR_POLYPOLYGON16 = 0x0000005B
+    EMR_POLYDRAW16 = 0x0000005C
+    EMR_CREATEMONOBRUSH = 0x0000005D
+    EMR_CREATEDIBPATTERNBRUSHPT = 0x0000005E
+    EMR_EXTCREATEPEN = 0x0000005F
+    EMR_POLYTEXTOUTA = 0x00000060
+    EMR_POLYTEXTOUTW = 0x00000061
+    EMR_SETICMMODE = 0x00000062
+    EMR_CREATECOLORSPACE = 0x00000063
+    EMR_SETCOLORSPACE = 0x00000064
+    EMR_DELETECOLORSPACE = 0x00000065
+    EMR_GLSRECORD = 0x00000066
+    EMR_GLSBOUNDEDRECORD = 0x00000067
+    EMR_PIXELFORMAT = 0x00000068
+    EMR_DRAWESCAPE = 0x00000069
+    EMR_EXTESCAPE = 0x0000006A
+    EMR_SMALLTEXTOUT = 0x0000006C
+    EMR_FORCEUFIMAPPING = 0x0000006D
+    EMR_NAMEDESCAPE = 0x0000006E
+    EMR_COLORCORRECTPALETTE = 0x0000006F
+    EMR_SETICMPROFILEA = 0x00000070
+    EMR_SETICMPROFILEW = 0x00000071
+    EMR_ALPHABLEND = 0x00000072
+    EMR_SETLAYOUT = 0x00000073
+    EMR_TRANSPARENTBLT = 0x00000074
+    EMR_GRADIENTFILL = 0x00000076
+    EMR_SETLINKEDUFIS = 0x00000077
+    EMR_SETTEXTJUSTIFICATION = 0x00000078
+    EMR_COLORMATCHTOTARGETW = 0x00000079
+    EMR_CREATECOLORSPACEW = 0x0000007A
+
+
+
+# Indexed by the Type field of a record, so dispatching a record is a single tuple index. Types without a parser map to UnknownRecord.
+RECORD_CLASSES = (
+    UnknownRecord, # 0x0
+    EMR_HEADER, # 0x1
+    EMR_POLYBEZIER, # 0x2
+    EMR_POLYGON, # 0x3
+    EMR_POLYLINE, # 0x4
+    EMR_POLYBEZIERTO, # 0x5
+    EMR_POLYLINETO, # 0x6
+    EMR_POLYPOLYLINE, # 0x7
+    EMR_POLYPOLYGON, # 0x8
+    EMR_SETWINDOWEXTEX, # 0x9
+    EMR_SETWINDOWORGEX, # 0xa
+    EMR_SETVIEWPORTEXTEX, # 0xb
+    EMR_SETVIEWPORTORGEX, # 0xc
+    EMR_SETBRUSHORGEX, # 0xd
+    EMR_EOF, # 0xe
+    EMR_SETPIXELV, # 0xf
+    EMR_SETMAPPERFLAGS, # 0x10
+    EMR_SETMAPMODE, # 0x11
+    EMR_SETBKMODE, # 0x12
+    EMR_SETPOLYFILLMODE, # 0x13
+    EMR_SETROP2, # 0x14
+    EMR_SETSTRETCHBLTMODE, # 0x15
+    EMR_SETTEXTALIGN, # 0x16
+    EMR_SETCOLORADJUSTMENT, # 0x17
+    EMR_SETTEXTCOLOR, # 0x18
+    EMR_SETBKCOLOR, # 0x19
+    EMR_OFFSETCLIPRGN, # 0x1a
+    EMR_MOVETOEX, # 0x1b
+    UnknownRecord, # 0x1c
+    EMR_EXCLUDECLIPRECT, # 0x1d
+    EMR_INTERSECTCLIPRECT, # 0x1e
+    EMR_SCALEVIEWPORTEXTEX, # 0x1f
+    EMR_SCALEWINDOWEXTEX, # 0x20
+    EMR_SAVEDC, # 0x21
+    EMR_RESTOREDC, # 0x22
+    EMR_SETWORLDTRANSFORM, # 0x23
+    EMR_MODIFYWORLDTRANSFORM, # 0x24
+    EMR_SELECTOBJECT, # 0x25
+    EMR_CREATEPEN, # 0x26
+    EMR_CREATEBRUSHINDIRECT, # 0x27
+    EMR_DELETEOBJECT, # 0x28
+    EMR_ANGLEARC, # 0x29
+    EMR_ELLIPSE, # 0x2a
+    EMR_RECTANGLE, # 0x2b
+    EMR_ROUNDRECT, # 0x2c
+    EMR_ARC, # 0x2d
+    EMR_CHORD, # 0x2e
+    EMR_PIE, # 0x2f
+    EMR_SELECTPALETTE, # 0x30
+    EMR_CREATEPALETTE, # 0x31
+    EMR_SETPALETTEENTRIES, # 0x32
+    EMR_RESIZEPALETTE, # 0x33
+    UnknownRecord, # 0x34
+    EMR_EXTFLOODFILL, # 0x35
+    EMR_LINETO, # 0x36
+    EMR_ARCTO, # 0x37
+    EMR_POLYDRAW, # 0x38
+    EMR_SETARCDIRECTION, # 0x39
+    EMR_SETMITERLIMIT, # 0x3a
+    UnknownRecord, # 0x3b
+    UnknownRecord, # 0x3c
+    UnknownRecord, # 0x3d
+    EMR_FILLPATH, # 0x3e
+    EMR_STROKEANDFILLPATH, # 0x3f
+    EMR_STROKEPATH, # 0x40
+    UnknownRecord, # 0x41
+    UnknownRecord, # 0x42
+    EMR_SELECTCLIPPATH, # 0x43
+    UnknownRecord, # 0x44
+    UnknownRecord, # 0x45
+    EMR_COMMENT, # 0x46
+    EMR_FILLRGN, # 0x47
+    EMR_FRAMERGN, # 0x48
+    EMR_INVERTRGN, # 0x49
+    EMR_PAINTRGN, # 0x4a
+    EMR_EXTSELECTCLIPRGN, # 0x4b
+    EMR_BITBLT, # 0x4c
+    EMR_STRETCHBLT, # 0x4d
+    EMR_MASKBLT, # 0x4e
+    EMR_PLGBLT, # 0x4f
+    EMR_SETDIBITSTODEVICE, # 0x50
+    EMR_STRETCHDIBITS, # 0x51
+    EMR_EXTCREATEFONTINDIRECTW, # 0x52
+    EMR_EXTTEXTOUTA, # 0x53
+    EMR_EXTTEXTOUTW, # 0x54
+    EMR_POLYBEZIER16, # 0x55
+    EMR_POLYGON16, # 0x56
+    EMR_POLYLINE16, # 0x57
+    EMR_POLYBEZIERTO16, # 0x58
+    EMR_POLYLINETO16, # 0x59
+    EMR_POLYPOLYLINE16, # 0x5a
+    EMR_POLYPOLYGON16, # 0x5b
+    EMR_POLYDRAW16, # 0x5c
+    EMR_CREATEMONOBRUSH, # 0x5d
+    EMR_CREATEDIBPATTERNBRUSHPT, # 0x5e
+    EMR_EXTCREATEPEN, # 0x5f
+    EMR_POLYTEXTOUTA, # 0x60
+    EMR_POLYTEXTOUTW, # 0x61
+    EMR_SETICMMODE, # 0x62
+    EMR_CREATECOLORSPACE, # 0x63
+    EMR_SETCOLORSPACE, # 0x64
+    EMR_DELETECOLORSPACE, # 0x65
+    EMR_GLSRECORD, # 0x66
+    EMR_GLSBOUNDEDRECORD, # 0x67
+    EMR_PIXELFORMAT, # 0x68
+    EMR_DRAWESCAPE, # 0x69
+    EMR_EXTESCAPE, # 0x6a
+    UnknownRecord, # 0x6b
+    EMR_SMALLTEXTOUT, # 0x6c
+    EMR_FORCEUFIMAPPING, # 0x6d
+    EMR_NAMEDESCAPE, # 0x6e
+    EMR_COLORCORRECTPALETTE, # 0x6f
+    EMR_SETICMPROFILEA, # 0x70
+    EMR_SETICMPROFILEW, # 0x71
+    EMR_ALPHABLEND, # 0x72
+    EMR_SETLAYOUT, # 0x73
+    EMR_TRANSPARENTBLT, # 0x74
+    UnknownRecord, # 0x75
+    EMR_GRADIENTFILL, # 0x76
+    EMR_SETLINKEDUFIS, # 0x77
+    EMR_SETTEXTJUSTIFICATION, # 0x78
+    EMR_COLORMATCHTOTARGETW, # 0x79
+    EMR_CREATECOLORSPACEW, # 0x7a
+)
+RECORD_COUNT = len(RECORD_CLASSES)
+
+# Same mapping as a dictionary, only containing the record types which have a parser.
+RECORD_TYPES = {
+    RecordType.EMR_HEADER: EMR_HEADER,
+    RecordType.EMR_POLYBEZIER: EMR_POLYBEZIER,
+    RecordType.EMR_POLYGON: EMR_POLYGON,
+    RecordType.EMR_POLYLINE: EMR_POLYLINE,
+    RecordType.EMR_POLYBEZIERTO: EMR_POLYBEZIERTO,
+    RecordType.EMR_POLYLINETO: EMR_POLYLINETO,
+    RecordType.EMR_POLYPOLYLINE: EMR_POLYPOLYLINE,
+    RecordType.EMR_POLYPOLYGON: EMR_POLYPOLYGON,
+    RecordType.EMR_SETWINDOWEXTEX: EMR_SETWINDOWEXTEX,
+    RecordType.EMR_SETWINDOWORGEX: EMR_SETWINDOWORGEX,
+    RecordType.EMR_SETVIEWPORTEXTEX: EMR_SETVIEWPORTEXTEX,
+    RecordType.EMR_SETVIEWPORTORGEX: EMR_SETVIEWPORTORGEX,
+    RecordType.EMR_SETBRUSHORGEX: EMR_SETBRUSHORGEX,
+    RecordType.EMR_EOF: EMR_EOF,
+    RecordType.EMR_SETPIXELV: EMR_SETPIXELV,
+    RecordType.EMR_SETMAPPERFLAGS: EMR_SETMAPPERFLAGS,
+    RecordType.EMR_SETMAPMODE: EMR_SETMAPMODE,
+    RecordType.EMR_SETBKMODE: EMR_SETBKMODE,
+    RecordType.EMR_SETPOLYFILLMODE: EMR_SETPOLYFILLMODE,
+    RecordType.EMR_SETROP2: EMR_SETROP2,
+    RecordType.EMR_SETSTRETCHBLTMODE: EMR_SETSTRETCHBLTMODE,
+    RecordType.EMR_SETTEXTALIGN: EMR_SETTEXTALIGN,
+    RecordType.EMR_SETCOLORADJUSTMENT: EMR_SETCOLORADJUSTMENT,
+    RecordType.EMR_SETTEXTCOLOR: EMR_SETTEXTCOLOR,
+    RecordType.EMR_SETBKCOLOR: EMR_SETBKCOLOR,
+    RecordType.EMR_OFFSETCLIPRGN: EMR_OFFSETCLIPRGN,
+    RecordType.EMR_MOVETOEX: EMR_MOVETOEX,
+    RecordType.EMR_EXCLUDECLIPRECT: EMR_EXCLUDECLIPRECT,
+    RecordType.EMR_INTERSECTCLIPRECT: EMR_INTERSECTCLIPRECT,
+    RecordType.EMR_SCALEVIEWPORTEXTEX: EMR_SCALEVIEWPORTEXTEX,
+    RecordType.EMR_SCALEWINDOWEXTEX: EMR_SCALEWINDOWEXTEX,
+    RecordType.EMR_SAVEDC: EMR_SAVEDC,
+    RecordType.EMR_RESTOREDC: EMR_RESTOREDC,
+    RecordType.EMR_SETWORLDTRANSFORM: EMR_SETWORLDTRANSFORM,
+    RecordType.EMR_MODIFYWORLDTRANSFORM: EMR_MODIFYWORLDTRANSFORM,
+    RecordType.EMR_SELECTOBJECT: EMR_SELECTOBJECT,
+    RecordType.EMR_CREATEPEN: EMR_CREATEPEN,
+    RecordType.EMR_CREATEBRUSHINDIRECT: EMR_CREATEBRUSHINDIRECT,
+    RecordType.EMR_DELETEOBJECT: EMR_DELETEOBJECT,
+    RecordType.EMR_ANGLEARC: EMR_ANGLEARC,
+    RecordType.EMR_ELLIPSE: EMR_ELLIPSE,
+    RecordType.EMR_RECTANGLE: EMR_RECTANGLE,
+    RecordType.EMR_ROUNDRECT: EMR_ROUNDRECT,
+    RecordType.EMR_ARC: EMR_ARC,
+    RecordType.EMR_CHORD: EMR_CHORD,
+    RecordType.EMR_PIE: EMR_PIE,
+    RecordType.EMR_SELECTPALETTE: EMR_SELECTPALETTE,
+    RecordType.EMR_CREATEPALETTE: EMR_CREATEPALETTE,
+    RecordType.EMR_SETPALETTEENTRIES: EMR_SETPALETTEENTRIES,
+    RecordType.EMR_RESIZEPALETTE: EMR_RESIZEPALETTE,
+    RecordType.EMR_EXTFLOODFILL: EMR_EXTFLOODFILL,
+    RecordType.EMR_LINETO: EMR_LINETO,
+    RecordType.EMR_ARCTO: EMR_ARCTO,
+    RecordType.EMR_POLYDRAW: EMR_POLYDRAW,
+    RecordType.EMR_SETARCDIRECTION: EMR_SETARCDIRECTION,
+    RecordType.EMR_SETMITERLIMIT: EMR_SETMITERLIMIT,
+    RecordType.EMR_FILLPATH: EMR_FILLPATH,
+    RecordType.EMR_STROKEANDFILLPATH: EMR_STROKEANDFILLPATH,
+    RecordType.EMR_STROKEPATH: EMR_STROKEPATH,
+    RecordType.EMR_SELECTCLIPPATH: EMR_SELECTCLIPPATH,
+    RecordType.EMR_COMMENT: EMR_COMMENT,
+    RecordType.EMR_FILLRGN: EMR_FILLRGN,
+    RecordType.EMR_FRAMERGN: EMR_FRAMERGN,
+    RecordType.EMR_INVERTRGN: EMR_INVERTRGN,
+    RecordType.EMR_PAINTRGN: EMR_PAINTRGN,
+    RecordType.EMR_EXTSELECTCLIPRGN: EMR_EXTSELECTCLIPRGN,
+    RecordType.EMR_BITBLT: EMR_BITBLT,
+    RecordType.EMR_STRETCHBLT: EMR_STRETCHBLT,
+    RecordType.EMR_MASKBLT: EMR_MASKBLT,
+    RecordType.EMR_PLGBLT: EMR_PLGBLT,
+    RecordType.EMR_SETDIBITSTODEVICE: EMR_SETDIBITSTODEVICE,
+    RecordType.EMR_STRETCHDIBITS: EMR_STRETCHDIBITS,
+    RecordType.EMR_EXTCREATEFONTINDIRECTW: EMR_EXTCREATEFONTINDIRECTW,
+    RecordType.EMR_EXTTEXTOUTA: EMR_EXTTEXTOUTA,
+    RecordType.EMR_EXTTEXTOUTW: EMR_EXTTEXTOUTW,
+    RecordType.EMR_POLYBEZIER16: EMR_POLYBEZIER16,
+    RecordType.EMR_POLYGON16: EMR_POLYGON16,
+    RecordType.EMR_POLYLINE16: EMR_POLYLINE16,
+    RecordType.EMR_POLYBEZIERTO16: EMR_POLYBEZIERTO16,
+    RecordType.EMR_POLYLINETO16: EMR_POLYLINETO16,
+    RecordType.EMR_POLYPOLYLINE16: EMR_POLYPOLYLINE16,
+    RecordType.EMR_POLYPOLYGON16: EMR_POLYPOLYGON16,
+    RecordType.EMR_POLYDRAW16: EMR_POLYDRAW16,
+    RecordType.EMR_CREATEMONOBRUSH: EMR_CREATEMONOBRUSH,
+    RecordType.EMR_CREATEDIBPATTERNBRUSHPT: EMR_CREATEDIBPATTERNBRUSHPT,
+    RecordType.EMR_EXTCREATEPEN: EMR_EXTCREATEPEN,
+    RecordType.EMR_POLYTEXTOUTA: EMR_POLYTEXTOUTA,
+    RecordType.EMR_POLYTEXTOUTW: EMR_POLYTEXTOUTW,
+    RecordType.EMR_SETICMMODE: EMR_SETICMMODE,
+    RecordType.EMR_CREATECOLORSPACE: EMR_CREATECOLORSPACE,
+    RecordType.EMR_SETCOLORSPACE: EMR_SETCOLORSPACE,
+    RecordType.EMR_DELETECOLORSPACE: EMR_DELETECOLORSPACE,
+    RecordType.EMR_GLSRECORD: EMR_GLSRECORD,
+    RecordType.EMR_GLSBOUNDEDRECORD: EMR_GLSBOUNDEDRECORD,
+    RecordType.EMR_PIXELFORMAT: EMR_PIXELFORMAT,
+    RecordType.EMR_DRAWESCAPE: EMR_DRAWESCAPE,
+    RecordType.EMR_EXTESCAPE: EMR_EXTESCAPE,
+    RecordType.EMR_SMALLTEXTOUT: EMR_SMALLTEXTOUT,
+    RecordType.EMR_FORCEUFIMAPPING: EMR_FORCEUFIMAPPING,
+    RecordType.EMR_NAMEDESCAPE: EMR_NAMEDESCAPE,
+    RecordType.EMR_COLORCORRECTPALETTE: EMR_COLORCORRECTPALETTE,
+    RecordType.EMR_SETICMPROFILEA: EMR_SETICMPROFILEA,
+    RecordType.EMR_SETICMPROFILEW: EMR_SETICMPROFILEW,
+    RecordType.EMR_ALPHABLEND: EMR_ALPHABLEND,
+    RecordType.EMR_SETLAYOUT: EMR_SETLAYOUT,
+    RecordType.EMR_TRANSPARENTBLT: EMR_TRANSPARENTBLT,
+    RecordType.EMR_GRADIENTFILL: EMR_GRADIENTFILL,
+    RecordType.EMR_SETLINKEDUFIS: EMR_SETLINKEDUFIS,
+    RecordType.EMR_SETTEXTJUSTIFICATION: EMR_SETTEXTJUSTIFICATION,
+    RecordType.EMR_COLORMATCHTOTARGETW: EMR_COLORMATCHTOTARGETW,
+    RecordType.EMR_CREATECOLORSPACEW: EMR_CREATECOLORSPACEW,
+}
+
+
+
+class EmrComment(enum.IntEnum): # The EmrComment enumeration (section 2.1.10). These are the values of the PublicCommentIdentifier field of public comment records.
+    EMR_COMMENT_WINDOWS_METAFILE = 0x80000001
+    EMR_COMMENT_BEGINGROUP = 0x00000002
+    EMR_COMMENT_ENDGROUP = 0x00000003
+    EMR_COMMENT_MULTIFORMATS = 0x40000004
+    EMR_COMMENT_UNICODE_STRING = 0x00000040
+    EMR_COMMENT_UNICODE_END = 0x00000080
+
+
+
+# EMR_COMMENT records all have the same Type. These tell them apart by their CommentIdentifier, and the public ones by their
+# PublicCommentIdentifier. Comments with any other identifier are private EMR_COMMENT records.
+COMMENT_CLASSES = {
+    0x00000000: EMR_COMMENT_EMFSPOOL,
+    0x2B464D45: EMR_COMMENT_EMFPLUS,
+    0x43494447: EMR_COMMENT_PUBLIC,
+}
+PUBLIC_COMMENT_CLASSES = {
+    0x80000001: EMR_COMMENT_WINDOWS_METAFILE,
+    0x00000002: EMR_COMMENT_BEGINGROUP,
+    0x00000003: EMR_COMMENT_ENDGROUP,
+    0x40000004: EMR_COMMENT_MULTIFORMATS,
+}
 
 
 
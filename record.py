@@ -0,0 +1,252 @@
+import re
+import struct
+
+try:
+    import numpy
+except ImportError: # numpy is only needed for the arrays of the variable part (see Record.arrays), everything else works without it.
+    numpy = None
+
+# This is the runtime shared by all of the record classes. The generated classes in output.py (and the ones in manual.py)
+# only declare their layout (name, has_variable, fields, widths, layout, objects, mutable_layout, arrays, dtype) and inherit everything else from Record.
+# The objects of section 2.2 (XForm, LogFont, ...) which record fields are made of are EmfObject subclasses.
+
+NATIVE_WIDTHS = (1, 2, 4, 8) # Field widths which the precompiled layouts unpack directly into integers. Everything else is unpacked as bytes.
+
+def float_fields(layout, fields): # Returns (field, offset, precompiled struct) of the float fields of a record layout like "<II6f".
+    floats = []
+    offset = 0
+    for field, code in zip(fields, re.findall(r"\d*[a-zA-Z]", layout)):
+        field_layout = struct.Struct("<"+code)
+        if code in ("f", "d"):
+            floats.append((field, offset, field_layout))
+        offset += field_layout.size
+    return tuple(floats)
+
+
+class LazyField:
+    # Descriptor of one field in the lazy variant of a record class (see Record.make_lazy_class). The first field which is
+    # read unpacks the whole fixed part with the precompiled layout, one call like in eager mode, and caches the values on the
+    # record. Every field then just indexes that list. Blob fields are turned into integers on first access.
+    __slots__ = ("index", "blob")
+
+    def __init__(self, index, blob):
+        self.index = index
+        self.blob = blob
+
+    def __get__(self, record, owner=None):
+        if record is None:
+            return self
+        values = record.values
+        if values is None:
+            values = record.values = list(record.layout.unpack_from(record.buffer, record.offset))
+        value = values[self.index]
+        if self.blob and type(value) is bytes:
+            value = values[self.index] = int.from_bytes(value, byteorder='little')
+        return value
+
+    def __set__(self, record, value):
+        if record.values is None:
+            record.values = list(record.layout.unpack_from(record.buffer, record.offset))
+        record.values[self.index] = value
+
+
+class EmfObject:
+    # A fixed size object like RectL or XForm. The generated subclasses declare name, fields (also their __slots__), layout and
+    # objects, the (field, offset, class) of the fields which are objects themselves. Objects are small, so they are decoded
+    # eagerly, nested objects included.
+    __slots__ = ()
+    name = "EmfObject"
+    fields = ()
+    objects = ()
+
+    def __init__(self, data, offset=0):
+        for field, value in zip(self.fields, self.layout.unpack_from(data, offset)):
+            setattr(self, field, value)
+        for field, field_offset, cls in self.objects:
+            setattr(self, field, cls(data, offset + field_offset))
+
+    def __iter__(self): # So that for example tuple(xform) gives the six matrix values.
+        return (getattr(self, field) for field in self.fields)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and tuple(self) == tuple(other)
+
+    def __repr__(self):
+        return "<"+self.name+" "+", ".join(field+"="+repr(getattr(self, field)) for field in self.fields)+">"
+
+
+class Record:
+    # The fields themselves are slots declared by the subclasses (__slots__ = tuple(fields)), so there is no per-instance __dict__.
+    __slots__ = ("buffer", "offset", "end", "remaining_data", "variable_data")
+    name = "Record"
+    has_variable = True
+    fields = []
+    widths = ()
+    objects = ()
+    mutable_layout = ()
+    arrays = ()
+
+    def __init_subclass__(cls, **kwargs):
+        # Everything which can be derived from the declared layout is computed once here, when the class is created.
+        super().__init_subclass__(**kwargs)
+        cls.format = [str(width)+"b" for width in cls.widths] # The old per-field format strings, like ['4b', '4b', '16b'].
+        cls.blob_fields = tuple(i for i, width in enumerate(cls.widths) if width not in NATIVE_WIDTHS) # Unpacked as bytes.
+        cls.lazy_class = None # Built by make_lazy_class the first time a record of this class is created with lazy=True.
+        cls.float_fields = float_fields(cls.layout.format, cls.fields) if hasattr(cls, "layout") else () # See restore_nan_bits.
+
+    def __new__(cls, data=None, offset=0, end=None, lazy=False):
+        # Records created with lazy=True are instances of the lazy variant of their class.
+        if lazy:
+            cls = cls.lazy_class or cls.make_lazy_class()
+        return object.__new__(cls)
+
+    @classmethod
+    def make_lazy_class(cls):
+        # Builds the lazy variant of cls: a subclass whose fields are LazyField descriptors, so a record only pays for decoding
+        # when one of its fields is actually read.
+        namespace = {"__slots__": ("values",), "__module__": cls.__module__}
+        for i, field in enumerate(cls.fields):
+            namespace[field] = LazyField(i, i in cls.blob_fields)
+        lazy = type(cls.__name__, (cls,), namespace)
+        cls.lazy_class = lazy.lazy_class = lazy
+        return lazy
+
+    def __init__(self, data, offset=0, end=None, lazy=False):
+        # data can be bytes, a bytearray, an mmap or a memoryview. Nothing is copied: the record only remembers where it lives in
+        # the buffer and remaining_data / variable_data are memoryview slices of it (call .tobytes() on them when bytes are needed).
+        if not isinstance(data, memoryview):
+            data = memoryview(data)
+        if end is None:
+            end = len(data)
+        if offset + self.layout.size > end: # A Size smaller than the fixed part would have us decode the next record's bytes.
+            raise ValueError("Size "+str(end - offset)+" of the "+self.name+" at offset "+str(offset)+" is smaller than its fixed part ("+str(self.layout.size)+" bytes)")
+        self.buffer = data
+        self.offset = offset
+        self.end = end
+        if lazy: # The fields are decoded on first access instead, see LazyField.
+            self.values = None
+        else:
+            self.decode(data, offset)
+        self.remaining_data = data[offset + self.layout.size:end]
+        # Sanity checking. If the record doesn't have variable fields, then all of the data should be consumed. Otherwise this is an error condition.
+        if not self.has_variable and len(self.remaining_data): # There is left over data even though record should not be variable.
+            raise ValueError("Size "+str(end - offset)+" of the "+self.name+" at offset "+str(offset)+" is larger than the record ("+str(self.layout.size)+" bytes)")
+        if self.has_variable:
+            # Set the variable data.
+            self.variable_data = self.remaining_data # The variable data should be the data at the end. This actually may be b"" for optional fields...
+        else:
+            self.variable_data = None
+
+    def decode(self, data, offset):
+        # The whole fixed part of the record is decoded with one call to the precompiled layout. Classes generated with
+        # --specialize override this with straight line code.
+        values = self.layout.unpack_from(data, offset)
+        if self.blob_fields:
+            values = list(values)
+            for i in self.blob_fields:
+                values[i] = int.from_bytes(values[i], byteorder='little')
+        for field, value in zip(self.fields, values):
+            setattr(self, field, value)
+
+    def field_values(self):
+        # The values of the fields as the layout packs them. Classes generated with --specialize override this too.
+        values = [getattr(self, field) for field in self.fields]
+        for i in self.blob_fields: # Blob fields are packed as bytes.
+            values[i] = values[i].to_bytes(self.widths[i], byteorder='little')
+        return values
+
+    def encode(self):
+        # Packs the fixed part of the record.
+        if not self.float_fields:
+            return self.layout.pack(*self.field_values())
+        out = bytearray(self.layout.size)
+        self.layout.pack_into(out, 0, *self.field_values())
+        self.restore_nan_bits(out, 0)
+        return bytes(out)
+
+    def restore_nan_bits(self, buf, offset):
+        # Float fields are Python floats, which do not keep the payload of a signaling NaN: packing one back gives a quiet NaN.
+        # So for the float fields which are NaN and were NaN in the buffer the record was parsed from, the original bytes are
+        # copied back into the fixed part packed at offset of buf, and odd bit patterns survive a round trip like integers do.
+        for field, field_offset, field_layout in self.float_fields:
+            value = getattr(self, field)
+            if value == value: # Not a NaN.
+                continue
+            start = self.offset + field_offset
+            original = self.buffer[start:start + field_layout.size]
+            if field_layout.unpack(original)[0] != field_layout.unpack(original)[0]:
+                buf[offset + field_offset:offset + field_offset + field_layout.size] = original
+
+    def __getattr__(self, name):
+        # Only called for attributes which are not set. The arrays of the variable part are decoded here on first access.
+        if any(array[0] == name for array in self.arrays):
+            return self.decode_array(name)
+        raise AttributeError(name)
+
+    def decode_array(self, name):
+        # Returns the array called name from the variable part of the record as a numpy array viewed straight over the buffer
+        # (shape (count, 2) for points), and stores it on the instance like a lazily decoded field. The arrays follow each other
+        # right after the fixed part, each one as long as its count field says.
+        if numpy is None:
+            raise ImportError("Decoding the arrays of a record needs numpy")
+        start = self.offset + self.layout.size
+        for array_name, count_field, element, per in self.arrays:
+            count = getattr(self, count_field)
+            element = numpy.dtype(element)
+            length = count * per * element.itemsize
+            if start + length > self.end:
+                raise ValueError(array_name+" of "+self.name+" at offset "+str(self.offset)+" overruns the record")
+            if array_name == name:
+                value = numpy.frombuffer(self.buffer, dtype=element, count=count * per, offset=start)
+                if per > 1:
+                    value = value.reshape(count, per)
+                setattr(self, name, value)
+                return value
+            start += length
+        raise AttributeError(name)
+
+    def decode_object(self, name):
+        # Decodes the field called name as the object it holds, for example record.decode_object("XformSrc") is an XForm with
+        # six floats. The field itself stays a plain integer, so encoding and mutating records is not affected.
+        for field, field_offset, cls in self.objects:
+            if field == name:
+                return cls(self.buffer, self.offset + field_offset)
+        raise KeyError(name+" of "+self.name+" is not an object")
+
+    def mutable_fields(self) -> tuple:
+        # This method returns the fields which do NOT contain the type or size fields, as (name, byte offset, width) tuples.
+        # The tuple is generated with the class, so this neither allocates nor touches the shared fields list.
+        return self.mutable_layout
+
+    @classmethod
+    def from_file(cls, filename):
+        with open(filename, 'rb') as f:
+            data = f.read()
+            return cls(data)
+
+    def __repr__(self):
+        parsed_fields = {field: getattr(self, field) for field in self.fields}
+        return f"<{self.name} {parsed_fields}, Remaining: {len(self.remaining_data)} bytes>"
+
+    def serialize(self):
+        out = self.encode()
+        if self.has_variable:
+            # Add variable data to the end.
+            out += self.variable_data
+        # Sanity checking. The "Size" field should actually match the size upon serialization. If not, then the mutator did not take care of the size correctly and there is a bug in the mutator.
+        assert self.Size == len(out)
+        return out # Return the output bytes
+
+    def serialize_into(self, buf, offset=0):
+        # Like serialize, but writes the record straight into buf (a bytearray, writable memoryview or mmap) at offset instead
+        # of building new bytes. Returns the offset just after the record.
+        variable_length = len(self.variable_data) if self.has_variable else 0
+        end = offset + self.layout.size + variable_length
+        # Same sanity check as in serialize, but done before anything is written.
+        assert self.Size == end - offset
+        self.layout.pack_into(buf, offset, *self.field_values())
+        if self.float_fields:
+            self.restore_nan_bits(buf, offset)
+        if variable_length:
+            buf[end - variable_length:end] = self.variable_data
+        return end
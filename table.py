@@ -0,0 +1,98 @@
+import mmap
+from emf import *
+from index import RecordIndex
+
+try:
+    import numpy
+except ImportError: # numpy is only needed by this file, the record classes themselves work without it.
+    numpy = None
+
+# Columnar view of a whole metafile: instead of one Python object per record, all records of a type are decoded into one
+# numpy structured array, so statistics over millions of records are vectorised operations.
+
+COMMENT_CLASS_NAMES = {cls.name: cls for cls in (*COMMENT_CLASSES.values(), *PUBLIC_COMMENT_CLASSES.values()) if cls is not EMR_COMMENT}
+GATHER_BYTES = 8 * 1024 * 1024 # Size of the index arrays decode_batch builds at a time for records which are not evenly spaced.
+
+
+def decode_batch(buffer, offsets, cls):
+    # Decodes the fixed part of the records of class cls at the given offsets of buffer in one go and returns them as a numpy
+    # structured array, using the dtype the generator emitted for the class. When the records are evenly spaced (a run of
+    # same-sized records like EMR_LINETO) the result is a strided view straight into buffer, otherwise the bytes are gathered
+    # with fancy indexing into a new array, a bounded chunk of records at a time.
+    dtype = numpy.dtype(cls.dtype)
+    offsets = numpy.asarray(offsets, dtype=numpy.intp)
+    if len(offsets) == 0:
+        return numpy.zeros(0, dtype=dtype)
+    raw = numpy.frombuffer(buffer, dtype=numpy.uint8)
+    if offsets.min() < 0 or offsets.max() + dtype.itemsize > len(raw):
+        raise ValueError("Record out of bounds of the buffer")
+    steps = numpy.diff(offsets)
+    if len(offsets) == 1 or (steps[0] >= dtype.itemsize and (steps == steps[0]).all()):
+        stride = int(steps[0]) if len(offsets) > 1 else dtype.itemsize
+        return numpy.ndarray(shape=(len(offsets),), dtype=dtype, buffer=raw, offset=int(offsets[0]), strides=(stride,))
+    # The gather index has one intp per byte gathered, so it is built for at most GATHER_BYTES of index at a time.
+    out = numpy.empty(len(offsets), dtype=dtype)
+    rows = out.view(numpy.uint8).reshape(len(offsets), dtype.itemsize)
+    columns = numpy.arange(dtype.itemsize)
+    step = max(1, GATHER_BYTES // (dtype.itemsize * columns.itemsize))
+    for start in range(0, len(offsets), step):
+        rows[start:start + step] = raw[offsets[start:start + step, None] + columns]
+    return out
+
+
+class RecordTable:
+    # offsets, types and sizes have one entry per record in file order. records(record_type) returns the fixed parts of all
+    # records of one type as a structured array, decoded on first use, and column_offsets[record_type] the offset of each row.
+    def __init__(self, buffer, index=None):
+        # index is an optional index.RecordIndex of buffer. Without one it is built here, so the scan only ever keeps the compact
+        # arrays of the index and not a Python object per record. Either way its arrays are wrapped as they are, without a copy.
+        if numpy is None:
+            raise ImportError("RecordTable needs numpy")
+        self.buffer = buffer
+        if index is None:
+            index = RecordIndex.build(buffer)
+        self.offsets = numpy.frombuffer(index.offsets, dtype=numpy.uint64)
+        self.types = numpy.frombuffer(index.types, dtype=numpy.uint32)
+        self.sizes = numpy.frombuffer(index.sizes, dtype=numpy.uint32)
+        self.columns = {} # Record type (or comment class name) -> structured array.
+        self.column_offsets = {} # Record type (or comment class name) -> offset of each row of the structured array.
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def offsets_of(self, record_type):
+        # Offsets of all records of the given type (a RecordType value or a record class name like "EMR_BITBLT").
+        if isinstance(record_type, str):
+            record_type = RecordType[record_type]
+        return self.offsets[self.types == record_type]
+
+    def records(self, record_type):
+        # record_type is a RecordType value or a record class name. The names of the comment classes, like
+        # "EMR_COMMENT_MULTIFORMATS", select the comments of that kind (told apart by their identifiers, see comment_class),
+        # so their own fields become columns. Their columns and column_offsets are keyed by that name.
+        if isinstance(record_type, str) and record_type not in COMMENT_CLASS_NAMES:
+            record_type = RecordType[record_type]
+        if record_type not in self.columns:
+            cls = COMMENT_CLASS_NAMES.get(record_type) if isinstance(record_type, str) else record_class(record_type)
+            selected = self.types == (RecordType.EMR_COMMENT if isinstance(record_type, str) else record_type)
+            offsets = self.offsets[selected]
+            sizes = self.sizes[selected]
+            if isinstance(record_type, str):
+                offsets = offsets[numpy.array([comment_class(self.buffer, offset, size) is cls for offset, size in zip(offsets.tolist(), sizes.tolist())], dtype=bool)]
+            else:
+                # A record with a Size smaller than its fixed part is corrupt. Those are left out instead of reading into the next record.
+                offsets = offsets[sizes >= cls.layout.size]
+            self.columns[record_type] = decode_batch(self.buffer, offsets, cls)
+            self.column_offsets[record_type] = offsets
+        return self.columns[record_type]
+
+    def type_histogram(self):
+        # Returns {record type: count} for the whole file.
+        values, counts = numpy.unique(self.types, return_counts=True)
+        return dict(zip(values.tolist(), counts.tolist()))
+
+    @classmethod
+    def from_file(cls, filename, index=None):
+        # The file is memory mapped, so apart from the Type/Size scan only the records which are decoded into columns are read.
+        with open(filename, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), index)
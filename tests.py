@@ -2,7 +2,10 @@
 
 from generate import *
 import os
-import importlib # This is to load the changes of the test spec file...
+import importlib.util # This is to load the changes of the test spec file...
+import shutil
+import struct
+import tempfile
 from util import *
 
 TEST_SPEC_FILENAME = "test_spec.py"
@@ -23,14 +26,18 @@ def good(string):
 	return
 
 
-def write_to_test_spec_and_import(contents): # This writes the data to a file called test_spec.py which is then imported in the tests and then the contents are checked for something in the test functions. After this the data is imported into this python file.
+def write_to_test_spec_and_import(contents): # This writes the data to a file called test_spec.py in a temporary directory (so the tracked test_spec.py is left alone) which is then imported in the tests and then the contents are checked for something in the test functions.
 	global cur_module
 	print("contents == "+str(contents))
-	os.system("rm "+str(TEST_SPEC_FILENAME)) # Remove the old file...
-	fh = open(TEST_SPEC_FILENAME, "w")
+	directory = tempfile.mkdtemp()
+	filename = os.path.join(directory, TEST_SPEC_FILENAME)
+	fh = open(filename, "w")
 	fh.write(contents)
 	fh.close()
-	cur_module = importlib.import_module(TEST_SPEC_MODULE_NAME) # Try to load the thing...
+	module_spec = importlib.util.spec_from_file_location(TEST_SPEC_MODULE_NAME, filename) # Try to load the thing...
+	cur_module = importlib.util.module_from_spec(module_spec)
+	module_spec.loader.exec_module(cur_module)
+	shutil.rmtree(directory)
 	dprint("Here are the contents of the module: "+str(dir(cur_module)))
 	return
 
@@ -59,12 +66,277 @@ def test_overrun_stuff():
 	# Now check for the fields part.
 	# assert 
 	print(eof_obj.fields)
-	assert eof_obj.fields == ['Type', 'nPalEntries', 'offPalEntries', 'SizeLast'] # The fields should be these.
+	assert eof_obj.fields == ['Type', 'Size', 'nPalEntries', 'offPalEntries', 'SizeLast'] # The fields should be these. Size is in the diagram even though this excerpt does not describe it.
 	good("test_overrun_stuff passed!")
 	return
 
+def make_test_metafile(): # Builds a minimal metafile: EMR_HEADER, EMR_SAVEDC and then EMR_EOF (the example from the spec).
+	eof = parse_hex_dump(EMR_EOF_DUMP)
+	savedc = struct.pack("<II", 0x21, 8)
+	header_size = 88
+	total = header_size + len(savedc) + len(eof)
+	header = struct.pack("<II16s16sIIIIHHIIIQQ", 0x1, header_size, bytes(16), bytes(16), 0x464D4520, 0x10000, total, 3, 1, 0, 0, 0, 0, 0, 0)
+	return header + savedc + eof
+
+def test_iter_records():
+	import emf
+	data = make_test_metafile()
+	records = list(emf.iter_records(data))
+	assert [r.name for r in records] == ["EMR_HEADER", "EMR_SAVEDC", "EMR_EOF"]
+	assert records[0].Bytes == len(data)
+	assert records[2].offset == 96
+	assert b"".join(r.serialize() for r in records) == data # Records serialize back to the exact input.
+	assert emf.serialize_records(records) == data
+	lazy = list(emf.iter_records(data, lazy=True))
+	assert [r.field_values() for r in lazy] == [r.field_values() for r in records] # Lazily decoded fields are the same.
+	good("test_iter_records passed!")
+	return
+
+def test_truncated_record():
+	import emf
+	xform = struct.pack("<II6f", 0x23, 32, 1.0, 0.0, 0.0, 1.0, 0.0, 0.0) # EMR_SETWORLDTRANSFORM
+	data = make_test_metafile()
+	data = data[:88] + struct.pack("<II", 0x23, 8) + xform + data[88:] # The first one claims to be only 8 bytes long.
+	try:
+		list(emf.iter_records(data))
+	except ValueError:
+		pass
+	else:
+		assert False # The Xform of the second record must not be decoded as the one of the first.
+	try:
+		emf.EMR_SAVEDC(struct.pack("<II", 0x21, 12) + bytes(4)) # EMR_SAVEDC has no variable part.
+	except ValueError:
+		pass
+	else:
+		assert False
+	good("test_truncated_record passed!")
+	return
+
+def test_emf_reader():
+	import emf
+	data = make_test_metafile()
+	with tempfile.NamedTemporaryFile(suffix=".emf") as f:
+		f.write(data)
+		f.flush()
+		with emf.EmfReader(f.name) as reader:
+			records = list(reader)
+			assert [r.name for r in records] == ["EMR_HEADER", "EMR_SAVEDC", "EMR_EOF"]
+			assert records[2].serialize() == parse_hex_dump(EMR_EOF_DUMP)
+		records = list(emf.parse_emf(f.name, lazy=True))
+		assert records[2].SizeLast == 20 # Records outlive the reader, lazy fields included.
+		assert records[0].decode_object("Bounds") == emf.RectL(bytes(16))
+	good("test_emf_reader passed!")
+	return
+
+def test_record_table():
+	import table
+	if table.numpy is None:
+		print("[-] test_record_table skipped, numpy is not installed")
+		return
+	t = table.RecordTable(make_test_metafile())
+	assert t.offsets.tolist() == [0, 88, 96]
+	assert t.type_histogram() == {0x1: 1, 0x21: 1, 0xE: 1}
+	assert t.records("EMR_EOF")["SizeLast"].tolist() == [20]
+	good("test_record_table passed!")
+	return
+
+def test_mutator():
+	import emf
+	import mutator
+	import random
+	data = make_test_metafile()
+	m = mutator.Mutator(data, rng=random.Random(1))
+	for variant in m.variants(200):
+		records = list(emf.iter_records(variant, lazy=True))
+		assert records[0].Bytes == len(variant) # The header is kept consistent.
+		assert records[0].Records == len(records)
+	assert m.buffer == data # In place mutations are undone.
+	header = next(emf.iter_records(data))
+	assert header.mutable_fields() is header.mutable_fields() # Cached on the class, not rebuilt per call.
+	assert header.mutable_fields()[0] == ('Bounds', 8, 16)
+	assert "Type" in header.fields and "Size" in header.fields # The shared fields list is left alone.
+	good("test_mutator passed!")
+	return
+
+def test_loader_cache():
+	import loader
+	with tempfile.TemporaryDirectory() as directory:
+		spec = os.path.join(directory, "contents.txt")
+		shutil.copyfile(loader.SPEC_FILENAME, spec)
+		cache = os.path.join(directory, "cache")
+		path = loader.cached_module_path(spec, cache_dir=cache)
+		assert os.path.dirname(path) == cache and os.path.exists(path) # The first call generates the module.
+		mtime = os.stat(path).st_mtime_ns
+		assert loader.cached_module_path(spec, cache_dir=cache) == path # The second one reuses it.
+		assert os.stat(path).st_mtime_ns == mtime
+		specialized = loader.cached_module_path(spec, specialize=True, cache_dir=cache)
+		assert specialized != path
+		with open(spec, "a") as f:
+			f.write("\n")
+		changed = loader.cached_module_path(spec, cache_dir=cache)
+		assert changed not in (path, specialized)
+		module = loader.load_parsers(spec, specialize=True, cache_dir=cache)
+		eof = module.EMR_EOF(parse_hex_dump(EMR_EOF_DUMP))
+		assert eof.SizeLast == 20
+	good("test_loader_cache passed!")
+	return
+
+def test_record_index():
+	import emf
+	import index
+	data = make_test_metafile()
+	with tempfile.TemporaryDirectory() as directory:
+		filename = os.path.join(directory, "test.emf")
+		with open(filename, "wb") as f:
+			f.write(data)
+		built = index.RecordIndex.for_file(filename)
+		assert os.path.exists(filename + index.INDEX_SUFFIX)
+		loaded = index.RecordIndex.for_file(filename) # Comes from the sidecar this time.
+		for idx in (built, loaded):
+			assert len(idx) == 3
+			assert idx[2] == (96, emf.RecordType.EMR_EOF, 20)
+			assert list(idx.of_type("EMR_SAVEDC")) == [1]
+			assert idx.record(data, idx.nth_of_type(emf.RecordType.EMR_EOF, 0)).offset == 96
+		os.remove(filename + index.INDEX_SUFFIX)
+		os.mkdir(filename + index.INDEX_SUFFIX) # Now the sidecar can not be written, the index is returned anyway.
+		assert len(index.RecordIndex.for_file(filename)) == 3
+		assert sorted(os.listdir(directory)) == ["test.emf", "test.emf.idx"] # No temporary file is left behind.
+		empty = os.path.join(directory, "empty.emf")
+		open(empty, "wb").close()
+		assert len(index.RecordIndex.for_file(empty)) == 0
+	good("test_record_index passed!")
+	return
+
+def test_parse_files():
+	import batch
+	data = make_test_metafile()
+	with tempfile.TemporaryDirectory() as directory:
+		filenames = []
+		for i in range(5):
+			filenames.append(os.path.join(directory, str(i)+".emf"))
+			with open(filenames[-1], "wb") as f:
+				f.write(data if i != 3 else data[:10]) # File 3 is broken.
+		filenames.append(os.path.join(directory, "short.emf"))
+		with open(filenames[-1], "wb") as f:
+			f.write(data[:88] + struct.pack("<II", 0x23, 8) + data[88:]) # The Type/Size chain is fine, but this EMR_SETWORLDTRANSFORM is too short.
+		summaries = list(batch.parse_files(filenames, workers=2, chunksize=2))
+	assert [summary["filename"] for summary in summaries] == filenames # Results come back in order.
+	assert [summary["error"] is None for summary in summaries] == [True, True, True, False, True, False]
+	assert summaries[0]["records"] == 3 and summaries[0]["bytes"] == len(data)
+	with tempfile.TemporaryDirectory() as directory:
+		filename = os.path.join(directory, "big.emf")
+		with open(filename, "wb") as f:
+			f.write(data[:88] + data[88:96] * 1000 + data[96:]) # 1000 EMR_SAVEDC records.
+		values = list(batch.parse_file(filename, workers=2, chunk_bytes=1000))
+		assert os.listdir(directory) == ["big.emf"] # No sidecar unless asked for.
+	assert len(values) == 1002
+	assert [value[0] for value in values[:3]] == [1, 33, 33] and values[-1][0] == 14
+	good("test_parse_files passed!")
+	return
+
+def test_point_arrays():
+	import emf
+	from record import numpy # None if numpy is not installed.
+	if numpy is None:
+		good("test_point_arrays skipped, numpy is not installed.")
+		return
+	data = struct.pack("<II16sII", 0x5B, 52, bytes(16), 2, 3) + struct.pack("<2I6h", 2, 1, 1, 2, 3, 4, -5, 6) # EMR_POLYPOLYGON16
+	record = emf.EMR_POLYPOLYGON16(data, lazy=True)
+	assert record.PolygonPointCount.tolist() == [2, 1]
+	assert record.aPoints.dtype == numpy.int16
+	assert record.aPoints.tolist() == [[1, 2], [3, 4], [-5, 6]]
+	good("test_point_arrays passed!")
+	return
+
+def test_objects():
+	import emf
+	data = struct.pack("<II6f", 0x23, 32, 1.5, 0.0, 0.0, 2.0, -3.0, 4.0) # EMR_SETWORLDTRANSFORM
+	xform = emf.EMR_SETWORLDTRANSFORM(data).decode_object("Xform")
+	assert tuple(xform) == (1.5, 0.0, 0.0, 2.0, -3.0, 4.0)
+	header = next(emf.iter_records(make_test_metafile()))
+	assert header.decode_object("Bounds") == emf.RectL(bytes(16))
+	assert tuple(emf.RectL(struct.pack("<4i", -1, 2, 3, 4))) == (-1, 2, 3, 4)
+	data = struct.pack("<IIiiIff", 0x29, 28, -5, 7, 10, 45.0, -90.5) # EMR_ANGLEARC, the angles are floats.
+	record = emf.EMR_ANGLEARC(data)
+	assert (record.StartAngle, record.SweepAngle) == (45.0, -90.5)
+	assert record.serialize() == data
+	data = data[:20] + bytes.fromhex("0100807f") + data[24:] # A signaling NaN StartAngle keeps its bits.
+	record = emf.EMR_ANGLEARC(data, lazy=True)
+	assert record.StartAngle != record.StartAngle
+	assert record.serialize() == data and emf.serialize_records([record]) == data
+	good("test_objects passed!")
+	return
+
+def make_comment(identifier, payload): # An EMR_COMMENT record with the given CommentIdentifier.
+	data = struct.pack("<I", identifier) + payload
+	padding = (-len(data)) % 4
+	return struct.pack("<III", 0x46, 12 + len(data) + padding, len(data)) + data + bytes(padding)
+
+def make_emfplus_comment(payload): # An EMR_COMMENT_EMFPLUS record containing the EMF+ records in payload.
+	return make_comment(0x2B464D45, payload)
+
+def test_emfplus():
+	import emf
+	import emfplus
+	header = struct.pack("<HHIIIIII", 0x4001, 0, 28, 16, 0xDBC01002, 1, 96, 96)
+	# Object 5 (a path, type 2) split over two comments. The first piece starts with TotalObjectSize.
+	piece1 = struct.pack("<HHIII", 0x4008, 0x8000 | 0x0200 | 5, 24, 12, 12) + b"abcdefgh"
+	piece2 = struct.pack("<HHII", 0x4008, 0x0200 | 5, 16, 4) + b"ijkl"
+	eof = struct.pack("<HHII", 0x4002, 0, 12, 0)
+	data = make_test_metafile()
+	data = data[:88] + make_emfplus_comment(header + piece1) + make_emfplus_comment(piece2 + eof) + data[88:]
+	records = list(emfplus.iter_emfplus_records(emf.iter_records(data)))
+	assert [record.name for record in records] == ["EmfPlusHeader", "EmfPlusObject", "EmfPlusObject", "EmfPlusRecord"]
+	assert records[0].LogicalDpiX == 96
+	objects = list(emfplus.iter_objects(records))
+	assert len(objects) == 1 and objects[0][:2] == (5, 2)
+	assert [bytes(piece) for piece in objects[0][2]] == [b"abcdefgh", b"ijkl"]
+	good("test_emfplus passed!")
+	return
+
+def test_public_comments():
+	import emf
+	import comments
+	import mutator
+	import table
+	description = "group\0".encode("utf-16-le")
+	begin = make_comment(0x43494447, struct.pack("<I4iI", 2, 0, 0, 10, 10, 6) + description)
+	end = make_comment(0x43494447, struct.pack("<I", 3))
+	eps = b"%!PS-Adobe-3.0 EPSF-3.0"
+	# offData counts from the CommentIdentifier: identifier, PublicCommentIdentifier, OutputRect, CountFormats and one EmrFormat come first.
+	multi = make_comment(0x43494447, struct.pack("<I4iI", 0x40000004, 0, 0, 10, 10, 1) + struct.pack("<IIII", 0x46535045, 1, len(eps), 44) + eps)
+	wmf = b"\x01\x00\x09\x00" * 4
+	windows = make_comment(0x43494447, struct.pack("<IHHIII", 0x80000001, 0x300, 0, 0, 0, len(wmf)) + wmf)
+	private = make_comment(0x12345678, b"private!")
+	data = make_test_metafile()
+	data = data[:88] + begin + multi + windows + end + private + data[88:]
+	records = list(emf.iter_records(data))
+	assert [record.name for record in records[1:6]] == ["EMR_COMMENT_BEGINGROUP", "EMR_COMMENT_MULTIFORMATS", "EMR_COMMENT_WINDOWS_METAFILE", "EMR_COMMENT_ENDGROUP", "EMR_COMMENT"]
+	assert list(comments.iter_groups(records)) == [(0, records[1], "group")]
+	(entry, image), = comments.format_entries(records[2])
+	assert entry.Signature == 0x46535045 and bytes(image) == eps
+	assert bytes(comments.windows_metafile(records[3])) == wmf
+	count_formats = records[2].offset + mutator.field_offset(emf.EMR_COMMENT_MULTIFORMATS, "CountFormats")
+	assert count_formats in [target[0] for target in mutator.Mutator(data).targets] # Comment fields are mutation targets.
+	if table.numpy is not None:
+		assert table.RecordTable(data).records("EMR_COMMENT_MULTIFORMATS")["CountFormats"].tolist() == [1]
+	good("test_public_comments passed!")
+	return
+
 def run_tests():
 	test_overrun_stuff()
+	test_iter_records()
+	test_truncated_record()
+	test_emf_reader()
+	test_record_table()
+	test_mutator()
+	test_loader_cache()
+	test_record_index()
+	test_parse_files()
+	test_point_arrays()
+	test_objects()
+	test_emfplus()
+	test_public_comments()
 	return
 
 if __name__=="__main__":